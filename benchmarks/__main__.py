@@ -0,0 +1,31 @@
+from . import (
+    innertube_decoding,
+    json_formatting,
+    lazy_fetch,
+    raw_data_export,
+    response_decoding,
+    subtitle_formatting,
+    table_export,
+    tag_stripping,
+    text_cleaning,
+    time_ranges,
+    transcript_memory,
+    transcript_parsing,
+)
+
+for benchmark in (
+    response_decoding,
+    innertube_decoding,
+    transcript_parsing,
+    text_cleaning,
+    tag_stripping,
+    transcript_memory,
+    raw_data_export,
+    lazy_fetch,
+    time_ranges,
+    subtitle_formatting,
+    json_formatting,
+    table_export,
+):
+    print(f"\n# {benchmark.__name__}")
+    benchmark.run()
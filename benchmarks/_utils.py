@@ -0,0 +1,20 @@
+import timeit
+from pathlib import Path
+from typing import Callable
+
+ASSETS_DIR = Path(__file__).parent.parent / "youtube_transcript_api" / "test" / "assets"
+
+
+def load_asset(filename: str) -> bytes:
+    return (ASSETS_DIR / filename).read_bytes()
+
+
+def bench(label: str, func: Callable[[], object], number: int = 10) -> float:
+    """
+    Runs `func` `number` times in a few rounds and prints the best time per call.
+
+    :return: the best time per call in seconds
+    """
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{label:<60} {seconds * 1000:>10.3f} ms")
+    return seconds
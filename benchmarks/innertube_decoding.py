@@ -0,0 +1,31 @@
+"""
+Compares the innertube decoders on the static innertube responses.
+"""
+
+from youtube_transcript_api.decoders import (
+    JSONInnertubeDecoder,
+    OrjsonInnertubeDecoder,
+    PartialInnertubeDecoder,
+)
+
+from ._utils import bench, load_asset
+
+
+def run() -> None:
+    decoders = [
+        JSONInnertubeDecoder(),
+        OrjsonInnertubeDecoder(),
+        PartialInnertubeDecoder(fallback=JSONInnertubeDecoder()),
+    ]
+    for asset in (
+        "youtube.innertube.json.static",
+        "youtube_transcripts_disabled.innertube.json.static",
+    ):
+        raw_data = load_asset(asset)
+        print(f"{asset} ({len(raw_data) / 1024:.0f} KiB)")
+        for decoder in decoders:
+            bench(f"  {type(decoder).__name__}", lambda: decoder.decode(raw_data), 50)
+
+
+if __name__ == "__main__":
+    run()
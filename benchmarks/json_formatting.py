@@ -0,0 +1,56 @@
+"""
+Compares formatting transcripts as JSON by calling `json.dumps` on their raw data,
+which `JSONFormatter` used to do, with the `JSONTranscriptEncoder`, which produces
+the same output, for a long transcript and for many short ones.
+"""
+
+import json
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.formatters import JSONFormatter
+
+from ._utils import bench
+
+
+def _create_transcript(count: int) -> FetchedTranscript:
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=f"this is line number {i} of a transcript, with ünïcödé",
+                start=i * 2.37,
+                duration=1.9,
+            )
+            for i in range(count)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+
+
+def run() -> None:
+    json_formatter = JSONFormatter()
+    for label, transcripts in (
+        ("1 transcript of 50k snippets", [_create_transcript(50_000)]),
+        ("1000 transcripts of 50 snippets", [_create_transcript(50)] * 1000),
+    ):
+        raw_data = [transcript.to_raw_data() for transcript in transcripts]
+        assert json_formatter.format_transcripts(transcripts) == json.dumps(raw_data)
+        print(label)
+        bench(
+            "  json.dumps of raw data",
+            lambda: json.dumps(
+                [transcript.to_raw_data() for transcript in transcripts]
+            ),
+            3,
+        )
+        bench(
+            "  JSONTranscriptEncoder",
+            lambda: json_formatter.format_transcripts(transcripts),
+            3,
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,41 @@
+"""
+Compares building a fetched transcript from a long XML response, as `Transcript.fetch`
+does, with building it lazily, as `Transcript.fetch(lazy=True)` does, as well as the
+cost of accessing the snippets of a lazy transcript for the first time.
+"""
+
+from youtube_transcript_api import FetchedTranscript
+from youtube_transcript_api._transcripts import _LazySnippetColumns, _TranscriptParser
+
+from ._utils import bench
+from .transcript_parsing import _build_xml, _generate_snippets
+
+
+def _build_transcript(snippets) -> FetchedTranscript:
+    return FetchedTranscript(snippets, "video_id", "English", "en", True)
+
+
+def run() -> None:
+    count = 50_000
+    xml = _build_xml(_generate_snippets(count))
+    print(f"{count} snippets ({len(xml) / 1024:.0f} KiB)")
+
+    bench(
+        "  fetch",
+        lambda: _build_transcript(_TranscriptParser().parse(xml)),
+        5,
+    )
+    bench(
+        "  fetch(lazy=True)",
+        lambda: _build_transcript(_LazySnippetColumns(xml, _TranscriptParser())),
+        5,
+    )
+    bench(
+        "  fetch(lazy=True) and access the first snippet",
+        lambda: _build_transcript(_LazySnippetColumns(xml, _TranscriptParser()))[0],
+        5,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,57 @@
+"""
+Compares exporting 100k snippets to raw data using `dataclasses.asdict` for each
+snippet, which `FetchedTranscript.to_raw_data` used to do, with the current
+`to_raw_data`, as well as rebuilding a transcript from raw data snippet by snippet and
+using `FetchedTranscript.from_raw_data`.
+"""
+
+from dataclasses import asdict
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+
+from ._utils import bench
+
+
+def run() -> None:
+    count = 100_000
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=f"this is line number {i} of a long transcript",
+                start=i * 2.0,
+                duration=1.9,
+            )
+            for i in range(count)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+    raw_data = transcript.to_raw_data()
+    print(f"{count} snippets")
+
+    bench("  asdict for each snippet", lambda: [asdict(s) for s in transcript], 3)
+    bench("  to_raw_data", transcript.to_raw_data, 3)
+    bench(
+        "  FetchedTranscript of snippets created from raw data",
+        lambda: FetchedTranscript(
+            [FetchedTranscriptSnippet(**snippet) for snippet in raw_data],
+            "video_id",
+            "English",
+            "en",
+            True,
+        ),
+        3,
+    )
+    bench(
+        "  from_raw_data",
+        lambda: FetchedTranscript.from_raw_data(
+            raw_data, "video_id", "English", "en", True
+        ),
+        3,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,38 @@
+"""
+Compares decoding the watch page through `Response.text`, which runs charset
+detection if the server doesn't declare a charset, with decoding
+`Response.content` using the UTF-8 codec directly.
+"""
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from ._utils import bench, load_asset
+
+
+def _build_response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict()
+    response._content = content
+    return response
+
+
+def run() -> None:
+    html = load_asset("youtube.html.static")
+    print(f"youtube.html.static ({len(html) / 1024:.0f} KiB), no declared charset")
+
+    bench(
+        "Response.text (charset detection)",
+        lambda: _build_response(html).text,
+        number=3,
+    )
+    bench(
+        "Response.content.decode('utf-8')",
+        lambda: _build_response(html).content.decode("utf-8"),
+        number=3,
+    )
+
+
+if __name__ == "__main__":
+    run()
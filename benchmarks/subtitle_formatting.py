@@ -0,0 +1,87 @@
+"""
+Compares the SRT and WebVTT formatting, which was used before, calling
+`_seconds_to_timestamp` with `divmod`, `round` and `str.format` twice for each cue,
+with the current formatters, printing the cost per cue.
+"""
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.formatters import SRTFormatter, WebVTTFormatter
+
+from ._utils import bench
+
+
+def _legacy_seconds_to_timestamp(time: float, separator: str) -> str:
+    time = float(time)
+    hours_float, remainder = divmod(time, 3600)
+    mins_float, secs_float = divmod(remainder, 60)
+    hours, mins, secs = int(hours_float), int(mins_float), int(secs_float)
+    ms = int(round((time - int(time)) * 1000, 2))
+    return "{:02d}:{:02d}:{:02d}{}{:03d}".format(hours, mins, secs, separator, ms)
+
+
+def _legacy_format_transcript(transcript: FetchedTranscript, srt: bool) -> str:
+    separator = "," if srt else "."
+    lines = []
+    for i, line in enumerate(transcript):
+        end = line.start + line.duration
+        time_text = "{} --> {}".format(
+            _legacy_seconds_to_timestamp(line.start, separator),
+            _legacy_seconds_to_timestamp(
+                transcript[i + 1].start
+                if i < len(transcript) - 1 and transcript[i + 1].start < end
+                else end,
+                separator,
+            ),
+        )
+        if srt:
+            lines.append("{}\n{}\n{}".format(i + 1, time_text, line.text))
+        else:
+            lines.append("{}\n{}".format(time_text, line.text))
+    if srt:
+        return "\n\n".join(lines) + "\n"
+    return "WEBVTT\n\n" + "\n\n".join(lines) + "\n"
+
+
+def run() -> None:
+    count = 50_000
+    transcript = FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=f"this is line number {i} of a long transcript",
+                start=i * 2.37,
+                duration=3.1 if i % 2 else 1.9,
+            )
+            for i in range(count)
+        ],
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+    print(f"{count} cues, cost per cue")
+
+    for label, formatter, srt in (
+        ("srt", SRTFormatter(), True),
+        ("webvtt", WebVTTFormatter(), False),
+    ):
+        assert _legacy_format_transcript(transcript, srt) == (
+            formatter.format_transcript(transcript)
+        )
+        legacy_seconds = bench(
+            f"  {label}, before",
+            lambda: _legacy_format_transcript(transcript, srt),
+            1,
+        )
+        seconds = bench(
+            f"  {label}",
+            lambda: formatter.format_transcript(transcript),
+            1,
+        )
+        print(
+            f"  {label} per cue: {legacy_seconds / count * 1e6:.2f} us before,"
+            f" {seconds / count * 1e6:.2f} us now"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,93 @@
+"""
+Compares exporting transcripts as a table by converting their raw data row by row,
+which had to be done before the table formatters existed, with the `ParquetFormatter`,
+the `ArrowFormatter` and the `MsgpackFormatter`, which build the columns of all
+transcripts at once.
+"""
+
+import io
+
+import msgpack
+import pyarrow.parquet
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api.formatters import (
+    ArrowFormatter,
+    MsgpackFormatter,
+    ParquetFormatter,
+)
+
+from ._utils import bench
+
+
+def _create_transcript(video_id: str, count: int) -> FetchedTranscript:
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(
+                text=f"this is line number {i} of a transcript",
+                start=i * 2.37,
+                duration=1.9,
+            )
+            for i in range(count)
+        ],
+        video_id=video_id,
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+
+
+def _rows(transcripts):
+    return [
+        {
+            "video_id": transcript.video_id,
+            "language_code": transcript.language_code,
+            "is_generated": transcript.is_generated,
+            **snippet,
+        }
+        for transcript in transcripts
+        for snippet in transcript.to_raw_data()
+    ]
+
+
+def _parquet_from_rows(transcripts) -> bytes:
+    sink = io.BytesIO()
+    pyarrow.parquet.write_table(pyarrow.Table.from_pylist(_rows(transcripts)), sink)
+    return sink.getvalue()
+
+
+def run() -> None:
+    parquet_formatter = ParquetFormatter()
+    arrow_formatter = ArrowFormatter()
+    msgpack_formatter = MsgpackFormatter()
+    transcripts = [_create_transcript(f"video{i}", 500) for i in range(200)]
+    assert pyarrow.parquet.read_table(
+        io.BytesIO(parquet_formatter.format_transcripts(transcripts))
+    ).to_pylist() == _rows(transcripts)
+
+    print("200 transcripts of 500 snippets")
+    bench("  parquet from rows of raw data", lambda: _parquet_from_rows(transcripts), 3)
+    bench(
+        "  ParquetFormatter",
+        lambda: parquet_formatter.format_transcripts(transcripts),
+        3,
+    )
+    bench(
+        "  ArrowFormatter",
+        lambda: arrow_formatter.format_transcripts(transcripts),
+        3,
+    )
+    bench(
+        "  msgpack of rows of raw data",
+        lambda: msgpack.packb(_rows(transcripts)),
+        3,
+    )
+    bench(
+        "  MsgpackFormatter",
+        lambda: msgpack_formatter.format_transcripts(transcripts),
+        3,
+    )
+
+
+if __name__ == "__main__":
+    run()
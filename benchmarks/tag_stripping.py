@@ -0,0 +1,49 @@
+"""
+Compares removing HTML tags using the regexes, which were used before, with the
+`_HTMLTagStripper`, on regular transcript lines and on lines full of stray `<`. If
+formatting isn't preserved, the `_HTMLTagStripper` uses the same regex, so it should
+take the same time.
+"""
+
+import re
+
+from youtube_transcript_api._transcripts import _HTMLTagStripper, _TranscriptParser
+
+from ._utils import bench
+
+_HTML_REGEXES = {
+    False: re.compile(r"<[^>]*>", re.IGNORECASE),
+    True: re.compile(
+        r"<\/?(?!\/?(" + "|".join(_TranscriptParser._FORMATTING_TAGS) + r")\b).*?\b>",
+        re.IGNORECASE,
+    ),
+}
+
+
+def run() -> None:
+    documents = {
+        "50k lines with tags": "\x00".join(
+            f"line {i} is <i>partly</i> <font color='red'>formatted</font>"
+            for i in range(50_000)
+        ),
+        "50k lines, every tenth with a tag": "\x00".join(
+            f"line {i} is <i>formatted</i>" if i % 10 == 0 else f"line {i} is plain"
+            for i in range(50_000)
+        ),
+        "5k stray '<'": "< b" * 5_000,
+    }
+    for label, document in documents.items():
+        print(f"{label} ({len(document) / 1024:.0f} KiB)")
+        for preserve_formatting in (False, True):
+            html_regex = _HTML_REGEXES[preserve_formatting]
+            stripper = _HTMLTagStripper(
+                _TranscriptParser._FORMATTING_TAGS if preserve_formatting else ()
+            )
+            assert stripper.strip(document) == html_regex.sub("", document)
+            suffix = ", preserving formatting" if preserve_formatting else ""
+            bench(f"  regex{suffix}", lambda: html_regex.sub("", document), 1)
+            bench(f"  _HTMLTagStripper{suffix}", lambda: stripper.strip(document), 1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,45 @@
+"""
+Compares cleaning the texts of a transcript one by one, like each snippet used to be
+cleaned, with cleaning all of them in a single pass, on generated transcripts with
+50k snippets.
+"""
+
+import re
+from html import unescape
+from typing import List
+
+from youtube_transcript_api._transcripts import _TranscriptParser
+
+from ._utils import bench
+from .tag_stripping import _HTML_REGEXES
+
+
+def _generate_texts(count: int, markup: bool) -> List[str]:
+    if not markup:
+        return [f"this is line number {i} without any markup" for i in range(count)]
+    return [
+        f"it&#39;s line number {i}, which is <i>partly</i> formatted &amp; escaped"
+        if i % 3 == 0
+        else f"this is line number {i} without any markup"
+        for i in range(count)
+    ]
+
+
+def run() -> None:
+    count = 50_000
+    for markup in (False, True):
+        texts = _generate_texts(count, markup)
+        print(f"{count} snippets, {'some' if markup else 'no'} tags and entities")
+        for preserve_formatting in (False, True):
+            parser = _TranscriptParser(preserve_formatting)
+            html_regex = _HTML_REGEXES[preserve_formatting]
+            suffix = ", preserving formatting" if preserve_formatting else ""
+            bench(
+                f"  each text{suffix}",
+                lambda: [re.sub(html_regex, "", unescape(text)) for text in texts],
+            )
+            bench(f"  single pass{suffix}", lambda: parser._clean_texts(texts))
+
+
+if __name__ == "__main__":
+    run()
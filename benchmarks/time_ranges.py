@@ -0,0 +1,55 @@
+"""
+Compares parsing a whole long transcript with parsing only the snippets of a minute
+near its start, as `Transcript.fetch(start=..., end=...)` does, as well as finding
+the snippets of a time range and the snippet shown at a given time by scanning all
+snippets and using binary search, as `FetchedTranscript.slice` and
+`FetchedTranscript.snippet_at` do, both on the columns of a fetched transcript and on
+its list of snippets.
+"""
+
+from youtube_transcript_api import FetchedTranscript
+from youtube_transcript_api._transcripts import _TranscriptParser
+
+from ._utils import bench
+from .transcript_parsing import _build_xml, _generate_snippets
+
+
+def run() -> None:
+    count = 50_000
+    xml = _build_xml(_generate_snippets(count))
+    transcript = FetchedTranscript(
+        _TranscriptParser().parse(xml), "video_id", "English", "en", True
+    )
+    start, end = 600.0, 660.0
+    assert _TranscriptParser(start=start, end=end).parse(xml) == (
+        transcript.slice(start, end).snippets
+    )
+    print(f"{count} snippets ({len(xml) / 1024:.0f} KiB), a minute after 10 minutes")
+
+    bench("  parse", lambda: _TranscriptParser().parse(xml), 5)
+    bench(
+        "  parse(start, end)",
+        lambda: _TranscriptParser(start=start, end=end).parse(xml),
+        5,
+    )
+    time = count * 2.0 - 1.0
+    bench(
+        "  linear scan for the snippets of the minute",
+        lambda: [s for s in transcript if start <= s.start < end],
+        5,
+    )
+    bench("  slice", lambda: transcript.slice(start, end), 1000)
+    bench(
+        "  linear scan for the snippet shown near the end",
+        lambda: [s for s in transcript if s.start <= time < s.start + s.duration][-1],
+        5,
+    )
+    bench("  snippet_at", lambda: transcript.snippet_at(time), 1000)
+    # once the snippets have been accessed as a list, they are searched in place
+    transcript.snippets
+    bench("  slice of snippet list", lambda: transcript.slice(start, end), 1000)
+    bench("  snippet_at of snippet list", lambda: transcript.snippet_at(time), 1000)
+
+
+if __name__ == "__main__":
+    run()
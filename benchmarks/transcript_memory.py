@@ -0,0 +1,85 @@
+"""
+Compares the memory taken by a list of `FetchedTranscriptSnippet` objects with the
+memory taken by a `FetchedTranscript` holding the same snippets in columns, as well as
+the time it takes to iterate over them. Iterating and indexing a `FetchedTranscript`
+creates the snippets on the fly, while accessing its `snippets` turns the columns into
+a list of snippets, which later iterations reuse.
+"""
+
+import tracemalloc
+from typing import Callable, List
+
+from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+from youtube_transcript_api._transcripts import _SnippetColumns
+
+from ._utils import bench
+
+
+def _generate_snippets(count: int) -> List[FetchedTranscriptSnippet]:
+    return [
+        FetchedTranscriptSnippet(
+            text=f"this is line number {i} of a long auto-generated transcript",
+            start=i * 2.0,
+            duration=1.9,
+        )
+        for i in range(count)
+    ]
+
+
+def _measure_memory(create: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        created = create()
+        size = tracemalloc.get_traced_memory()[0]
+        del created
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def _create_transcript(count: int) -> FetchedTranscript:
+    return FetchedTranscript(
+        snippets=_SnippetColumns.from_snippets(_generate_snippets(count)),
+        video_id="video_id",
+        language="English",
+        language_code="en",
+        is_generated=True,
+    )
+
+
+def _create_indexed_transcript(count: int) -> FetchedTranscript:
+    transcript = _create_transcript(count)
+    transcript[0]
+    for _ in transcript:
+        pass
+    return transcript
+
+
+def run() -> None:
+    count = 100_000
+    print(f"{count} snippets")
+    for label, create in (
+        ("list of snippets", lambda: _generate_snippets(count)),
+        ("FetchedTranscript", lambda: _create_transcript(count)),
+        (
+            "FetchedTranscript after indexing and iterating it",
+            lambda: _create_indexed_transcript(count),
+        ),
+    ):
+        size = _measure_memory(create)
+        print(f"  {label:<58} {size / count:>10.1f} B/snippet")
+
+    snippets = _generate_snippets(count)
+    transcript = _create_transcript(count)
+    bench("  iterate list of snippets", lambda: [s.text for s in snippets], 5)
+    bench("  iterate FetchedTranscript", lambda: [s.text for s in transcript], 5)
+    transcript.snippets
+    bench(
+        "  iterate FetchedTranscript once its snippets are a list",
+        lambda: [s.text for s in transcript],
+        5,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,79 @@
+"""
+Compares parsing long transcripts in the XML format with parsing them in the json3
+format, with and without preserving formatting.
+"""
+
+import json
+from typing import List, Tuple
+
+from youtube_transcript_api._transcripts import (
+    _JSON3TranscriptParser,
+    _TranscriptParser,
+)
+
+from ._utils import bench
+
+
+def _generate_snippets(count: int) -> List[Tuple[int, int, str]]:
+    return [
+        (i * 2000, 1900, f"this is <i>line</i> number {i} & it's a bit longer")
+        for i in range(count)
+    ]
+
+
+def _build_xml(snippets: List[Tuple[int, int, str]]) -> bytes:
+    elements = "".join(
+        f'<text start="{start / 1000}" dur="{duration / 1000}">'
+        f"{text.replace('&', '&amp;amp;').replace('<', '&amp;lt;')}</text>"
+        for start, duration, text in snippets
+    )
+    return f'<?xml version="1.0" encoding="utf-8" ?><transcript>{elements}</transcript>'.encode()
+
+
+def _build_json3(snippets: List[Tuple[int, int, str]]) -> bytes:
+    events = []
+    for start, duration, text in snippets:
+        before, rest = text.split("<i>")
+        italic, after = rest.split("</i>")
+        events.append(
+            {
+                "tStartMs": start,
+                "dDurationMs": duration,
+                "segs": [
+                    {"utf8": before},
+                    {"utf8": italic, "pPenId": 1},
+                    {"utf8": after},
+                ],
+            }
+        )
+    return json.dumps({"pens": [{}, {"iAttr": 1}], "events": events}).encode()
+
+
+def run() -> None:
+    for count in (1_000, 50_000):
+        snippets = _generate_snippets(count)
+        xml, json3 = _build_xml(snippets), _build_json3(snippets)
+        assert _TranscriptParser(True).parse(xml) == _JSON3TranscriptParser(True).parse(
+            json3
+        )
+        print(
+            f"{count} snippets (xml: {len(xml) / 1024:.0f} KiB,"
+            f" json3: {len(json3) / 1024:.0f} KiB)"
+        )
+        number = 5 if count > 10_000 else 50
+        for preserve_formatting in (False, True):
+            suffix = ", preserving formatting" if preserve_formatting else ""
+            bench(
+                f"  xml{suffix}",
+                lambda: _TranscriptParser(preserve_formatting).parse(xml),
+                number,
+            )
+            bench(
+                f"  json3{suffix}",
+                lambda: _JSON3TranscriptParser(preserve_formatting).parse(json3),
+                number,
+            )
+
+
+if __name__ == "__main__":
+    run()
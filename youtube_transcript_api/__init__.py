@@ -27,3 +27,10 @@ from ._errors import (
     YouTubeDataUnparsable,
     PoTokenRequired,
 )
+
+try:
+    from ._async_api import AsyncYouTubeTranscriptApi
+    from ._async_transcripts import AsyncTranscript
+except ImportError:  # pragma: no cover
+    # httpx is an optional dependency, which is only required for the asyncio API
+    pass
@@ -8,7 +8,7 @@ from ._cli import YouTubeTranscriptCli
 def main():
     logging.basicConfig()
 
-    print(YouTubeTranscriptCli(sys.argv[1:]).run())
+    YouTubeTranscriptCli(sys.argv[1:]).write(sys.stdout, sys.stderr)
 
 
 if __name__ == "__main__":
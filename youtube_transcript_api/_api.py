@@ -1,12 +1,38 @@
-from typing import Optional, Iterable
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
+from .caching import TranscriptCache, TranscriptListStore
+from .decoders import InnertubeDecoder, default_innertube_decoder
 from .proxies import ProxyConfig
+from .session_state import SessionStateStore
 
-from ._transcripts import TranscriptListFetcher, FetchedTranscript, TranscriptList
+from ._errors import CouldNotRetrieveTranscript
+from ._sessions import _ThreadLocalSession
+from ._transcripts import (
+    TranscriptListFetcher,
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    TranscriptList,
+    _CacheInfo,
+)
+
+_T = TypeVar("_T")
 
 
 class YouTubeTranscriptApi:
@@ -14,11 +40,28 @@ class YouTubeTranscriptApi:
         self,
         proxy_config: Optional[ProxyConfig] = None,
         http_client: Optional[Session] = None,
+        http_client_factory: Optional[Callable[[], Session]] = None,
+        innertube_api_key_ttl: float = 60 * 60,
+        innertube_decoder: Optional[InnertubeDecoder] = None,
+        transcript_cache: Optional[TranscriptCache] = None,
+        transcript_list_cache_size: int = 0,
+        transcript_list_cache_ttl: float = 60,
+        failure_cache_size: int = 0,
+        failure_cache_ttls: Optional[
+            Dict[Type[CouldNotRetrieveTranscript], float]
+        ] = None,
+        session_state_store: Optional[SessionStateStore] = None,
+        transcript_list_store: Optional[TranscriptListStore] = None,
+        transcript_format: str = "xml",
     ):
         """
-        Note on thread-safety: As this class will initialize a `requests.Session`
-        object, it is not thread-safe. Make sure to initialize an instance of
-        `YouTubeTranscriptApi` per thread, if used in a multi-threading scenario!
+        Note on thread-safety: An instance of `YouTubeTranscriptApi` can be shared by
+        any number of threads. As `requests.Session` objects are not thread-safe, each
+        thread will do its requests using its own session, which is created the first
+        time it uses this instance. Cookies set by this module (like the cookie used to
+        give consent to YouTube's cookie policy) are shared by all of these sessions.
+        This does not apply if you pass in an `http_client`, as that session will be
+        used by all threads.
 
         :param proxy_config: an optional ProxyConfig object, defining proxies used for
             all network requests. This can be used to work around your IP being blocked
@@ -28,8 +71,97 @@ class YouTubeTranscriptApi:
         :param http_client: You can optionally pass in a requests.Session object, if you
             manually want to share cookies between different instances of
             `YouTubeTranscriptApi`, overwrite defaults, specify SSL certificates, etc.
+            Be aware that this session will be shared by all threads using this
+            instance, so you should prefer passing in an `http_client_factory` if you
+            want to use this instance from multiple threads.
+        :param http_client_factory: an optional callable returning a new
+            requests.Session object, which is called once for each thread using this
+            instance. Use this instead of `http_client` if you want to overwrite the
+            defaults of the sessions used by multiple threads. Defaults to `Session`.
+        :param innertube_api_key_ttl: for how many seconds the API key, which is
+            extracted from the watch page of a video, is reused for subsequent videos.
+            As long as a key is cached, the watch page doesn't have to be downloaded.
+            If YouTube rejects the cached key, a new one is fetched automatically. Set
+            this to 0 to disable caching the key.
+        :param innertube_decoder: an optional InnertubeDecoder, which is used to decode
+            the responses of YouTube's innertube API. Defaults to decoding them using
+            orjson, if it is installed, and the standard library otherwise. If you only
+            want to decode the parts of the response which are actually needed, you
+            can pass in a `PartialInnertubeDecoder`.
+        :param transcript_cache: an optional TranscriptCache, like the
+            `SQLiteTranscriptCache`, which fetched transcripts are stored in. If a
+            transcript is found in the cache, it is returned without doing any network
+            requests.
+        :param transcript_list_cache_size: how many `TranscriptList` objects are kept
+            in memory, so that calling `list` (or `fetch`) for a video which has
+            recently been listed doesn't require any network requests. Once more lists
+            are cached, the least recently used one is evicted. This defaults to 0,
+            which disables caching lists.
+        :param transcript_list_cache_ttl: for how many seconds a `TranscriptList` is
+            cached. A list is evicted early, if fetching one of its transcripts fails.
+        :param failure_cache_size: for how many videos permanent failures are kept in
+            memory. As long as a failure is cached, retrieving the transcripts of that
+            video raises the same exception again, without doing any network requests.
+            Only `TranscriptsDisabled`, `VideoUnavailable`, `AgeRestricted`,
+            `InvalidVideoId` and `VideoUnplayable` are cached, while transient failures
+            like `RequestBlocked` and `IpBlocked` never are. This defaults to 0, which
+            disables caching failures.
+        :param failure_cache_ttls: a dict mapping the exception classes listed above
+            to the number of seconds they are cached for. Exceptions which are not in
+            this dict (or a subclass of a class in this dict) are not cached. Defaults
+            to caching `InvalidVideoId` for a day, `VideoUnavailable` and
+            `AgeRestricted` for six hours and `TranscriptsDisabled` and
+            `VideoUnplayable` for an hour.
+        :param session_state_store: an optional SessionStateStore, like the
+            `FileSessionStateStore`, which the cookies of the session established with
+            YouTube are saved to, once the first watch page has been retrieved. New
+            instances using the same store load these cookies, so they don't have to
+            give consent to YouTube's cookie policy again.
+        :param transcript_list_store: an optional TranscriptListStore, like the
+            `SQLiteTranscriptListStore`, which retrieved `TranscriptList` objects are
+            saved to. Until shortly before the URLs of its transcripts expire, a stored
+            list is reused, so that fetching a transcript of that video only requires
+            a single request.
+        :param transcript_format: the format transcripts are requested in. This can
+            either be "xml" or "json3". "json3" can be parsed faster than "xml", which
+            makes a difference for long transcripts, but support for it is
+            experimental. It hasn't been verified against real responses yet, that
+            both formats result in the same snippets, so for some transcripts the
+            snippets may differ. Defaults to "xml".
         """
-        http_client = Session() if http_client is None else http_client
+        self._transcript_cache = transcript_cache
+        if http_client is None:
+            session_factory = (
+                Session if http_client_factory is None else http_client_factory
+            )
+            http_client = _ThreadLocalSession(
+                lambda: self._configure_http_client(session_factory(), proxy_config)
+            )
+        else:
+            self._configure_http_client(http_client, proxy_config)
+        self._fetcher = TranscriptListFetcher(
+            http_client,
+            proxy_config=proxy_config,
+            innertube_api_key_ttl=innertube_api_key_ttl,
+            innertube_decoder=(
+                default_innertube_decoder()
+                if innertube_decoder is None
+                else innertube_decoder
+            ),
+            transcript_cache=transcript_cache,
+            transcript_list_cache_size=transcript_list_cache_size,
+            transcript_list_cache_ttl=transcript_list_cache_ttl,
+            failure_cache_size=failure_cache_size,
+            failure_cache_ttls=failure_cache_ttls,
+            session_state_store=session_state_store,
+            transcript_list_store=transcript_list_store,
+            transcript_format=transcript_format,
+        )
+
+    @staticmethod
+    def _configure_http_client(
+        http_client: Session, proxy_config: Optional[ProxyConfig]
+    ) -> Session:
         http_client.headers.update({"Accept-Language": "en-US"})
         # Cookie auth has been temporarily disabled, as it is not working properly with
         # YouTube's most recent changes.
@@ -46,7 +178,7 @@ class YouTubeTranscriptApi:
                 )
                 http_client.mount("http://", HTTPAdapter(max_retries=retry_config))
                 http_client.mount("https://", HTTPAdapter(max_retries=retry_config))
-        self._fetcher = TranscriptListFetcher(http_client, proxy_config=proxy_config)
+        return http_client
 
     def fetch(
         self,
@@ -67,10 +199,51 @@ class YouTubeTranscriptApi:
             it fails to do so. This defaults to ["en"].
         :param preserve_formatting: whether to keep select HTML text formatting
         """
+        if self._transcript_cache is None:
+            return (
+                self.list(video_id)
+                .find_transcript(languages)
+                .fetch(preserve_formatting=preserve_formatting)
+            )
+        # which transcript is picked depends on the requested languages, so this exact
+        # request is mapped to the key the picked transcript is cached under
+        languages = list(languages)
+        request_key = json.dumps(["fetch", video_id, languages, preserve_formatting])
+        cache_key = self._transcript_cache.get_alias(request_key)
+        if cache_key is not None:
+            fetched_transcript = self._transcript_cache.get(cache_key)
+            if fetched_transcript is not None:
+                return fetched_transcript
+        transcript = self.list(video_id).find_transcript(languages)
+        fetched_transcript = transcript.fetch(preserve_formatting=preserve_formatting)
+        self._transcript_cache.set_alias(
+            request_key, transcript._cache_key(preserve_formatting)
+        )
+        return fetched_transcript
+
+    def iter_fetch(
+        self,
+        video_id: str,
+        languages: Iterable[str] = ("en",),
+        preserve_formatting: bool = False,
+    ) -> Iterator[FetchedTranscriptSnippet]:
+        """
+        Retrieves the transcript for a single video, like `fetch`, but returns an
+        iterator yielding the snippets while the transcript is still being downloaded,
+        instead of holding the whole transcript in memory. This is just a shortcut for
+        calling:
+        `YouTubeTranscriptApi().list(video_id).find_transcript(languages).iter_fetch(preserve_formatting=preserve_formatting)`
+
+        :param video_id: the ID of the video you want to retrieve the transcript for.
+            Make sure that this is the actual ID, NOT the full URL to the video!
+        :param languages: A list of language codes in a descending priority. This
+            defaults to ["en"].
+        :param preserve_formatting: whether to keep select HTML text formatting
+        """
         return (
             self.list(video_id)
             .find_transcript(languages)
-            .fetch(preserve_formatting=preserve_formatting)
+            .iter_fetch(preserve_formatting=preserve_formatting)
         )
 
     def list(
@@ -125,3 +298,95 @@ class YouTubeTranscriptApi:
             Make sure that this is the actual ID, NOT the full URL to the video!
         """
         return self._fetcher.fetch(video_id)
+
+    def transcript_list_cache_info(self) -> _CacheInfo:
+        """
+        Returns the statistics of the cache configured using
+        `transcript_list_cache_size`, as a named tuple of `hits`, `misses`, `maxsize`
+        and `currsize`, just like `functools.lru_cache` does.
+        """
+        return self._fetcher.transcript_list_cache_info()
+
+    def fetch_many(
+        self,
+        video_ids: Iterable[str],
+        languages: Iterable[str] = ("en",),
+        preserve_formatting: bool = False,
+        max_workers: int = 8,
+    ) -> Iterator[Tuple[str, Union[FetchedTranscript, Exception]]]:
+        """
+        Retrieves the transcripts for many videos concurrently, using a pool of
+        `max_workers` threads. The results are yielded in the order in which they
+        complete, as tuples of the video ID and either the `FetchedTranscript` or the
+        exception raised while retrieving it, like a `CouldNotRetrieveTranscript` or
+        a connection error, so that a single failing video doesn't abort the whole
+        batch.
+
+        `video_ids` is consumed lazily and only `max_workers` videos are in flight at
+        any time, so it can be an arbitrarily large iterator. Example:
+
+        ```
+        ytt_api = YouTubeTranscriptApi()
+
+        for video_id, result in ytt_api.fetch_many(video_ids, languages=["de", "en"]):
+            if isinstance(result, Exception):
+                print(f"failed to fetch {video_id}: {result}")
+            else:
+                print(result.to_raw_data())
+        ```
+
+        :param video_ids: the IDs of the videos you want to retrieve the transcripts
+            for. Make sure that these are the actual IDs, NOT the full URLs!
+        :param languages: A list of language codes in a descending priority, which
+            works just like it does for `fetch`. This defaults to ["en"].
+        :param preserve_formatting: whether to keep select HTML text formatting
+        :param max_workers: the maximum number of videos retrieved concurrently
+        """
+        return _map_as_completed(
+            lambda video_id: self.fetch(video_id, languages, preserve_formatting),
+            video_ids,
+            max_workers,
+        )
+
+    def list_many(
+        self,
+        video_ids: Iterable[str],
+        max_workers: int = 8,
+    ) -> Iterator[Tuple[str, Union[TranscriptList, Exception]]]:
+        """
+        Retrieves the lists of transcripts for many videos concurrently. This works
+        just like `fetch_many`, but yields the `TranscriptList` of each video.
+
+        :param video_ids: the IDs of the videos you want to retrieve the transcript
+            lists for. Make sure that these are the actual IDs, NOT the full URLs!
+        :param max_workers: the maximum number of videos retrieved concurrently
+        """
+        return _map_as_completed(self.list, video_ids, max_workers)
+
+
+def _map_as_completed(
+    func: Callable[[str], _T],
+    video_ids: Iterable[str],
+    max_workers: int,
+) -> Iterator[Tuple[str, Union[_T, Exception]]]:
+    video_ids = iter(video_ids)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(func, video_id): video_id
+            for video_id in islice(video_ids, max_workers)
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    video_id = pending.pop(future)
+                    for next_video_id in islice(video_ids, 1):
+                        pending[executor.submit(func, next_video_id)] = next_video_id
+                    try:
+                        result = future.result()
+                    except Exception as exception:
+                        result = exception
+                    yield video_id, result
+        finally:
+            for future in pending:
+                future.cancel()
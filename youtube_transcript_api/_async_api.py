@@ -0,0 +1,185 @@
+from typing import AsyncIterator, Dict, Optional, Iterable
+
+import httpx
+
+from .decoders import InnertubeDecoder, default_innertube_decoder
+from .proxies import ProxyConfig
+
+from ._async_transcripts import AsyncTranscriptListFetcher
+from ._transcripts import FetchedTranscript, FetchedTranscriptSnippet, TranscriptList
+
+
+class _RetryWhenBlockedTransport(httpx.AsyncBaseTransport):
+    """
+    Retries requests YouTube responds to with a 429. This is the counterpart of the
+    urllib3 `Retry`, which is mounted on the `requests.Session` used by
+    `YouTubeTranscriptApi`.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, retries: int):
+        self._transport = transport
+        self._retries = retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for _ in range(self._retries):
+            response = await self._transport.handle_async_request(request)
+            if response.status_code != 429:
+                return response
+            await response.aclose()
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class AsyncYouTubeTranscriptApi:
+    def __init__(
+        self,
+        proxy_config: Optional[ProxyConfig] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        innertube_api_key_ttl: float = 60 * 60,
+        innertube_decoder: Optional[InnertubeDecoder] = None,
+        transcript_format: str = "xml",
+    ):
+        """
+        The asyncio counterpart of `YouTubeTranscriptApi`, which is built on an
+        `httpx.AsyncClient`. This requires httpx to be installed, which you can do by
+        running `pip install "youtube-transcript-api[async]"`. It provides `fetch`,
+        `iter_fetch` and `list` and raises the same exceptions as
+        `YouTubeTranscriptApi`, but all methods doing network requests are coroutines.
+
+        Only the parameters listed below are supported. Nothing is cached except for
+        the innertube API key, as there are no counterparts of the
+        `http_client_factory`, `transcript_cache`, `transcript_list_cache_size`,
+        `transcript_list_cache_ttl`, `failure_cache_size`, `failure_cache_ttls`,
+        `session_state_store` and `transcript_list_store` parameters of
+        `YouTubeTranscriptApi`.
+
+        Make sure to close the instance by calling `aclose()` or by using it as an async
+        context manager, once you no longer need it.
+
+        :param proxy_config: an optional ProxyConfig object, defining proxies used for
+            all network requests. Proxies can only be configured if this instance
+            creates its own `httpx.AsyncClient`. If you pass in an `http_client`,
+            configure the proxies on that client instead.
+        :param http_client: You can optionally pass in an `httpx.AsyncClient` object,
+            if you manually want to share cookies between different instances, overwrite
+            defaults, specify SSL certificates, etc. Make sure that it follows
+            redirects.
+        :param innertube_api_key_ttl: for how many seconds the API key, which is
+            extracted from the watch page of a video, is reused for subsequent videos.
+            Set this to 0 to disable caching the key.
+        :param innertube_decoder: an optional InnertubeDecoder, which is used to decode
+            the responses of YouTube's innertube API.
+        :param transcript_format: the format transcripts are requested in, either
+            "xml" or "json3". Support for "json3" is experimental.
+        """
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                follow_redirects=True,
+                mounts=self._build_proxy_mounts(proxy_config),
+            )
+        http_client.headers.update({"Accept-Language": "en-US"})
+        if proxy_config is not None and proxy_config.prevent_keeping_connections_alive:
+            http_client.headers.update({"Connection": "close"})
+        self._http_client = http_client
+        self._fetcher = AsyncTranscriptListFetcher(
+            http_client,
+            proxy_config=proxy_config,
+            innertube_api_key_ttl=innertube_api_key_ttl,
+            innertube_decoder=(
+                default_innertube_decoder()
+                if innertube_decoder is None
+                else innertube_decoder
+            ),
+            transcript_format=transcript_format,
+        )
+
+    @staticmethod
+    def _build_proxy_mounts(
+        proxy_config: Optional[ProxyConfig],
+    ) -> Optional[Dict[str, httpx.AsyncBaseTransport]]:
+        if proxy_config is None:
+            return None
+        mounts = {}
+        for scheme, proxy_url in proxy_config.to_requests_dict().items():
+            transport = httpx.AsyncHTTPTransport(proxy=proxy_url)
+            if proxy_config.retries_when_blocked > 0:
+                transport = _RetryWhenBlockedTransport(
+                    transport, proxy_config.retries_when_blocked
+                )
+            mounts[f"{scheme}://"] = transport
+        return mounts
+
+    async def fetch(
+        self,
+        video_id: str,
+        languages: Iterable[str] = ("en",),
+        preserve_formatting: bool = False,
+    ) -> FetchedTranscript:
+        """
+        Retrieves the transcript for a single video. This is just a shortcut for
+        calling:
+        `(await AsyncYouTubeTranscriptApi().list(video_id)).find_transcript(languages).fetch(preserve_formatting=preserve_formatting)`
+
+        :param video_id: the ID of the video you want to retrieve the transcript for.
+            Make sure that this is the actual ID, NOT the full URL to the video!
+        :param languages: A list of language codes in a descending priority. This
+            defaults to ["en"].
+        :param preserve_formatting: whether to keep select HTML text formatting
+        """
+        transcript_list = await self.list(video_id)
+        return await transcript_list.find_transcript(languages).fetch(
+            preserve_formatting=preserve_formatting
+        )
+
+    async def iter_fetch(
+        self,
+        video_id: str,
+        languages: Iterable[str] = ("en",),
+        preserve_formatting: bool = False,
+    ) -> AsyncIterator[FetchedTranscriptSnippet]:
+        """
+        Retrieves the transcript for a single video, like `fetch`, but yields the
+        snippets while the transcript is still being downloaded.
+
+        :param video_id: the ID of the video you want to retrieve the transcript for.
+            Make sure that this is the actual ID, NOT the full URL to the video!
+        :param languages: A list of language codes in a descending priority. This
+            defaults to ["en"].
+        :param preserve_formatting: whether to keep select HTML text formatting
+        """
+        transcript_list = await self.list(video_id)
+        async for snippet in transcript_list.find_transcript(languages).iter_fetch(
+            preserve_formatting=preserve_formatting
+        ):
+            yield snippet
+
+    async def list(
+        self,
+        video_id: str,
+    ) -> TranscriptList:
+        """
+        Retrieves the list of transcripts which are available for a given video. The
+        returned `TranscriptList` works exactly like the one returned by
+        `YouTubeTranscriptApi.list`, except for the transcripts being `AsyncTranscript`
+        objects, which have to be awaited when calling `fetch()`.
+
+        :param video_id: the ID of the video you want to retrieve the transcript for.
+            Make sure that this is the actual ID, NOT the full URL to the video!
+        """
+        return await self._fetcher.fetch(video_id)
+
+    async def aclose(self) -> None:
+        """
+        Closes the `httpx.AsyncClient`, if it has been created by this instance.
+        """
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncYouTubeTranscriptApi":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
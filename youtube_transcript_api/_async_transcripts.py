@@ -0,0 +1,171 @@
+from codecs import getincrementaldecoder
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+
+from ._settings import WATCH_URL, INNERTUBE_API_URL
+from ._errors import (
+    FailedToCreateConsentCookie,
+    IpBlocked,
+    RequestBlocked,
+    YouTubeRequestFailed,
+)
+from ._transcripts import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    Transcript,
+    TranscriptList,
+    TranscriptListFetcher,
+    _WatchPageScanner,
+    _RESPONSE_ENCODING,
+)
+
+
+def _raise_async_http_errors(response: httpx.Response, video_id: str) -> httpx.Response:
+    if response.status_code == 429:
+        raise IpBlocked(video_id)
+    try:
+        response.raise_for_status()
+        return response
+    except httpx.HTTPStatusError as error:
+        raise YouTubeRequestFailed(video_id, error)
+
+
+class AsyncTranscript(Transcript):
+    """
+    The asyncio counterpart of `Transcript`, which is returned by the
+    `AsyncYouTubeTranscriptApi`. The only differences are that `fetch` is a coroutine
+    and `iter_fetch` is an async generator.
+    """
+
+    _http_client: httpx.AsyncClient
+
+    async def fetch(
+        self,
+        preserve_formatting: bool = False,
+        lazy: bool = False,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> FetchedTranscript:
+        """
+        Loads the actual transcript data.
+        :param preserve_formatting: whether to keep select HTML text formatting
+        :param lazy: whether to defer parsing the transcript until its snippets are
+            accessed for the first time
+        :param start: if given, only the snippets starting at or after this time in
+            seconds are kept
+        :param end: if given, only the snippets starting before this time in seconds
+            are kept
+        """
+        self._assert_fetchable()
+        response = await self._http_client.get(self._fetch_url)
+        return self._build_fetched_transcript(
+            _raise_async_http_errors(response, self.video_id).content,
+            preserve_formatting,
+            lazy,
+            start,
+            end,
+        )
+
+    async def iter_fetch(
+        self, preserve_formatting: bool = False
+    ) -> AsyncIterator[FetchedTranscriptSnippet]:
+        """
+        Loads the actual transcript data, like `fetch`, but yields the snippets while
+        the response is still being downloaded and parsed.
+        :param preserve_formatting: whether to keep select HTML text formatting
+        """
+        self._assert_fetchable()
+        stream = self._create_parser(preserve_formatting).stream()
+        async with self._http_client.stream("GET", self._fetch_url) as response:
+            _raise_async_http_errors(response, self.video_id)
+            async for chunk in response.aiter_bytes(chunk_size=self._STREAM_CHUNK_SIZE):
+                for snippet in stream.feed(chunk):
+                    yield snippet
+        for snippet in stream.close():
+            yield snippet
+
+
+class AsyncTranscriptListFetcher(TranscriptListFetcher):
+    """
+    The asyncio counterpart of `TranscriptListFetcher`. It only replaces the methods
+    doing network requests, while extracting the data from the responses and mapping
+    them to errors is shared with the synchronous implementation.
+    """
+
+    _http_client: httpx.AsyncClient
+    _transcript_type = AsyncTranscript
+
+    async def fetch(self, video_id: str) -> TranscriptList:
+        return TranscriptList.build(
+            self._http_client,
+            video_id,
+            await self._fetch_captions_json(video_id),
+            transcript_type=self._transcript_type,
+            transcript_format=self._transcript_format,
+        )
+
+    async def _fetch_captions_json(self, video_id: str, try_number: int = 0) -> Dict:
+        try:
+            innertube_data = await self._fetch_innertube_data_with_cached_api_key(
+                video_id
+            )
+            if innertube_data is None:
+                watch_page = await self._scan_video_html(video_id)
+                api_key = self._extract_innertube_api_key(watch_page, video_id)
+                self._api_key_cache.set(api_key)
+                innertube_data = await self._fetch_innertube_data(video_id, api_key)
+            return self._extract_captions_json(innertube_data, video_id)
+        except RequestBlocked as exception:
+            if self._should_retry_when_blocked(try_number):
+                return await self._fetch_captions_json(
+                    video_id, try_number=try_number + 1
+                )
+            raise exception.with_proxy_config(self._proxy_config)
+
+    async def _fetch_innertube_data_with_cached_api_key(
+        self, video_id: str
+    ) -> Optional[Dict]:
+        api_key = self._api_key_cache.get()
+        if api_key is None:
+            return None
+        try:
+            return await self._fetch_innertube_data(video_id, api_key)
+        except YouTubeRequestFailed as exception:
+            if exception.status_code not in self._INVALID_API_KEY_STATUS_CODES:
+                raise exception
+            self._api_key_cache.invalidate()
+            return None
+
+    async def _scan_video_html(self, video_id: str) -> _WatchPageScanner:
+        watch_page = await self._scan_html(video_id)
+        if watch_page.has_consent_form:
+            self._create_consent_cookie(watch_page, video_id)
+            watch_page = await self._scan_html(video_id)
+            if watch_page.has_consent_form:
+                raise FailedToCreateConsentCookie(video_id)
+        return watch_page
+
+    async def _scan_html(self, video_id: str) -> _WatchPageScanner:
+        watch_page = _WatchPageScanner()
+        async with self._http_client.stream(
+            "GET", WATCH_URL.format(video_id=video_id)
+        ) as response:
+            _raise_async_http_errors(response, video_id)
+            decoder = getincrementaldecoder(_RESPONSE_ENCODING)(errors="replace")
+            async for chunk in response.aiter_bytes(
+                chunk_size=self._WATCH_PAGE_CHUNK_SIZE
+            ):
+                watch_page.feed(decoder.decode(chunk))
+                if watch_page.is_complete:
+                    break
+        return watch_page
+
+    async def _fetch_innertube_data(self, video_id: str, api_key: str) -> Dict:
+        response = await self._http_client.post(
+            INNERTUBE_API_URL.format(api_key=api_key),
+            json=self._build_innertube_request_data(video_id),
+        )
+        return self._innertube_decoder.decode(
+            _raise_async_http_errors(response, video_id).content
+        )
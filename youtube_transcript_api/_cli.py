@@ -1,8 +1,8 @@
 import argparse
-from typing import List
+from typing import Iterator, List, TextIO, Union
 
 from .proxies import GenericProxyConfig, WebshareProxyConfig
-from .formatters import FormatterLoader
+from .formatters import BinaryFormatter, FormatterLoader
 
 from ._api import YouTubeTranscriptApi, FetchedTranscript, TranscriptList
 
@@ -12,11 +12,78 @@ class YouTubeTranscriptCli:
         self._args = args
 
     def run(self) -> str:
+        """
+        Retrieves the transcripts of all videos and returns the whole output at once,
+        starting with the errors of the videos which failed.
+        """
         parsed_args = self._parse_args()
 
         if parsed_args.exclude_manually_created and parsed_args.exclude_generated:
             return ""
 
+        transcripts = []
+        exceptions = []
+
+        for result in self._retrieve(parsed_args):
+            if isinstance(result, Exception):
+                exceptions.append(result)
+            else:
+                transcripts.append(result)
+
+        print_sections = [str(exception) for exception in exceptions]
+        if transcripts:
+            if parsed_args.list_transcripts:
+                print_sections.extend(
+                    str(transcript_list) for transcript_list in transcripts
+                )
+            else:
+                print_sections.append(
+                    FormatterLoader()
+                    .load(parsed_args.format)
+                    .format_transcripts(transcripts)
+                )
+
+        return "\n\n".join(print_sections)
+
+    def write(self, fp: TextIO, error_fp: TextIO) -> None:
+        """
+        Writes the output to `fp` while the videos are retrieved, so that it never has
+        to be held in memory as a whole, like the output returned by `run`. The errors
+        of videos which fail are written to `error_fp` as they occur.
+        """
+        parsed_args = self._parse_args()
+
+        if parsed_args.exclude_manually_created and parsed_args.exclude_generated:
+            fp.write("\n")
+            return
+
+        def retrieve_successfully() -> (
+            Iterator[Union[FetchedTranscript, TranscriptList]]
+        ):
+            for result in self._retrieve(parsed_args):
+                if isinstance(result, Exception):
+                    error_fp.write(f"{result}\n\n")
+                else:
+                    yield result
+
+        if parsed_args.list_transcripts:
+            separator = ""
+            for transcript_list in retrieve_successfully():
+                fp.write(f"{separator}{transcript_list}")
+                separator = "\n\n"
+        else:
+            FormatterLoader().load(parsed_args.format).write_transcripts(
+                retrieve_successfully(), fp
+            )
+        fp.write("\n")
+
+    def _retrieve(
+        self, parsed_args
+    ) -> Iterator[Union[FetchedTranscript, TranscriptList, Exception]]:
+        """
+        Retrieves the transcript lists or transcripts of the videos one at a time,
+        yielding the exception instead if a video fails.
+        """
         proxy_config = None
         if parsed_args.http_proxy != "" or parsed_args.https_proxy != "":
             proxy_config = GenericProxyConfig(
@@ -33,9 +100,6 @@ class YouTubeTranscriptCli:
                 proxy_password=parsed_args.webshare_proxy_password,
             )
 
-        transcripts = []
-        exceptions = []
-
         ytt_api = YouTubeTranscriptApi(
             proxy_config=proxy_config,
         )
@@ -44,31 +108,12 @@ class YouTubeTranscriptCli:
             try:
                 transcript_list = ytt_api.list(video_id)
                 if parsed_args.list_transcripts:
-                    transcripts.append(transcript_list)
+                    result = transcript_list
                 else:
-                    transcripts.append(
-                        self._fetch_transcript(
-                            parsed_args,
-                            transcript_list,
-                        )
-                    )
+                    result = self._fetch_transcript(parsed_args, transcript_list)
             except Exception as exception:
-                exceptions.append(exception)
-
-        print_sections = [str(exception) for exception in exceptions]
-        if transcripts:
-            if parsed_args.list_transcripts:
-                print_sections.extend(
-                    str(transcript_list) for transcript_list in transcripts
-                )
-            else:
-                print_sections.append(
-                    FormatterLoader()
-                    .load(parsed_args.format)
-                    .format_transcripts(transcripts)
-                )
-
-        return "\n\n".join(print_sections)
+                result = exception
+            yield result
 
     def _fetch_transcript(
         self,
@@ -141,7 +186,12 @@ class YouTubeTranscriptCli:
             "--format",
             type=str,
             default="pretty",
-            choices=tuple(FormatterLoader.TYPES.keys()),
+            # the output is printed, so binary formats aren't supported
+            choices=tuple(
+                formatter_type
+                for formatter_type, formatter in FormatterLoader.TYPES.items()
+                if not issubclass(formatter, BinaryFormatter)
+            ),
         )
         parser.add_argument(
             "--translate",
@@ -85,6 +85,7 @@ class YouTubeRequestFailed(CouldNotRetrieveTranscript):
 
     def __init__(self, video_id: str, http_error: HTTPError):
         self.reason = str(http_error)
+        self.status_code = getattr(http_error.response, "status_code", None)
         super().__init__(video_id)
 
     @property
@@ -0,0 +1,113 @@
+from http.cookiejar import CookieJar
+from threading import Lock, local
+from time import time
+from typing import Callable, Dict, List, Union
+
+from requests import Session, Response
+from requests.cookies import RequestsCookieJar
+
+
+class _SharedCookies:
+    """
+    A cookie jar shared by all sessions of a `_ThreadLocalSession`. Cookies set on it
+    (like the consent cookie) are propagated to the session of each thread, before it
+    does its next request.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._cookie_jar = RequestsCookieJar()
+        self._version = 0
+
+    def set(self, name: str, value: str, **kwargs) -> None:
+        with self._lock:
+            self._cookie_jar.set(name, value, **kwargs)
+            self._version += 1
+
+    def sync(self, session: Session, synced_version: int) -> int:
+        """
+        Copies the shared cookies into the given session, if they have changed since
+        `synced_version`, and returns the version the session is now in sync with.
+        """
+        if synced_version == self._version:
+            return synced_version
+        with self._lock:
+            session.cookies.update(self._cookie_jar)
+            return self._version
+
+
+class _ThreadLocalSession:
+    """
+    Provides the parts of the `requests.Session` interface used by this module, but
+    delegates every request to a session owned by the calling thread. This makes it
+    safe to share a single `YouTubeTranscriptApi` between threads (including on
+    free-threaded Python builds), as `requests.Session` itself is not thread-safe.
+
+    The sessions are created lazily by the given factory, the first time a thread does
+    a request, while cookies set on this object are shared by all of them.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        self._session_factory = session_factory
+        self._local = local()
+        self.cookies = _SharedCookies()
+
+    @property
+    def session(self) -> Session:
+        """
+        The session owned by the calling thread.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._session_factory()
+            self._local.session = session
+            self._local.cookies_version = 0
+        self._local.cookies_version = self.cookies.sync(
+            session, self._local.cookies_version
+        )
+        return session
+
+    def get(self, url: str, **kwargs) -> Response:
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        return self.session.post(url, **kwargs)
+
+
+def _get_cookie_jar(http_client: Union[Session, _ThreadLocalSession]) -> CookieJar:
+    """
+    Returns the cookies of the session the calling thread does its requests with.
+    """
+    if isinstance(http_client, _ThreadLocalSession):
+        return http_client.session.cookies
+    return http_client.cookies
+
+
+def _dump_cookies(cookie_jar: CookieJar, domain: str) -> List[Dict]:
+    return [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "expires": cookie.expires,
+        }
+        for cookie in cookie_jar
+        if f".{cookie.domain.lstrip('.')}".endswith(f".{domain}")
+        and not cookie.is_expired()
+    ]
+
+
+def _load_cookies(
+    http_client: Union[Session, _ThreadLocalSession], cookies: List[Dict]
+) -> None:
+    now = time()
+    for cookie in cookies:
+        if cookie["expires"] is None or cookie["expires"] > now:
+            http_client.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie["domain"],
+                path=cookie["path"],
+                expires=cookie["expires"],
+            )
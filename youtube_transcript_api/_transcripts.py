@@ -1,19 +1,52 @@
-from dataclasses import dataclass, asdict
+import json
+import math
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
-from itertools import chain
+from itertools import accumulate, chain, islice
 
+from codecs import getincrementaldecoder
+from collections import OrderedDict
 from html import unescape
-from typing import List, Dict, Iterator, Iterable, Pattern, Optional
+from threading import Lock
+from time import monotonic
+from urllib.parse import parse_qs, urlparse
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Dict,
+    Iterator,
+    Iterable,
+    NamedTuple,
+    Pattern,
+    Sequence,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from defusedxml import ElementTree
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 import re
 
 from requests import HTTPError, Session, Response
 
+from .decoders import InnertubeDecoder, JSONInnertubeDecoder
 from .proxies import ProxyConfig
+from ._sessions import _dump_cookies, _get_cookie_jar, _load_cookies
 from ._settings import WATCH_URL, INNERTUBE_CONTEXT, INNERTUBE_API_URL
 from ._errors import (
+    CouldNotRetrieveTranscript,
     VideoUnavailable,
     YouTubeRequestFailed,
     NoTranscriptFound,
@@ -30,9 +63,15 @@ from ._errors import (
     PoTokenRequired,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .caching import TranscriptCache, TranscriptListStore
+    from .session_state import SessionStateStore
+
 
 @dataclass
 class FetchedTranscriptSnippet:
+    __slots__ = ("text", "start", "duration")
+
     text: str
     start: float
     """
@@ -46,11 +85,214 @@ class FetchedTranscriptSnippet:
     """
 
 
+def _exact_column(values: List[float]) -> Sequence[float]:
+    # an array of doubles would turn other numbers, like ints, into floats
+    if all(type(value) is float for value in values):
+        return array("d", values)
+    return values
+
+
+class _SnippetColumns(Sequence[FetchedTranscriptSnippet]):
+    """
+    Holds the snippets of a `FetchedTranscript` in columns, instead of one object per
+    snippet. Starts and durations are stored in arrays of doubles, while all texts are
+    concatenated into a single string, which is sliced using an array of offsets. As no
+    objects have to be kept for the snippets and their fields, this takes about a third
+    to half of the memory a list of snippets takes.
+
+    Indexing and iterating creates new `FetchedTranscriptSnippet` objects, so changing
+    them doesn't change the columns. `FetchedTranscript` takes care of that, by turning
+    the columns into a list of snippets once its `snippets` are accessed.
+    """
+
+    __slots__ = ("_texts", "_text_offsets", "_starts", "_durations")
+
+    def __init__(
+        self,
+        texts: Sequence[str],
+        starts: Iterable[float],
+        durations: Iterable[float],
+    ):
+        self._texts = "".join(texts)
+        self._text_offsets = array("q", [0])
+        self._text_offsets.extend(accumulate(map(len, texts)))
+        self._starts: Sequence[float] = array("d", starts)
+        self._durations: Sequence[float] = array("d", durations)
+
+    @classmethod
+    def from_snippets(
+        cls, snippets: Iterable[FetchedTranscriptSnippet]
+    ) -> "_SnippetColumns":
+        snippets = list(snippets)
+        return cls._from_columns(
+            [snippet.text for snippet in snippets],
+            [snippet.start for snippet in snippets],
+            [snippet.duration for snippet in snippets],
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> "_SnippetColumns":
+        """
+        Creates the columns from rows of the form `(text, start, duration)`.
+        """
+        columns = [list(column) for column in zip(*rows)]
+        return cls._from_columns(*columns) if columns else cls([], [], [])
+
+    @classmethod
+    def _from_columns(
+        cls, texts: List[str], starts: List[float], durations: List[float]
+    ) -> "_SnippetColumns":
+        """
+        Creates the columns from values which haven't been parsed from a transcript, so
+        starts and durations which aren't floats are kept as they are.
+        """
+        columns = cls(texts, [], [])
+        columns._starts = _exact_column(starts)
+        columns._durations = _exact_column(durations)
+        return columns
+
+    def rows(self) -> List[Tuple[str, float, float]]:
+        """
+        Returns the snippets as rows of the form `(text, start, duration)`.
+        """
+        return list(zip(self._list_texts(), self._starts, self._durations))
+
+    def columns(self) -> Tuple[List[str], Sequence[float], Sequence[float]]:
+        """
+        Returns the texts, starts and durations of the snippets.
+        """
+        return self._list_texts(), self._starts, self._durations
+
+    def to_snippets(self) -> List[FetchedTranscriptSnippet]:
+        return list(self)
+
+    def to_raw_data(self) -> List[Dict]:
+        return [
+            {"text": text, "start": start, "duration": duration}
+            for text, start, duration in zip(
+                self._list_texts(), self._starts, self._durations
+            )
+        ]
+
+    def _take(self, first: int, stop: int) -> "_SnippetColumns":
+        offsets = self._text_offsets
+        base = offsets[first]
+        columns = _SnippetColumns.__new__(_SnippetColumns)
+        columns._texts = self._texts[base : offsets[stop]]
+        columns._text_offsets = array(
+            "q", [offset - base for offset in offsets[first : stop + 1]]
+        )
+        columns._starts = self._starts[first:stop]
+        columns._durations = self._durations[first:stop]
+        return columns
+
+    def _list_texts(self) -> List[str]:
+        texts = self._texts
+        offsets = self._text_offsets
+        return [
+            texts[start:end] for start, end in zip(offsets, islice(offsets, 1, None))
+        ]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snippet index out of range")
+        offsets = self._text_offsets
+        return FetchedTranscriptSnippet(
+            self._texts[offsets[index] : offsets[index + 1]],
+            self._starts[index],
+            self._durations[index],
+        )
+
+    def __iter__(self) -> Iterator[FetchedTranscriptSnippet]:
+        return map(
+            FetchedTranscriptSnippet,
+            self._list_texts(),
+            self._starts,
+            self._durations,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _SnippetColumns):
+            return (
+                self._texts == other._texts
+                and self._text_offsets == other._text_offsets
+                and list(self._starts) == list(other._starts)
+                and list(self._durations) == list(other._durations)
+            )
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            snippet == other_snippet for snippet, other_snippet in zip(self, other)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _SnippetStarts(Sequence[float]):
+    """
+    The starts of a list of snippets, which can be searched using `bisect` without
+    copying them, as `bisect` only supports searching by a key from Python 3.10 on.
+    """
+
+    __slots__ = ("_snippets",)
+
+    def __init__(self, snippets: List[FetchedTranscriptSnippet]):
+        self._snippets = snippets
+
+    def __len__(self) -> int:
+        return len(self._snippets)
+
+    def __getitem__(self, index):
+        return self._snippets[index].start
+
+
+class _LazySnippetColumns(_SnippetColumns):
+    """
+    Snippet columns, which keep the raw timedtext payload they are created from and
+    only parse it once the snippets are accessed for the first time. Until then, the
+    column slots are unset, so accessing any of them falls back to `__getattr__`, which
+    parses the payload and fills them in.
+    """
+
+    __slots__ = ("payload", "_parser")
+
+    def __init__(self, payload: bytes, parser: "_TranscriptParser"):
+        self.payload = payload
+        self._parser = parser
+
+    def __getattr__(self, name: str):
+        if name not in _SnippetColumns.__slots__:
+            raise AttributeError(name)
+        columns = self._parser.parse(self.payload)
+        for slot in _SnippetColumns.__slots__:
+            setattr(self, slot, getattr(columns, slot))
+        return getattr(self, name)
+
+
 @dataclass
 class FetchedTranscript:
     """
     Represents a fetched transcript. This object is iterable, which allows you to
     iterate over the transcript snippets.
+
+    Fetched snippets are stored in a compact, columnar form, which is used by
+    `to_raw_data`, `slice` and the formatters directly. Iterating and indexing such a
+    transcript creates `FetchedTranscriptSnippet` objects on the fly, so changing them
+    doesn't change the transcript. Once `snippets` is accessed, the columns are turned
+    into a list of `FetchedTranscriptSnippet` objects once, which is kept instead of
+    them, so that changing the list or its snippets changes the transcript.
+    Transcripts created from a list of snippets, or which a list has been assigned to
+    `snippets`, keep using that list.
     """
 
     snippets: List[FetchedTranscriptSnippet]
@@ -59,17 +301,151 @@ class FetchedTranscript:
     language_code: str
     is_generated: bool
 
+    @classmethod
+    def from_raw_data(
+        cls,
+        raw_data: Iterable[Dict],
+        video_id: str,
+        language: str,
+        language_code: str,
+        is_generated: bool,
+    ) -> "FetchedTranscript":
+        """
+        Creates a transcript from a list of dicts, like the one returned by
+        `to_raw_data`, without creating an object for each snippet.
+        """
+        return cls(
+            snippets=_SnippetColumns.from_rows(
+                (snippet["text"], snippet["start"], snippet["duration"])
+                for snippet in raw_data
+            ),
+            video_id=video_id,
+            language=language,
+            language_code=language_code,
+            is_generated=is_generated,
+        )
+
+    def _get_snippets(self) -> List[FetchedTranscriptSnippet]:
+        if self._snippet_list is None:
+            columns = self._snippet_columns
+            # if this is None, another thread has turned the columns into a list
+            if columns is not None:
+                self._snippet_list = columns.to_snippets()
+                self._snippet_columns = None
+        return self._snippet_list
+
+    def _set_snippets(self, snippets: Sequence[FetchedTranscriptSnippet]) -> None:
+        self._payload: Optional[bytes] = getattr(snippets, "payload", None)
+        if isinstance(snippets, _SnippetColumns):
+            self._snippet_columns: Optional[_SnippetColumns] = snippets
+            self._snippet_list: Optional[List[FetchedTranscriptSnippet]] = None
+        else:
+            self._snippet_columns = None
+            self._snippet_list = (
+                snippets if isinstance(snippets, list) else list(snippets)
+            )
+
+    def _columns(self) -> _SnippetColumns:
+        """
+        Returns the snippets in columns. If they have been turned into a list, which
+        might have been changed, the columns are created from it.
+        """
+        columns = self._snippet_columns
+        snippets = self._snippet_list
+        if snippets is None:
+            return columns
+        return _SnippetColumns.from_snippets(snippets)
+
+    def _sequence(self) -> Sequence[FetchedTranscriptSnippet]:
+        """
+        Returns the list of snippets, if the columns have been turned into one, and the
+        columns otherwise, without turning them into a list.
+        """
+        # the columns are read first, as they are only dropped once the list is set
+        columns = self._snippet_columns
+        snippets = self._snippet_list
+        return columns if snippets is None else snippets
+
     def __iter__(self) -> Iterator[FetchedTranscriptSnippet]:
-        return iter(self.snippets)
+        return iter(self._sequence())
 
     def __getitem__(self, index) -> FetchedTranscriptSnippet:
-        return self.snippets[index]
+        return self._sequence()[index]
 
     def __len__(self) -> int:
-        return len(self.snippets)
+        return len(self._sequence())
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.video_id,
+            self.language,
+            self.language_code,
+            self.is_generated,
+        ) == (
+            other.video_id,
+            other.language,
+            other.language_code,
+            other.is_generated,
+        ) and self._columns() == other._columns()
 
     def to_raw_data(self) -> List[Dict]:
-        return [asdict(snippet) for snippet in self]
+        return self._columns().to_raw_data()
+
+    def slice(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> "FetchedTranscript":
+        """
+        Returns a transcript containing the snippets of this transcript which start at
+        or after `start` and before `end`, both given in seconds. The snippets are
+        found using binary search, which relies on them being sorted by their start,
+        as the snippets of YouTube's transcripts are.
+        """
+        snippets = self._sequence()
+        starts = _starts_of(snippets)
+        first = 0 if start is None else bisect_left(starts, start)
+        stop = max(first, len(starts) if end is None else bisect_left(starts, end))
+        if isinstance(snippets, _SnippetColumns):
+            return replace(self, snippets=snippets._take(first, stop))
+        return replace(
+            self, snippets=_SnippetColumns.from_snippets(snippets[first:stop])
+        )
+
+    def snippet_at(self, time: float) -> Optional[FetchedTranscriptSnippet]:
+        """
+        Returns the snippet shown at the given time in seconds, which is the last one
+        starting at or before it, or None if no snippet is shown at that time. Like
+        `slice`, this uses binary search.
+        """
+        snippets = self._sequence()
+        index = bisect_right(_starts_of(snippets), time) - 1
+        if index < 0:
+            return None
+        snippet = snippets[index]
+        return None if time >= snippet.start + snippet.duration else snippet
+
+    @property
+    def payload(self) -> Optional[bytes]:
+        """
+        The raw timedtext payload of a transcript fetched with `lazy=True`, which can
+        be archived as it is, without parsing it. This is None for all other
+        transcripts.
+        """
+        return self._payload
+
+
+# `snippets` is a field of the dataclass, so the property can only be added once the
+# dataclass has been created
+FetchedTranscript.snippets = property(
+    FetchedTranscript._get_snippets, FetchedTranscript._set_snippets
+)
+
+
+def _starts_of(snippets: Sequence[FetchedTranscriptSnippet]) -> Sequence[float]:
+    if isinstance(snippets, _SnippetColumns):
+        return snippets._starts
+    return _SnippetStarts(snippets)
 
 
 @dataclass
@@ -90,6 +466,14 @@ class _PlayabilityFailedReason(str, Enum):
     VIDEO_UNAVAILABLE = "This video is unavailable"
 
 
+_json_loads = json.loads if orjson is None else orjson.loads
+
+# YouTube always serves UTF-8, so responses are decoded with a fixed codec, instead of
+# relying on `Response.text`, which runs charset detection over the whole body if
+# no charset is declared.
+_RESPONSE_ENCODING = "utf-8"
+
+
 def _raise_http_errors(response: Response, video_id: str) -> Response:
     try:
         if response.status_code == 429:
@@ -101,6 +485,8 @@ def _raise_http_errors(response: Response, video_id: str) -> Response:
 
 
 class Transcript:
+    _STREAM_CHUNK_SIZE = 64 * 1024
+
     def __init__(
         self,
         http_client: Session,
@@ -110,12 +496,20 @@ class Transcript:
         language_code: str,
         is_generated: bool,
         translation_languages: List[_TranslationLanguage],
+        transcript_cache: Optional["TranscriptCache"] = None,
+        on_fetch_failed: Optional[Callable[[], None]] = None,
+        transcript_format: str = "xml",
     ):
         """
         You probably don't want to initialize this directly. Usually you'll access Transcript objects using a
         TranscriptList.
         """
         self._http_client = http_client
+        self._transcript_format = transcript_format
+        self._transcript_cache = transcript_cache
+        self._on_fetch_failed = on_fetch_failed
+        # the language code and kind of the track a translation is translated from
+        self._translated_from: Optional[Tuple[str, bool]] = None
         self.video_id = video_id
         self._url = url
         self.language = language
@@ -127,19 +521,214 @@ class Transcript:
             for translation_language in translation_languages
         }
 
-    def fetch(self, preserve_formatting: bool = False) -> FetchedTranscript:
+    def fetch(
+        self,
+        preserve_formatting: bool = False,
+        lazy: bool = False,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> FetchedTranscript:
         """
         Loads the actual transcript data.
         :param preserve_formatting: whether to keep select HTML text formatting
+        :param lazy: whether to defer parsing the transcript until its snippets are
+            accessed for the first time. The raw payload of a lazily fetched transcript
+            is available as `FetchedTranscript.payload`. Lazily fetched transcripts are
+            never stored in the transcript cache, as that would parse them right away.
+        :param start: if given, only the snippets starting at or after this time in
+            seconds are kept
+        :param end: if given, only the snippets starting before this time in seconds
+            are kept and parsing stops once a snippet starting after it is reached.
+            Transcripts only containing the snippets within `start` and `end` are never
+            stored in the transcript cache, but are sliced from a cached transcript.
+        """
+        cached_transcript = self._get_cached_transcript(preserve_formatting)
+        if cached_transcript is not None:
+            if start is None and end is None:
+                return cached_transcript
+            return cached_transcript.slice(start, end)
+        self._assert_fetchable()
+        response = self._http_client.get(self._fetch_url)
+        self._raise_fetch_errors(response)
+        fetched_transcript = self._build_fetched_transcript(
+            response.content, preserve_formatting, lazy, start, end
+        )
+        if (
+            self._transcript_cache is not None
+            and not lazy
+            and start is None
+            and end is None
+        ):
+            self._transcript_cache.set(
+                self._cache_key(preserve_formatting), fetched_transcript
+            )
+        return fetched_transcript
+
+    def iter_fetch(
+        self, preserve_formatting: bool = False
+    ) -> Iterator[FetchedTranscriptSnippet]:
+        """
+        Loads the actual transcript data, like `fetch`, but yields the snippets while
+        the response is still being downloaded and parsed, instead of holding the whole
+        transcript in memory. This is useful for very long transcripts, like the ones of
+        livestreams. If the transcript is in the transcript cache, the cached snippets
+        are yielded, but streamed transcripts are never stored in the cache.
+        :param preserve_formatting: whether to keep select HTML text formatting
+        """
+        cached_transcript = self._get_cached_transcript(preserve_formatting)
+        if cached_transcript is not None:
+            yield from cached_transcript
+            return
+        self._assert_fetchable()
+        stream = self._create_parser(preserve_formatting).stream()
+        with self._http_client.get(self._fetch_url, stream=True) as response:
+            self._raise_fetch_errors(response)
+            for chunk in response.iter_content(chunk_size=self._STREAM_CHUNK_SIZE):
+                yield from stream.feed(chunk)
+        yield from stream.close()
+
+    def _get_cached_transcript(
+        self, preserve_formatting: bool
+    ) -> Optional[FetchedTranscript]:
+        if self._transcript_cache is None:
+            return None
+        return self._transcript_cache.get(self._cache_key(preserve_formatting))
+
+    def _raise_fetch_errors(self, response: Response) -> None:
+        try:
+            _raise_http_errors(response, self.video_id)
+        except YouTubeRequestFailed as exception:
+            self._handle_fetch_failed()
+            raise exception
+
+    def _cache_key(self, preserve_formatting: bool) -> str:
+        """
+        Identifies the fetched transcript in a `TranscriptCache`. Translations are
+        identified by the track they have been translated from and their language.
+        """
+        if self._translated_from is None:
+            language_code, is_generated = self.language_code, self.is_generated
+            translation_language_code = None
+        else:
+            language_code, is_generated = self._translated_from
+            translation_language_code = self.language_code
+        return json.dumps(
+            [
+                "transcript",
+                self.video_id,
+                language_code,
+                is_generated,
+                translation_language_code,
+                preserve_formatting,
+            ]
+        )
+
+    def _expires_at(self) -> Optional[float]:
+        """
+        The unix timestamp at which the signed URL of this transcript expires, or None
+        if it doesn't specify one.
+        """
+        expire = parse_qs(urlparse(self._url).query).get("expire")
+        return float(expire[0]) if expire else None
+
+    def to_dict(self) -> Dict:
+        """
+        Serializes this transcript into a JSON-serializable dict, which can be turned
+        back into a `Transcript` using `Transcript.from_dict`. Be aware that the URL
+        the transcript is fetched from expires after a couple of hours.
+        """
+        data = {
+            "video_id": self.video_id,
+            "url": self._url,
+            "language": self.language,
+            "language_code": self.language_code,
+            "is_generated": self.is_generated,
+            "translation_languages": [
+                asdict(translation_language)
+                for translation_language in self.translation_languages
+            ],
+        }
+        if self._translated_from is not None:
+            data["translated_from"] = list(self._translated_from)
+        return data
+
+    @classmethod
+    def from_dict(
+        cls,
+        http_client: Session,
+        data: Dict,
+        transcript_cache: Optional["TranscriptCache"] = None,
+        on_fetch_failed: Optional[Callable[[], None]] = None,
+        transcript_format: str = "xml",
+    ) -> "Transcript":
+        """
+        Creates a transcript from a dict returned by `Transcript.to_dict`.
+
+        :param http_client: http client which is used to fetch the transcript
+        :param data: the dict returned by `Transcript.to_dict`
+        :param transcript_cache: an optional cache, which the fetched transcript is stored in
+        :param on_fetch_failed: an optional callback, which is called if YouTube responds to fetching the
+        transcript with an error
+        :param transcript_format: the timedtext format which is requested, either "xml" or "json3"
         """
+        transcript = cls(
+            http_client,
+            data["video_id"],
+            data["url"],
+            data["language"],
+            data["language_code"],
+            data["is_generated"],
+            [
+                _TranslationLanguage(**translation_language)
+                for translation_language in data["translation_languages"]
+            ],
+            transcript_cache=transcript_cache,
+            on_fetch_failed=on_fetch_failed,
+            transcript_format=transcript_format,
+        )
+        if "translated_from" in data:
+            transcript._translated_from = tuple(data["translated_from"])
+        return transcript
+
+    def _handle_fetch_failed(self) -> None:
+        if self._on_fetch_failed is not None:
+            self._on_fetch_failed()
+
+    @property
+    def _fetch_url(self) -> str:
+        if self._transcript_format == "xml":
+            return self._url
+        return f"{self._url}&fmt={self._transcript_format}"
+
+    def _assert_fetchable(self) -> None:
         if "&exp=xpe" in self._url:
             raise PoTokenRequired(self.video_id)
-        response = self._http_client.get(self._url)
-        snippets = _TranscriptParser(preserve_formatting=preserve_formatting).parse(
-            _raise_http_errors(response, self.video_id).text,
+
+    def _create_parser(
+        self,
+        preserve_formatting: bool,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> "_TranscriptParser":
+        return _TRANSCRIPT_PARSERS[self._transcript_format](
+            preserve_formatting=preserve_formatting, start=start, end=end
         )
+
+    def _build_fetched_transcript(
+        self,
+        raw_data: bytes,
+        preserve_formatting: bool,
+        lazy: bool = False,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> FetchedTranscript:
+        parser = self._create_parser(preserve_formatting, start, end)
         return FetchedTranscript(
-            snippets=snippets,
+            snippets=(
+                _LazySnippetColumns(raw_data, parser)
+                if lazy
+                else parser.parse(raw_data)
+            ),
             video_id=self.video_id,
             language=self.language,
             language_code=self.language_code,
@@ -164,7 +753,7 @@ class Transcript:
         if language_code not in self._translation_languages_dict:
             raise TranslationLanguageNotAvailable(self.video_id)
 
-        return Transcript(
+        translated_transcript = type(self)(
             self._http_client,
             self.video_id,
             "{url}&tlang={language_code}".format(
@@ -174,7 +763,12 @@ class Transcript:
             language_code,
             True,
             [],
+            transcript_cache=self._transcript_cache,
+            on_fetch_failed=self._on_fetch_failed,
+            transcript_format=self._transcript_format,
         )
+        translated_transcript._translated_from = (self.language_code, self.is_generated)
+        return translated_transcript
 
 
 class TranscriptList:
@@ -205,7 +799,13 @@ class TranscriptList:
 
     @staticmethod
     def build(
-        http_client: Session, video_id: str, captions_json: Dict
+        http_client: Session,
+        video_id: str,
+        captions_json: Dict,
+        transcript_type: Type[Transcript] = Transcript,
+        transcript_cache: Optional["TranscriptCache"] = None,
+        on_fetch_failed: Optional[Callable[[], None]] = None,
+        transcript_format: str = "xml",
     ) -> "TranscriptList":
         """
         Factory method for TranscriptList.
@@ -213,6 +813,11 @@ class TranscriptList:
         :param http_client: http client which is used to make the transcript retrieving http calls
         :param video_id: the id of the video this TranscriptList is for
         :param captions_json: the JSON parsed from the YouTube pages static HTML
+        :param transcript_type: the Transcript class used to represent the transcripts
+        :param transcript_cache: an optional cache, which fetched transcripts are stored in
+        :param on_fetch_failed: an optional callback, which is called if YouTube responds to fetching one of the
+        transcripts with an error
+        :param transcript_format: the timedtext format which is requested, either "xml" or "json3"
         :return: the created TranscriptList
         """
         translation_languages = [
@@ -232,7 +837,7 @@ class TranscriptList:
             else:
                 transcript_dict = manually_created_transcripts
 
-            transcript_dict[caption["languageCode"]] = Transcript(
+            transcript_dict[caption["languageCode"]] = transcript_type(
                 http_client,
                 video_id,
                 caption["baseUrl"].replace("&fmt=srv3", ""),
@@ -240,6 +845,9 @@ class TranscriptList:
                 caption["languageCode"],
                 caption.get("kind", "") == "asr",
                 translation_languages if caption.get("isTranslatable", False) else [],
+                transcript_cache=transcript_cache,
+                on_fetch_failed=on_fetch_failed,
+                transcript_format=transcript_format,
             )
 
         return TranscriptList(
@@ -249,6 +857,98 @@ class TranscriptList:
             translation_languages,
         )
 
+    def to_dict(self) -> Dict:
+        """
+        Serializes this TranscriptList into a compact, JSON-serializable dict, which
+        can be turned back into a `TranscriptList` using `TranscriptList.from_dict`.
+        Be aware that the URLs the transcripts are fetched from expire after a couple
+        of hours.
+        """
+        return {
+            "video_id": self.video_id,
+            "translation_languages": [
+                asdict(translation_language)
+                for translation_language in self._translation_languages
+            ],
+            "transcripts": [
+                {
+                    "url": transcript._url,
+                    "language": transcript.language,
+                    "language_code": transcript.language_code,
+                    "is_generated": transcript.is_generated,
+                    "is_translatable": transcript.is_translatable,
+                }
+                for transcript in self
+            ],
+        }
+
+    @staticmethod
+    def from_dict(
+        http_client: Session,
+        data: Dict,
+        transcript_type: Type[Transcript] = Transcript,
+        transcript_cache: Optional["TranscriptCache"] = None,
+        on_fetch_failed: Optional[Callable[[], None]] = None,
+        transcript_format: str = "xml",
+    ) -> "TranscriptList":
+        """
+        Creates a TranscriptList from a dict returned by `TranscriptList.to_dict`.
+
+        :param http_client: http client which is used to make the transcript retrieving http calls
+        :param data: the dict returned by `TranscriptList.to_dict`
+        :param transcript_type: the Transcript class used to represent the transcripts
+        :param transcript_cache: an optional cache, which fetched transcripts are stored in
+        :param on_fetch_failed: an optional callback, which is called if YouTube responds to fetching one of the
+        transcripts with an error
+        :param transcript_format: the timedtext format which is requested, either "xml" or "json3"
+        :return: the created TranscriptList
+        """
+        translation_languages = [
+            _TranslationLanguage(**translation_language)
+            for translation_language in data["translation_languages"]
+        ]
+
+        manually_created_transcripts = {}
+        generated_transcripts = {}
+
+        for transcript in data["transcripts"]:
+            if transcript["is_generated"]:
+                transcript_dict = generated_transcripts
+            else:
+                transcript_dict = manually_created_transcripts
+
+            transcript_dict[transcript["language_code"]] = transcript_type(
+                http_client,
+                data["video_id"],
+                transcript["url"],
+                transcript["language"],
+                transcript["language_code"],
+                transcript["is_generated"],
+                translation_languages if transcript["is_translatable"] else [],
+                transcript_cache=transcript_cache,
+                on_fetch_failed=on_fetch_failed,
+                transcript_format=transcript_format,
+            )
+
+        return TranscriptList(
+            data["video_id"],
+            manually_created_transcripts,
+            generated_transcripts,
+            translation_languages,
+        )
+
+    def _expires_at(self) -> Optional[float]:
+        """
+        The unix timestamp at which the first of the transcript URLs expires, or None if
+        none of them specifies when it expires.
+        """
+        expiry_timestamps = [
+            expires_at
+            for expires_at in (transcript._expires_at() for transcript in self)
+            if expires_at is not None
+        ]
+        return min(expiry_timestamps, default=None)
+
     def __iter__(self) -> Iterator[Transcript]:
         return chain(
             self._manually_created_transcripts.values(),
@@ -344,40 +1044,382 @@ class TranscriptList:
         return description if description else "None"
 
 
+class _WatchPageScanner:
+    """
+    Incrementally scans the chunks of a watch page for the API key, the consent form
+    and the recaptcha marker in a single pass. Only a small overlap of the previous
+    chunks is kept, to find matches spanning two chunks.
+    """
+
+    _API_KEY_REGEX = re.compile(r'"INNERTUBE_API_KEY":\s*"([a-zA-Z0-9_-]+)"')
+    _CONSENT_VALUE_REGEX = re.compile('name="v" value="(.*?)"')
+    _CONSENT_FORM_MARKER = 'action="https://consent.youtube.com/s"'
+    _RECAPTCHA_MARKER = 'class="g-recaptcha"'
+    _OVERLAP = 1024
+
+    def __init__(self):
+        self.api_key: Optional[str] = None
+        self.consent_value: Optional[str] = None
+        self.has_consent_form = False
+        self.has_recaptcha = False
+        self._tail = ""
+
+    @property
+    def is_complete(self) -> bool:
+        return self.api_key is not None
+
+    def feed(self, chunk: str) -> None:
+        data = self._tail + chunk
+        # the overlap ensures that HTML entities cut off at the end of a chunk are
+        # unescaped in one of the following windows
+        window = unescape(data)
+        if self.api_key is None:
+            match = self._API_KEY_REGEX.search(window)
+            if match:
+                self.api_key = match.group(1)
+        if self.consent_value is None:
+            match = self._CONSENT_VALUE_REGEX.search(window)
+            if match:
+                self.consent_value = match.group(1)
+        self.has_consent_form = (
+            self.has_consent_form or self._CONSENT_FORM_MARKER in window
+        )
+        self.has_recaptcha = self.has_recaptcha or self._RECAPTCHA_MARKER in window
+        self._tail = data[-self._OVERLAP :]
+
+
+class _InnertubeApiKeyCache:
+    """
+    Holds on to the INNERTUBE_API_KEY extracted from a watch page, so that it can be
+    reused for subsequent videos until its TTL runs out.
+    """
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._lock = Lock()
+        self._api_key: Optional[str] = None
+        self._expires_at = 0.0
+
+    def get(self) -> Optional[str]:
+        with self._lock:
+            if self._api_key is None or monotonic() >= self._expires_at:
+                return None
+            return self._api_key
+
+    def set(self, api_key: str) -> None:
+        with self._lock:
+            self._api_key = api_key
+            self._expires_at = monotonic() + self._ttl
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._api_key = None
+
+
+_CacheInfo = NamedTuple(
+    "CacheInfo", [("hits", int), ("misses", int), ("maxsize", int), ("currsize", int)]
+)
+
+
+class _LRUCache:
+    """
+    A thread-safe, size-bounded mapping, which evicts entries once they are older than
+    their TTL, or if more than `maxsize` entries are stored, in which case the least
+    recently used one is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and monotonic() >= entry[1]:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (
+                value,
+                monotonic() + (self._ttl if ttl is None else ttl),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def info(self) -> _CacheInfo:
+        with self._lock:
+            return _CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+
+# the failures which are caused by the video itself, as opposed to the way it has
+# been requested, and therefore are safe to cache
+_CACHEABLE_FAILURES = (
+    TranscriptsDisabled,
+    VideoUnavailable,
+    AgeRestricted,
+    InvalidVideoId,
+    VideoUnplayable,
+)
+
+_DEFAULT_FAILURE_CACHE_TTLS: Dict[Type[CouldNotRetrieveTranscript], float] = {
+    InvalidVideoId: 24 * 60 * 60,
+    VideoUnavailable: 6 * 60 * 60,
+    AgeRestricted: 6 * 60 * 60,
+    # captions can be enabled (or generated) at any time, and videos can become
+    # playable (for example once a premiere has started)
+    TranscriptsDisabled: 60 * 60,
+    VideoUnplayable: 60 * 60,
+}
+
+
+class _FailureCache:
+    """
+    Remembers the permanent failures of videos, so that they can be raised again
+    without doing any network requests. The TTL is chosen per exception class, while
+    `IpBlocked`, `RequestBlocked` and all other transient failures are never cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttls: Dict[Type[CouldNotRetrieveTranscript], float],
+    ):
+        for exception_type in ttls:
+            if not issubclass(exception_type, _CACHEABLE_FAILURES):
+                raise ValueError(
+                    f"{exception_type.__name__} can't be cached, only the following "
+                    "exceptions can: "
+                    + ", ".join(failure.__name__ for failure in _CACHEABLE_FAILURES)
+                )
+        self._ttls = ttls
+        self._cache = _LRUCache(maxsize, ttl=0)
+
+    def raise_if_cached(self, video_id: str) -> None:
+        exception = self._cache.get(video_id)
+        if exception is not None:
+            # a copy is raised, as raising the same object in multiple threads would
+            # mix up their tracebacks
+            copied_exception = type(exception).__new__(type(exception))
+            copied_exception.__dict__.update(exception.__dict__)
+            raise copied_exception
+
+    def add(self, video_id: str, exception: CouldNotRetrieveTranscript) -> None:
+        for exception_type in type(exception).__mro__:
+            if exception_type in self._ttls:
+                self._cache.set(video_id, exception, ttl=self._ttls[exception_type])
+                return
+
+
 class TranscriptListFetcher:
-    def __init__(self, http_client: Session, proxy_config: Optional[ProxyConfig]):
+    # status codes the innertube API responds with, if the provided key is rejected
+    _INVALID_API_KEY_STATUS_CODES = (400, 401, 403)
+    _WATCH_PAGE_CHUNK_SIZE = 16 * 1024
+    # stored lists are retrieved again this many seconds before their URLs expire
+    _TRANSCRIPT_URL_EXPIRY_MARGIN = 10 * 60
+    _transcript_type = Transcript
+
+    def __init__(
+        self,
+        http_client: Session,
+        proxy_config: Optional[ProxyConfig],
+        innertube_api_key_ttl: float = 0,
+        innertube_decoder: Optional[InnertubeDecoder] = None,
+        transcript_cache: Optional["TranscriptCache"] = None,
+        transcript_list_cache_size: int = 0,
+        transcript_list_cache_ttl: float = 0,
+        failure_cache_size: int = 0,
+        failure_cache_ttls: Optional[
+            Dict[Type[CouldNotRetrieveTranscript], float]
+        ] = None,
+        session_state_store: Optional["SessionStateStore"] = None,
+        transcript_list_store: Optional["TranscriptListStore"] = None,
+        transcript_format: str = "xml",
+    ):
+        if transcript_format not in _TRANSCRIPT_PARSERS:
+            raise ValueError(
+                f'Unsupported transcript format "{transcript_format}", use one of: '
+                + ", ".join(_TRANSCRIPT_PARSERS)
+            )
         self._http_client = http_client
+        self._transcript_format = transcript_format
         self._proxy_config = proxy_config
+        self._transcript_cache = transcript_cache
+        self._transcript_list_store = transcript_list_store
+        self._transcript_list_cache = _LRUCache(
+            transcript_list_cache_size, transcript_list_cache_ttl
+        )
+        self._failure_cache = _FailureCache(
+            failure_cache_size,
+            (
+                _DEFAULT_FAILURE_CACHE_TTLS
+                if failure_cache_ttls is None
+                else failure_cache_ttls
+            ),
+        )
+        self._session_state_store = session_state_store
+        self._session_state_saved = False
+        self._load_session_state()
+        self._innertube_decoder = (
+            JSONInnertubeDecoder() if innertube_decoder is None else innertube_decoder
+        )
+        self._api_key_cache = _InnertubeApiKeyCache(innertube_api_key_ttl)
 
     def fetch(self, video_id: str) -> TranscriptList:
+        transcript_list = self._transcript_list_cache.get(video_id)
+        if transcript_list is None:
+            transcript_list = self._load_stored_transcript_list(video_id)
+            if transcript_list is None:
+                transcript_list = self._retrieve_transcript_list(video_id)
+                self._store_transcript_list(transcript_list)
+            self._transcript_list_cache.set(video_id, transcript_list)
+        return transcript_list
+
+    def _retrieve_transcript_list(self, video_id: str) -> TranscriptList:
+        self._failure_cache.raise_if_cached(video_id)
+        try:
+            captions_json = self._fetch_captions_json(video_id)
+        except CouldNotRetrieveTranscript as exception:
+            self._failure_cache.add(video_id, exception)
+            raise exception
         return TranscriptList.build(
             self._http_client,
             video_id,
-            self._fetch_captions_json(video_id),
+            captions_json,
+            transcript_type=self._transcript_type,
+            transcript_cache=self._transcript_cache,
+            on_fetch_failed=lambda: self._invalidate_transcript_list(video_id),
+            transcript_format=self._transcript_format,
+        )
+
+    def _invalidate_transcript_list(self, video_id: str) -> None:
+        """
+        The timedtext URLs of a cached or stored list can stop working (for example
+        once they expire), in which case the list has to be retrieved again.
+        """
+        self._transcript_list_cache.invalidate(video_id)
+        if self._transcript_list_store is not None:
+            self._transcript_list_store.invalidate(video_id)
+
+    def _load_stored_transcript_list(self, video_id: str) -> Optional[TranscriptList]:
+        if self._transcript_list_store is None:
+            return None
+        data = self._transcript_list_store.get(video_id)
+        if data is None:
+            return None
+        return TranscriptList.from_dict(
+            self._http_client,
+            data,
+            transcript_type=self._transcript_type,
+            transcript_cache=self._transcript_cache,
+            on_fetch_failed=lambda: self._invalidate_transcript_list(video_id),
+            transcript_format=self._transcript_format,
         )
 
+    def _store_transcript_list(self, transcript_list: TranscriptList) -> None:
+        if self._transcript_list_store is None:
+            return
+        expires_at = transcript_list._expires_at()
+        if expires_at is not None:
+            self._transcript_list_store.set(
+                transcript_list.video_id,
+                transcript_list.to_dict(),
+                expires_at - self._TRANSCRIPT_URL_EXPIRY_MARGIN,
+            )
+
+    def transcript_list_cache_info(self) -> _CacheInfo:
+        return self._transcript_list_cache.info()
+
     def _fetch_captions_json(self, video_id: str, try_number: int = 0) -> Dict:
         try:
-            html = self._fetch_video_html(video_id)
-            api_key = self._extract_innertube_api_key(html, video_id)
-            innertube_data = self._fetch_innertube_data(video_id, api_key)
+            innertube_data = self._fetch_innertube_data_with_cached_api_key(video_id)
+            if innertube_data is None:
+                watch_page = self._scan_video_html(video_id)
+                api_key = self._extract_innertube_api_key(watch_page, video_id)
+                self._api_key_cache.set(api_key)
+                self._save_session_state()
+                innertube_data = self._fetch_innertube_data(video_id, api_key)
             return self._extract_captions_json(innertube_data, video_id)
         except RequestBlocked as exception:
-            retries = (
-                0
-                if self._proxy_config is None
-                else self._proxy_config.retries_when_blocked
-            )
-            if try_number + 1 < retries:
+            if self._should_retry_when_blocked(try_number):
                 return self._fetch_captions_json(video_id, try_number=try_number + 1)
             raise exception.with_proxy_config(self._proxy_config)
 
-    def _extract_innertube_api_key(self, html: str, video_id: str) -> str:
-        pattern = r'"INNERTUBE_API_KEY":\s*"([a-zA-Z0-9_-]+)"'
-        match = re.search(pattern, html)
-        if match and len(match.groups()) == 1:
-            return match.group(1)
-        if 'class="g-recaptcha"' in html:
+    def _load_session_state(self) -> None:
+        if self._session_state_store is None:
+            return
+        session_state = self._session_state_store.load()
+        if session_state is not None:
+            _load_cookies(self._http_client, session_state["cookies"])
+
+    def _save_session_state(self) -> None:
+        """
+        Saves the cookies of the session, once it has successfully been used to
+        retrieve a watch page for the first time, so that other instances don't have to
+        give consent to YouTube's cookie policy again.
+        """
+        if self._session_state_store is None or self._session_state_saved:
+            return
+        self._session_state_saved = True
+        self._session_state_store.save(
+            {
+                "cookies": _dump_cookies(
+                    _get_cookie_jar(self._http_client), "youtube.com"
+                )
+            }
+        )
+
+    def _should_retry_when_blocked(self, try_number: int) -> bool:
+        retries = (
+            0 if self._proxy_config is None else self._proxy_config.retries_when_blocked
+        )
+        return try_number + 1 < retries
+
+    def _fetch_innertube_data_with_cached_api_key(
+        self, video_id: str
+    ) -> Optional[Dict]:
+        """
+        Queries the innertube API using the cached API key, which allows us to skip
+        downloading the watch page. Returns None if no valid key is cached or if the
+        cached key has been rejected, in which case it is invalidated.
+        """
+        api_key = self._api_key_cache.get()
+        if api_key is None:
+            return None
+        try:
+            return self._fetch_innertube_data(video_id, api_key)
+        except YouTubeRequestFailed as exception:
+            if exception.status_code not in self._INVALID_API_KEY_STATUS_CODES:
+                raise exception
+            self._api_key_cache.invalidate()
+            return None
+
+    def _extract_innertube_api_key(
+        self, watch_page: "_WatchPageScanner", video_id: str
+    ) -> str:
+        if watch_page.api_key is not None:
+            return watch_page.api_key
+        if watch_page.has_recaptcha:
             raise IpBlocked(video_id)
         raise YouTubeDataUnparsable(video_id)  # pragma: no cover
 
@@ -421,37 +1463,56 @@ class TranscriptListFetcher:
                 video_id, reason, [run.get("text", "") for run in subreasons]
             )
 
-    def _create_consent_cookie(self, html: str, video_id: str) -> None:
-        match = re.search('name="v" value="(.*?)"', html)
-        if match is None:
+    def _create_consent_cookie(
+        self, watch_page: "_WatchPageScanner", video_id: str
+    ) -> None:
+        if watch_page.consent_value is None:
             raise FailedToCreateConsentCookie(video_id)
         self._http_client.cookies.set(
-            "CONSENT", "YES+" + match.group(1), domain=".youtube.com"
+            "CONSENT", "YES+" + watch_page.consent_value, domain=".youtube.com"
         )
 
-    def _fetch_video_html(self, video_id: str) -> str:
-        html = self._fetch_html(video_id)
-        if 'action="https://consent.youtube.com/s"' in html:
-            self._create_consent_cookie(html, video_id)
-            html = self._fetch_html(video_id)
-            if 'action="https://consent.youtube.com/s"' in html:
+    def _scan_video_html(self, video_id: str) -> "_WatchPageScanner":
+        watch_page = self._scan_html(video_id)
+        if watch_page.has_consent_form:
+            self._create_consent_cookie(watch_page, video_id)
+            watch_page = self._scan_html(video_id)
+            if watch_page.has_consent_form:
                 raise FailedToCreateConsentCookie(video_id)
-        return html
+        return watch_page
 
-    def _fetch_html(self, video_id: str) -> str:
-        response = self._http_client.get(WATCH_URL.format(video_id=video_id))
-        return unescape(_raise_http_errors(response, video_id).text)
+    def _scan_html(self, video_id: str) -> "_WatchPageScanner":
+        """
+        Streams the watch page and scans it chunk by chunk. The connection is closed as
+        soon as the API key has been found, so that the remainder of the page (which
+        usually is the largest part of it) is never downloaded.
+        """
+        watch_page = _WatchPageScanner()
+        with self._http_client.get(
+            WATCH_URL.format(video_id=video_id), stream=True
+        ) as response:
+            _raise_http_errors(response, video_id)
+            decoder = getincrementaldecoder(_RESPONSE_ENCODING)(errors="replace")
+            for chunk in response.iter_content(chunk_size=self._WATCH_PAGE_CHUNK_SIZE):
+                watch_page.feed(decoder.decode(chunk))
+                if watch_page.is_complete:
+                    break
+        return watch_page
 
     def _fetch_innertube_data(self, video_id: str, api_key: str) -> Dict:
         response = self._http_client.post(
             INNERTUBE_API_URL.format(api_key=api_key),
-            json={
-                "context": INNERTUBE_CONTEXT,
-                "videoId": video_id,
-            },
+            json=self._build_innertube_request_data(video_id),
+        )
+        return self._innertube_decoder.decode(
+            _raise_http_errors(response, video_id).content
         )
-        data = _raise_http_errors(response, video_id).json()
-        return data
+
+    def _build_innertube_request_data(self, video_id: str) -> Dict:
+        return {
+            "context": INNERTUBE_CONTEXT,
+            "videoId": video_id,
+        }
 
 
 class _TranscriptParser:
@@ -468,25 +1529,344 @@ class _TranscriptParser:
         "sup",  # superscript
     ]
 
-    def __init__(self, preserve_formatting: bool = False):
-        self._html_regex = self._get_html_regex(preserve_formatting)
+    # the texts of all snippets are joined using this character, so that they can be
+    # cleaned in a single pass. It can't be part of an XML document and neither
+    # `unescape` nor `_HTMLTagStripper` treat it as part of an entity or a tag, which
+    # keeps the texts from affecting each other.
+    _TEXT_SEPARATOR = "\x00"
 
-    def _get_html_regex(self, preserve_formatting: bool) -> Pattern[str]:
-        if preserve_formatting:
-            formats_regex = "|".join(self._FORMATTING_TAGS)
-            formats_regex = r"<\/?(?!\/?(" + formats_regex + r")\b).*?\b>"
-            html_regex = re.compile(formats_regex, re.IGNORECASE)
-        else:
-            html_regex = re.compile(r"<[^>]*>", re.IGNORECASE)
-        return html_regex
+    # if only the snippets up to a given time are parsed, the raw data is fed to the
+    # XML parser in chunks of this size, so that it can stop after the chunk
+    # containing the first snippet past that time
+    _CHUNK_SIZE = 64 * 1024
 
-    def parse(self, raw_data: str) -> List[FetchedTranscriptSnippet]:
-        return [
-            FetchedTranscriptSnippet(
-                text=re.sub(self._html_regex, "", unescape(xml_element.text)),
-                start=float(xml_element.attrib["start"]),
-                duration=float(xml_element.attrib.get("dur", "0.0")),
+    def __init__(
+        self,
+        preserve_formatting: bool = False,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ):
+        """
+        :param preserve_formatting: whether to keep select HTML text formatting
+        :param start: if given, snippets starting before this time are skipped
+        :param end: if given, snippets starting at or after this time are skipped
+        """
+        self._tag_stripper = _HTMLTagStripper(
+            kept_tags=self._FORMATTING_TAGS if preserve_formatting else ()
+        )
+        self._time_range: Optional[Tuple[float, float]] = None
+        if start is not None or end is not None:
+            self._time_range = (
+                -math.inf if start is None else start,
+                math.inf if end is None else end,
             )
-            for xml_element in ElementTree.fromstring(raw_data)
-            if xml_element.text is not None
-        ]
+
+    def parse(self, raw_data: Union[bytes, str]) -> "_SnippetColumns":
+        builder = _XMLSnippetBuilder(self._clean_texts, self._time_range)
+        parser = ElementTree.DefusedXMLParser(target=builder)
+        if self._time_range is None:
+            parser.feed(raw_data)
+            parser.close()
+        else:
+            for offset in range(0, len(raw_data), self._CHUNK_SIZE):
+                parser.feed(raw_data[offset : offset + self._CHUNK_SIZE])
+                if builder.is_exhausted:
+                    break
+            else:
+                parser.close()
+        return _SnippetColumns(*builder.pop_columns())
+
+    def stream(self) -> "_SnippetStream":
+        """
+        Returns a stream, which the raw data can be fed to chunk by chunk, returning the
+        snippets which have been completed by each chunk.
+        """
+        return _XMLSnippetStream(self._clean_texts, self._time_range)
+
+    def _clean_texts(self, texts: List[str]) -> List[str]:
+        """
+        Unescapes the given texts and removes HTML tags from them. This is done for all
+        texts at once, which avoids calling `unescape` and the regex for each of them,
+        while skipping either step if no text contains an entity or a tag.
+        """
+        if not texts:
+            return []
+        document = self._TEXT_SEPARATOR.join(texts)
+        if document.count(self._TEXT_SEPARATOR) != len(texts) - 1:
+            # the separator is part of a text, which is only possible in json3
+            return [self._clean_text(text) for text in texts]
+        if "&" in document:
+            document = unescape(document)
+        if "<" in document:
+            document = self._tag_stripper.strip(document)
+        return document.split(self._TEXT_SEPARATOR)
+
+    def _clean_text(self, text: str) -> str:
+        return self._tag_stripper.strip(unescape(text))
+
+
+class _HTMLTagStripper:
+    """
+    Removes HTML tags from texts, except for the given tags which are kept. If no tags
+    are kept, everything from a `<` up to the next `>` is removed, using a plain regex.
+    Otherwise, only tags which don't span multiple lines and end with a word character
+    are removed.
+
+    The regex for the latter tries to find the end of a tag for each `<`, scanning the
+    rest of the line if there is none, which takes quadratic time for lines full of
+    stray `<`. Therefore, texts containing a `<` which isn't closed before the end of its
+    line are tokenized instead, making a single pass over their `<` and `>` characters,
+    which remembers the first `<` which could start a tag until a `>` ends it or a line
+    break rules it out. Both ways remove exactly the same tags, but the regex is faster
+    for texts it can handle in linear time.
+    """
+
+    def __init__(self, kept_tags: Sequence[str]):
+        self._unclosed_tag_regex: Optional[Pattern[str]] = None
+        if not kept_tags:
+            self._tag_regex = re.compile(r"<[^>\x00]*>")
+            return
+        self._tag_regex = re.compile(
+            r"<\/?(?!\/?(" + "|".join(kept_tags) + r")\b)[^\n\x00]*?\b>",
+            re.IGNORECASE,
+        )
+        self._unclosed_tag_regex = re.compile(
+            r"<(?=([^<>\n\x00]*(?:(?<!\w)>[^<>\n\x00]*)*))\1(?:[\n\x00]|\Z)"
+        )
+        self._token_regex = re.compile(r"<|(?<=\w)>")
+        self._line_break_regex = re.compile(r"[\n\x00]")
+        self._kept_tag_regex = re.compile(
+            r"\/?(" + "|".join(kept_tags) + r")\b", re.IGNORECASE
+        )
+
+    def strip(self, text: str) -> str:
+        # this finds a `<` which is followed by neither another `<` nor the end of a tag
+        # until the end of its line. It doesn't backtrack, as the lookahead matches
+        # atomically, so it takes linear time. If there is no such `<`, the last `<` of
+        # each line is closed, so every `<` is.
+        if (
+            self._unclosed_tag_regex is None
+            or self._unclosed_tag_regex.search(text) is None
+        ):
+            return self._tag_regex.sub("", text)
+        return self._strip_tokenized(text)
+
+    def _strip_tokenized(self, text: str) -> str:
+        parts = []
+        copied_until = 0
+        # the first `<` since the last tag, which isn't the start of a kept tag
+        tag_start: Optional[int] = None
+        # up to where the text has been searched for line breaks since `tag_start`
+        searched_until = 0
+        for token in self._token_regex.finditer(text):
+            position = token.start()
+            if tag_start is not None and self._line_break_regex.search(
+                text, searched_until, position
+            ):
+                tag_start = None
+            searched_until = position
+            if text[position] == "<":
+                if tag_start is None and not self._is_kept_tag(text, position):
+                    tag_start = position
+            elif tag_start is not None:
+                parts.append(text[copied_until:tag_start])
+                copied_until = position + 1
+                tag_start = None
+        parts.append(text[copied_until:])
+        return "".join(parts)
+
+    def _is_kept_tag(self, text: str, position: int) -> bool:
+        # like the negative lookahead of the tag regex, this tries the kept tags both
+        # after and including an optional closing slash
+        if self._kept_tag_regex.match(text, position + 1) is None:
+            return False
+        return (
+            not text.startswith("/", position + 1)
+            or self._kept_tag_regex.match(text, position + 2) is not None
+        )
+
+
+class _JSON3TranscriptParser(_TranscriptParser):
+    """
+    Parses the json3 timedtext format, which holds the same snippets as the XML format,
+    but can be decoded without building an element tree. Formatting isn't encoded as
+    tags, but as pens the segments of a snippet refer to, which are turned into the
+    tags the XML format contains, if formatting is preserved.
+    """
+
+    _PEN_TAGS = (("iAttr", "i"), ("bAttr", "b"))
+
+    def __init__(
+        self,
+        preserve_formatting: bool = False,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ):
+        super().__init__(preserve_formatting=preserve_formatting, start=start, end=end)
+        self._preserve_formatting = preserve_formatting
+
+    def stream(self) -> "_SnippetStream":
+        # JSON documents can't be decoded incrementally without a dedicated parser, so
+        # the chunks are buffered until all of them have been received
+        return _BufferedSnippetStream(self.parse)
+
+    def parse(self, raw_data: Union[bytes, str]) -> "_SnippetColumns":
+        data = _json_loads(raw_data)
+        pens = data.get("pens", [])
+        texts = []
+        starts = []
+        durations = []
+        for event in data.get("events", []):
+            segments = event.get("segs")
+            # events without segments only define windows, while appended events
+            # only add line breaks to the previous snippet in auto-generated captions
+            if not segments or event.get("aAppend"):
+                continue
+            start = event["tStartMs"] / 1000
+            if self._time_range is not None:
+                if start >= self._time_range[1]:
+                    break
+                if start < self._time_range[0]:
+                    continue
+            if self._preserve_formatting:
+                text = "".join(
+                    self._format_segment(segment, pens) for segment in segments
+                )
+            else:
+                text = "".join(segment.get("utf8", "") for segment in segments)
+            if text:
+                texts.append(text)
+                starts.append(start)
+                durations.append(event.get("dDurationMs", 0) / 1000)
+        return _SnippetColumns(self._clean_texts(texts), starts, durations)
+
+    def _format_segment(self, segment: Dict, pens: List[Dict]) -> str:
+        text = segment.get("utf8", "")
+        pen_id = segment.get("pPenId")
+        if not text or pen_id is None or pen_id >= len(pens):
+            return text
+        for attribute, tag in self._PEN_TAGS:
+            if pens[pen_id].get(attribute):
+                text = f"<{tag}>{text}</{tag}>"
+        return text
+
+
+class _SnippetStream(ABC):
+    @abstractmethod
+    def feed(self, data: Union[bytes, str]) -> Sequence[FetchedTranscriptSnippet]:
+        pass
+
+    @abstractmethod
+    def close(self) -> Sequence[FetchedTranscriptSnippet]:
+        pass
+
+
+class _XMLSnippetStream(_SnippetStream):
+    """
+    Parses the XML format incrementally, using the defused expat parser. Instead of
+    building an element tree, snippets are created as soon as the closing tag of an
+    element has been parsed, so that only the snippets completed by the last chunk are
+    kept in memory.
+    """
+
+    def __init__(
+        self,
+        clean_texts: Callable[[List[str]], List[str]],
+        time_range: Optional[Tuple[float, float]] = None,
+    ):
+        self._builder = _XMLSnippetBuilder(clean_texts, time_range)
+        self._parser = ElementTree.DefusedXMLParser(target=self._builder)
+
+    def feed(self, data: Union[bytes, str]) -> Sequence[FetchedTranscriptSnippet]:
+        self._parser.feed(data)
+        return _SnippetColumns(*self._builder.pop_columns())
+
+    def close(self) -> Sequence[FetchedTranscriptSnippet]:
+        self._parser.close()
+        return _SnippetColumns(*self._builder.pop_columns())
+
+
+class _XMLSnippetBuilder:
+    """
+    The target of the parser used by `_XMLSnippetStream`, which is called for each
+    start tag, end tag and text of the document. The texts of the snippets are
+    collected and cleaned in a single pass, once the columns are popped.
+
+    If a time range is given, the texts of snippets starting outside of it are not
+    collected at all. As the snippets are sorted by their start, the builder is
+    exhausted once it reaches the first snippet starting after the range.
+    """
+
+    def __init__(
+        self,
+        clean_texts: Callable[[List[str]], List[str]],
+        time_range: Optional[Tuple[float, float]] = None,
+    ):
+        self._clean_texts = clean_texts
+        self._time_range = time_range
+        self.is_exhausted = False
+        self._texts: List[str] = []
+        self._starts: List[float] = []
+        self._durations: List[float] = []
+        self._depth = 0
+        self._attrib: Dict[str, str] = {}
+        self._text_parts: List[str] = []
+        self._in_text = False
+
+    def pop_columns(self) -> Tuple[List[str], List[float], List[float]]:
+        """
+        Returns the texts, starts and durations of the snippets completed since the
+        last call.
+        """
+        columns = (self._clean_texts(self._texts), self._starts, self._durations)
+        self._texts, self._starts, self._durations = [], [], []
+        return columns
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        self._depth += 1
+        if self._depth == 2:
+            self._attrib = attrib
+            self._text_parts = []
+            self._in_text = self._time_range is None or self._is_in_time_range(attrib)
+        else:
+            # only the text preceding the first child element of a snippet is part of
+            # it, which is what `Element.text` contains
+            self._in_text = False
+
+    def _is_in_time_range(self, attrib: Dict[str, str]) -> bool:
+        start = float(attrib["start"])
+        if start >= self._time_range[1]:
+            self.is_exhausted = True
+            return False
+        return start >= self._time_range[0]
+
+    def data(self, data: str) -> None:
+        if self._in_text:
+            self._text_parts.append(data)
+
+    def end(self, tag: str) -> None:
+        if self._depth == 2 and self._text_parts:
+            self._texts.append("".join(self._text_parts))
+            self._starts.append(float(self._attrib["start"]))
+            self._durations.append(float(self._attrib.get("dur", "0.0")))
+        self._in_text = False
+        self._depth -= 1
+
+
+class _BufferedSnippetStream(_SnippetStream):
+    def __init__(self, parse: Callable[[bytes], Sequence[FetchedTranscriptSnippet]]):
+        self._parse = parse
+        self._chunks: List[bytes] = []
+
+    def feed(self, data: Union[bytes, str]) -> Sequence[FetchedTranscriptSnippet]:
+        self._chunks.append(data.encode() if isinstance(data, str) else data)
+        return []
+
+    def close(self) -> Sequence[FetchedTranscriptSnippet]:
+        return self._parse(b"".join(self._chunks))
+
+
+_TRANSCRIPT_PARSERS: Dict[str, Type[_TranscriptParser]] = {
+    "xml": _TranscriptParser,
+    "json3": _JSON3TranscriptParser,
+}
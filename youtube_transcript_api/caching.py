@@ -0,0 +1,287 @@
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import local
+from time import time
+from typing import Dict, Optional, Union
+
+from ._transcripts import FetchedTranscript, _SnippetColumns
+
+
+class TranscriptCache(ABC):
+    """
+    The base class for all transcript caches. A cache maps opaque string keys, which
+    are built by `YouTubeTranscriptApi` and `Transcript`, to `FetchedTranscript`
+    objects. Keys identify the video, the transcript track, the translation language
+    and whether formatting has been preserved, so implementations don't have to care
+    about what they contain.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[FetchedTranscript]:
+        """
+        Returns the transcript stored for the given key, or None if there is none or
+        if it has expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, transcript: FetchedTranscript) -> None:
+        """
+        Stores the given transcript for the given key.
+        """
+        pass
+
+    def get_alias(self, alias: str) -> Optional[str]:
+        """
+        Returns the key the given alias has been mapped to, or None if there is none or
+        if it has expired. `YouTubeTranscriptApi.fetch` maps each request to the key of
+        the transcript it has picked, so that the transcript is only stored once, but
+        can be returned without doing any network requests. Caches which don't
+        override this and `set_alias` don't store aliases.
+        """
+        return None
+
+    def set_alias(self, alias: str, key: str) -> None:
+        """
+        Maps the given alias to the key of a stored transcript.
+        """
+        pass
+
+
+class TranscriptListStore(ABC):
+    """
+    The base class for all stores of transcript lists. A store maps video IDs to the
+    dicts returned by `TranscriptList.to_dict`, which contain the signed URLs of the
+    caption tracks of a video. As these URLs expire, each list is stored with the
+    timestamp after which it must no longer be returned.
+    """
+
+    @abstractmethod
+    def get(self, video_id: str) -> Optional[Dict]:
+        """
+        Returns the list stored for the given video, or None if there is none or if it
+        has expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, video_id: str, transcript_list: Dict, expires_at: float) -> None:
+        """
+        Stores the given list for the given video, until the unix timestamp
+        `expires_at`.
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, video_id: str) -> None:
+        """
+        Removes the list stored for the given video, as its URLs no longer work.
+        """
+        pass
+
+
+class _SQLiteTable:
+    """
+    A table mapping keys to JSON documents, which expire at a given unix timestamp.
+    Once more than `max_entries` documents are stored, the least recently used ones
+    are evicted.
+    """
+
+    # when a document has been used is only updated once this many seconds have passed
+    # since the last update, so that most reads don't have to take the write lock
+    _ACCESSED_AT_RESOLUTION = 60
+
+    def __init__(
+        self, path: Union[str, Path], table: str, max_entries: int, timeout: float
+    ):
+        self._path = str(path)
+        self._table = table
+        self._max_entries = max_entries
+        self._timeout = timeout
+        self._local = local()
+        with self._connection as connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                " key TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL"
+                ")"
+            )
+            for column in ("expires_at", "accessed_at"):
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})"
+                )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=self._timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[str]:
+        now = time()
+        with self._connection as connection:
+            row = connection.execute(
+                f"SELECT data, accessed_at FROM {self._table}"
+                " WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            data, accessed_at = row
+            if now - accessed_at >= self._ACCESSED_AT_RESOLUTION:
+                connection.execute(
+                    f"UPDATE {self._table} SET accessed_at = ? WHERE key = ?",
+                    (now, key),
+                )
+        return data
+
+    def set(self, key: str, data: str, expires_at: float) -> None:
+        now = time()
+        with self._connection as connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?, ?)",
+                (key, data, expires_at, now),
+            )
+            connection.execute(
+                f"DELETE FROM {self._table} WHERE expires_at <= ?", (now,)
+            )
+            connection.execute(
+                f"DELETE FROM {self._table} WHERE key IN ("
+                f" SELECT key FROM {self._table} ORDER BY accessed_at DESC"
+                " LIMIT -1 OFFSET ?"
+                ")",
+                (self._max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._connection as connection:
+            connection.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._connection as connection:
+            connection.execute(f"DELETE FROM {self._table}")
+
+
+class SQLiteTranscriptCache(TranscriptCache):
+    """
+    Stores transcripts in a SQLite database on disk, so that they survive restarts and
+    can be shared by multiple processes. Entries expire after `ttl` seconds and once
+    more than `max_entries` transcripts are stored, the least recently used ones are
+    evicted.
+
+    The database uses write-ahead logging, which allows any number of processes to read
+    while one of them is writing. Reading a transcript only writes to the database if
+    the time it was last used has been recorded more than a minute ago, so the least
+    recently used transcripts are determined with a precision of about a minute. Each
+    thread uses its own connection, so instances can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: float = 24 * 60 * 60,
+        max_entries: int = 10_000,
+        timeout: float = 30,
+    ):
+        """
+        :param path: the path of the database file. It is created if it doesn't exist.
+        :param ttl: the number of seconds after which a cached transcript expires
+        :param max_entries: the maximum number of transcripts kept in the database
+        :param timeout: how many seconds to wait for another process to finish
+            writing, before giving up with a `sqlite3.OperationalError`
+        """
+        self._ttl = ttl
+        self._table = _SQLiteTable(path, "transcripts", max_entries, timeout)
+        self._aliases = _SQLiteTable(path, "transcript_aliases", max_entries, timeout)
+
+    def get(self, key: str) -> Optional[FetchedTranscript]:
+        data = self._table.get(key)
+        return None if data is None else _deserialize_transcript(data)
+
+    def set(self, key: str, transcript: FetchedTranscript) -> None:
+        self._table.set(key, _serialize_transcript(transcript), time() + self._ttl)
+
+    def get_alias(self, alias: str) -> Optional[str]:
+        return self._aliases.get(alias)
+
+    def set_alias(self, alias: str, key: str) -> None:
+        self._aliases.set(alias, key, time() + self._ttl)
+
+    def clear(self) -> None:
+        """
+        Removes all transcripts from the database.
+        """
+        self._table.clear()
+        self._aliases.clear()
+
+
+class SQLiteTranscriptListStore(TranscriptListStore):
+    """
+    Stores transcript lists in a SQLite database on disk, so that transcripts of known
+    videos can be fetched with a single request, until the URLs of their caption tracks
+    expire. The database can be shared with a `SQLiteTranscriptCache` and works just
+    like it.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 10_000,
+        timeout: float = 30,
+    ):
+        """
+        :param path: the path of the database file. It is created if it doesn't exist.
+        :param max_entries: the maximum number of lists kept in the database
+        :param timeout: how many seconds to wait for another process to finish
+            writing, before giving up with a `sqlite3.OperationalError`
+        """
+        self._table = _SQLiteTable(path, "transcript_lists", max_entries, timeout)
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        data = self._table.get(video_id)
+        return None if data is None else json.loads(data)
+
+    def set(self, video_id: str, transcript_list: Dict, expires_at: float) -> None:
+        self._table.set(
+            video_id, json.dumps(transcript_list, ensure_ascii=False), expires_at
+        )
+
+    def invalidate(self, video_id: str) -> None:
+        self._table.delete(video_id)
+
+    def clear(self) -> None:
+        """
+        Removes all lists from the database.
+        """
+        self._table.clear()
+
+
+def _serialize_transcript(transcript: FetchedTranscript) -> str:
+    return json.dumps(
+        {
+            "video_id": transcript.video_id,
+            "language": transcript.language,
+            "language_code": transcript.language_code,
+            "is_generated": transcript.is_generated,
+            "snippets": transcript._columns().rows(),
+        },
+        ensure_ascii=False,
+    )
+
+
+def _deserialize_transcript(data: str) -> FetchedTranscript:
+    transcript: Dict = json.loads(data)
+    return FetchedTranscript(
+        snippets=_SnippetColumns.from_rows(transcript["snippets"]),
+        video_id=transcript["video_id"],
+        language=transcript["language"],
+        language_code=transcript["language_code"],
+        is_generated=transcript["is_generated"],
+    )
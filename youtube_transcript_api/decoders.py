@@ -0,0 +1,98 @@
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class InnertubeDecoder(ABC):
+    """
+    The base class for all decoders, which turn the raw response of YouTube's innertube
+    player API into the dict the list of transcripts is built from. The only parts of
+    that dict, which are required, are `playabilityStatus` and `captions`. Therefore,
+    decoders are free to drop everything else.
+    """
+
+    @abstractmethod
+    def decode(self, raw_data: bytes) -> Dict:
+        """
+        Decodes the raw (UTF-8 encoded) JSON returned by the innertube player API.
+        """
+        pass
+
+
+class JSONInnertubeDecoder(InnertubeDecoder):
+    """
+    Decodes the whole response using the `json` module of the standard library.
+    """
+
+    def decode(self, raw_data: bytes) -> Dict:
+        return json.loads(raw_data)
+
+
+class OrjsonInnertubeDecoder(InnertubeDecoder):
+    """
+    Decodes the whole response using orjson, which is a lot faster than the standard
+    library. This requires orjson to be installed, which you can do by running
+    `pip install "youtube-transcript-api[orjson]"`.
+    """
+
+    def __init__(self):
+        if orjson is None:  # pragma: no cover
+            raise ImportError(
+                "OrjsonInnertubeDecoder requires orjson to be installed. You can "
+                'install it by running `pip install "youtube-transcript-api[orjson]"`'
+            )
+
+    def decode(self, raw_data: bytes) -> Dict:
+        return orjson.loads(raw_data)
+
+
+class PartialInnertubeDecoder(InnertubeDecoder):
+    """
+    Only decodes the `playabilityStatus` and `captions` subtrees of the response,
+    instead of building Python objects for the whole document.
+
+    The innertube API returns JSON which is pretty-printed with an indentation of two
+    spaces. As JSON strings can't contain unescaped line breaks, every line starting
+    with exactly two spaces holds a top-level key, which allows locating both subtrees
+    without parsing anything else. If the response isn't formatted like that, this
+    falls back to decoding the whole document using the `fallback` decoder.
+    """
+
+    _TOP_LEVEL_KEY_REGEX = re.compile(r'\n  "(playabilityStatus|captions)":\s*')
+
+    def __init__(self, fallback: Optional[InnertubeDecoder] = None):
+        """
+        :param fallback: the decoder used if the response isn't pretty-printed.
+            Defaults to the decoder returned by `default_innertube_decoder()`.
+        """
+        self._fallback = default_innertube_decoder() if fallback is None else fallback
+        self._json_decoder = json.JSONDecoder()
+
+    def decode(self, raw_data: bytes) -> Dict:
+        document = raw_data.decode("utf-8")
+        data = {}
+        for match in self._TOP_LEVEL_KEY_REGEX.finditer(document):
+            data[match.group(1)], _ = self._json_decoder.raw_decode(
+                document, match.end()
+            )
+            if len(data) == 2:
+                break
+        if "playabilityStatus" not in data:
+            return self._fallback.decode(raw_data)
+        return data
+
+
+def default_innertube_decoder() -> InnertubeDecoder:
+    """
+    Returns the `OrjsonInnertubeDecoder` if orjson is installed and the
+    `JSONInnertubeDecoder` otherwise.
+    """
+    if orjson is None:  # pragma: no cover
+        return JSONInnertubeDecoder()
+    return OrjsonInnertubeDecoder()
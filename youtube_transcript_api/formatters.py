@@ -1,7 +1,34 @@
 import json
+import math
+from abc import ABC, abstractmethod
+from json.encoder import encode_basestring_ascii
 
 import pprint
-from typing import List, Iterable
+from array import array
+from itertools import chain, count, islice, repeat
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Iterable,
+    Optional,
+    Sequence,
+    TextIO,
+)
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
 
 from ._transcripts import FetchedTranscript, FetchedTranscriptSnippet
 
@@ -12,6 +39,11 @@ class Formatter:
     Formatter classes should inherit from this class and implement
     their own .format() method which should return a string. A
     transcript is represented by a List of Dictionary items.
+
+    The .write_transcript() and .write_transcripts() methods write
+    the same output to a file-like object. Formatters can override
+    them to write one transcript at a time, instead of building the
+    whole output in memory.
     """
 
     def format_transcript(self, transcript: FetchedTranscript, **kwargs) -> str:
@@ -26,6 +58,28 @@ class Formatter:
             "their own .format_transcripts() method."
         )
 
+    def write_transcript(
+        self, transcript: FetchedTranscript, fp: TextIO, **kwargs
+    ) -> None:
+        """Writes a formatted transcript to a file-like object.
+
+        :param transcript:
+        :param fp: a file-like object opened in text mode
+        """
+        fp.write(self.format_transcript(transcript, **kwargs))
+
+    def write_transcripts(
+        self, transcripts: Iterable[FetchedTranscript], fp: TextIO, **kwargs
+    ) -> None:
+        """Writes formatted transcripts to a file-like object. This
+        formats all of them at once, unless the formatter overrides it
+        to write them one at a time.
+
+        :param transcripts: any iterable of transcripts, like a generator
+        :param fp: a file-like object opened in text mode
+        """
+        fp.write(self.format_transcripts(list(transcripts), **kwargs))
+
 
 class PrettyPrintFormatter(Formatter):
     def format_transcript(self, transcript: FetchedTranscript, **kwargs) -> str:
@@ -46,14 +100,123 @@ class PrettyPrintFormatter(Formatter):
             [transcript.to_raw_data() for transcript in transcripts], **kwargs
         )
 
+    def write_transcripts(
+        self, transcripts: Iterable[FetchedTranscript], fp: TextIO, **kwargs
+    ) -> None:
+        """Pretty prints transcripts to a file-like object, one at a time.
+
+        The output is the same as the one of .format_transcripts(). Once
+        the list of transcripts is too wide for a single line, pprint puts
+        each transcript on lines of its own, formatting it just like it
+        formats the only item of a list. Only with a custom indent or in
+        compact mode, which lay out items differently, all transcripts are
+        formatted at once.
+
+        :param transcripts: any iterable of transcripts, like a generator
+        :param fp: a file-like object opened in text mode
+        """
+        if kwargs.get("indent", 1) != 1 or kwargs.get("compact"):
+            super().write_transcripts(transcripts, fp, **kwargs)
+            return
+        printer = pprint.PrettyPrinter(**kwargs)
+        transcripts = iter(transcripts)
+        raw_transcripts = []
+        line_length = len("[]")
+        for transcript in transcripts:
+            raw_transcripts.append(transcript.to_raw_data())
+            item_repr, _, _ = printer.format(
+                raw_transcripts[-1], {}, kwargs.get("depth"), 1
+            )
+            line_length += len(item_repr) + (
+                len(", ") if len(raw_transcripts) > 1 else 0
+            )
+            if line_length > kwargs.get("width", 80):
+                break
+        else:
+            fp.write(printer.pformat(raw_transcripts))
+            return
+        delimiter = "["
+        for raw_transcript in chain(
+            raw_transcripts, (transcript.to_raw_data() for transcript in transcripts)
+        ):
+            fp.write(delimiter)
+            fp.write(printer.pformat([raw_transcript])[1:-1])
+            delimiter = ",\n "
+        fp.write("]")
+
+
+class TranscriptEncoder(ABC):
+    """
+    The base class for all encoders, which the `JSONFormatter` uses to turn transcripts
+    into JSON, unless it is given keyword arguments for `json.dumps`. A transcript is
+    encoded as an array of objects holding the text, start and duration of a snippet,
+    just like the list returned by `FetchedTranscript.to_raw_data`.
+    """
+
+    # separates the transcripts in an array of transcripts
+    item_separator = ", "
+
+    @abstractmethod
+    def encode(self, transcript: FetchedTranscript) -> str:
+        """
+        Encodes the snippets of the given transcript into a JSON array.
+        """
+        pass
+
+    def encode_many(self, transcripts: Iterable[FetchedTranscript]) -> str:
+        """
+        Encodes the given transcripts into a JSON array of arrays of snippets.
+        """
+        return "[" + self.item_separator.join(map(self.encode, transcripts)) + "]"
+
+    def encode_value(self, value: Any) -> str:
+        """
+        Encodes any JSON-serializable value, like the objects written by the
+        `JSONLinesFormatter`.
+        """
+        return json.dumps(value)
+
+
+class JSONTranscriptEncoder(TranscriptEncoder):
+    """
+    Encodes transcripts exactly like `json.dumps` encodes their raw data, but builds
+    the JSON straight from the texts, starts and durations of the snippets, using the
+    string encoder of the `json` module, instead of creating a dict for each snippet.
+    """
+
+    _SNIPPET_TEMPLATE = '{"text": %s, "start": %r, "duration": %r}'
+
+    def encode(self, transcript: FetchedTranscript) -> str:
+        texts, starts, durations = transcript._columns().columns()
+        # NaN and infinity are encoded differently by `json` than by `repr`, which is
+        # used for the floats here. Both carry over to the sums, so the rare transcripts
+        # containing them are left to `json`.
+        if not math.isfinite(sum(starts) + sum(durations)):
+            return json.dumps(transcript.to_raw_data())
+        snippets = map(
+            self._SNIPPET_TEMPLATE.__mod__,
+            zip(map(encode_basestring_ascii, texts), starts, durations),
+        )
+        return "[" + ", ".join(snippets) + "]"
+
 
 class JSONFormatter(Formatter):
+    def __init__(self, encoder: Optional[TranscriptEncoder] = None):
+        """
+        :param encoder: the TranscriptEncoder used to encode transcripts, if no
+            keyword arguments for `json.dumps` are passed to the formatting methods.
+            Defaults to the `JSONTranscriptEncoder`.
+        """
+        self._encoder = JSONTranscriptEncoder() if encoder is None else encoder
+
     def format_transcript(self, transcript: FetchedTranscript, **kwargs) -> str:
         """Converts a transcript into a JSON string.
 
         :param transcript:
         :return: A JSON string representation of the transcript.
         """
+        if not kwargs:
+            return self._encoder.encode(transcript)
         return json.dumps(transcript.to_raw_data(), **kwargs)
 
     def format_transcripts(self, transcripts: List[FetchedTranscript], **kwargs) -> str:
@@ -62,10 +225,133 @@ class JSONFormatter(Formatter):
         :param transcripts:
         :return: A JSON string representation of the transcript.
         """
+        if not kwargs:
+            return self._encoder.encode_many(transcripts)
         return json.dumps(
             [transcript.to_raw_data() for transcript in transcripts], **kwargs
         )
 
+    def write_transcripts(
+        self, transcripts: Iterable[FetchedTranscript], fp: TextIO, **kwargs
+    ) -> None:
+        """Writes a JSON array of transcripts to a file-like object, one
+        transcript at a time. The output is the same as the one of
+        .format_transcripts(), including indentation.
+
+        :param transcripts: any iterable of transcripts, like a generator
+        :param fp: a file-like object opened in text mode
+        """
+        if kwargs:
+            encoder_type = kwargs.pop("cls", None) or json.JSONEncoder
+            encoder = encoder_type(**kwargs)
+            contents = (
+                encoder.encode(transcript.to_raw_data()) for transcript in transcripts
+            )
+            item_separator, indent = encoder.item_separator, encoder.indent
+        else:
+            contents = map(self._encoder.encode, transcripts)
+            item_separator, indent = self._encoder.item_separator, None
+        if indent is not None and not isinstance(indent, str):
+            indent = " " * indent
+        delimiter = "["
+        for content in contents:
+            fp.write(delimiter)
+            if indent is not None:
+                # JSON strings can't contain line breaks, so all of them are part of
+                # the indentation, which is one level deeper inside of the array
+                fp.write("\n" + indent)
+                content = content.replace("\n", "\n" + indent)
+            fp.write(content)
+            delimiter = item_separator
+        if delimiter == "[":
+            fp.write("[]")
+        else:
+            fp.write("]" if indent is None else "\n]")
+
+
+class JSONLinesFormatter(Formatter):
+    """Formats transcripts as JSON Lines, which puts one JSON object on
+    each line. Unlike a JSON array, the output of many transcripts can
+    be consumed line by line, while it is still being written.
+
+    By default, each line holds a transcript, including its video ID and
+    language. If `line_per_snippet` is set, each line holds a snippet
+    instead, which is tagged with the video ID and language code of its
+    transcript.
+    """
+
+    def __init__(
+        self,
+        line_per_snippet: bool = False,
+        encoder: Optional[TranscriptEncoder] = None,
+    ):
+        """
+        :param line_per_snippet: whether to write a line for each snippet, instead
+            of one for each transcript
+        :param encoder: the TranscriptEncoder used to encode the lines, if no
+            keyword arguments for `json.dumps` are passed to the formatting methods.
+            Defaults to the `JSONTranscriptEncoder`.
+        """
+        self._line_per_snippet = line_per_snippet
+        self._encoder = JSONTranscriptEncoder() if encoder is None else encoder
+
+    def format_transcript(self, transcript: FetchedTranscript, **kwargs) -> str:
+        """Converts a transcript into JSON Lines. Each line, including the
+        last one, ends with a line break, so that the output of multiple
+        transcripts can be concatenated.
+
+        :param transcript:
+        :param kwargs: passed to `json.dumps`. They must not add line breaks,
+            like `indent` does.
+        :return: the JSON Lines of the transcript
+        """
+        if kwargs:
+            lines = (json.dumps(line, **kwargs) for line in self._lines(transcript))
+        else:
+            lines = map(self._encoder.encode_value, self._lines(transcript))
+        return "".join(f"{line}\n" for line in lines)
+
+    def format_transcripts(self, transcripts: List[FetchedTranscript], **kwargs) -> str:
+        """Converts a list of transcripts into JSON Lines.
+
+        :param transcripts:
+        :return: the JSON Lines of all transcripts
+        """
+        return "".join(
+            self.format_transcript(transcript, **kwargs) for transcript in transcripts
+        )
+
+    def write_transcripts(
+        self, transcripts: Iterable[FetchedTranscript], fp: TextIO, **kwargs
+    ) -> None:
+        """Writes the JSON Lines of transcripts to a file-like object, one
+        transcript at a time.
+
+        :param transcripts: any iterable of transcripts, like a generator
+        :param fp: a file-like object opened in text mode
+        """
+        for transcript in transcripts:
+            self.write_transcript(transcript, fp, **kwargs)
+
+    def _lines(self, transcript: FetchedTranscript) -> Iterator[Dict]:
+        if not self._line_per_snippet:
+            yield {
+                "video_id": transcript.video_id,
+                "language": transcript.language,
+                "language_code": transcript.language_code,
+                "is_generated": transcript.is_generated,
+                "snippets": transcript.to_raw_data(),
+            }
+            return
+        for text, start, duration in transcript._columns().rows():
+            yield {
+                "video_id": transcript.video_id,
+                "language_code": transcript.language_code,
+                "text": text,
+                "start": start,
+                "duration": duration,
+            }
+
 
 class TextFormatter(Formatter):
     def format_transcript(self, transcript: FetchedTranscript, **kwargs) -> str:
@@ -86,6 +372,20 @@ class TextFormatter(Formatter):
             [self.format_transcript(transcript, **kwargs) for transcript in transcripts]
         )
 
+    def write_transcripts(
+        self, transcripts: Iterable[FetchedTranscript], fp: TextIO, **kwargs
+    ) -> None:
+        """Writes transcripts to a file-like object, one at a time, separated
+        the same way as by .format_transcripts().
+
+        :param transcripts: any iterable of transcripts, like a generator
+        :param fp: a file-like object opened in text mode
+        """
+        for i, transcript in enumerate(transcripts):
+            if i > 0:
+                fp.write("\n\n\n")
+            self.write_transcript(transcript, fp, **kwargs)
+
 
 class _TextBasedFormatter(TextFormatter):
     def _format_timestamp(self, hours: int, mins: int, secs: int, ms: int) -> str:
@@ -108,6 +408,25 @@ class _TextBasedFormatter(TextFormatter):
             "their own _format_transcript_helper method."
         )
 
+    def _format_cues(
+        self, texts: List[str], start_times: List[str], end_times: List[str]
+    ) -> List[str]:
+        raise NotImplementedError(
+            "A subclass of _TextBasedFormatter must implement "
+            "their own _format_cues method."
+        )
+
+    def _uses_transcript_helper(self) -> bool:
+        # subclasses written before `_format_cues` existed override the per-cue hook
+        # `_format_transcript_helper`, which must be called, unless `_format_cues` is
+        # overridden by the same or a more specific class
+        for cls in type(self).__mro__:
+            if "_format_cues" in vars(cls):
+                return False
+            if "_format_transcript_helper" in vars(cls):
+                return True
+        return False  # pragma: no cover
+
     def _seconds_to_timestamp(self, time: float) -> str:
         """Helper that converts `time` into a transcript cue timestamp.
 
@@ -121,39 +440,69 @@ class _TextBasedFormatter(TextFormatter):
         '00:00:06.930'
         """
         time = float(time)
-        hours_float, remainder = divmod(time, 3600)
-        mins_float, secs_float = divmod(remainder, 60)
-        hours, mins, secs = int(hours_float), int(mins_float), int(secs_float)
-        ms = int(round((time - int(time)) * 1000, 2))
-        return self._format_timestamp(hours, mins, secs, ms)
+        if time < 0:
+            hours_float, remainder = divmod(time, 3600)
+            mins_float, secs_float = divmod(remainder, 60)
+            hours, mins, secs = int(hours_float), int(mins_float), int(secs_float)
+            ms = int(round((time - int(time)) * 1000, 2))
+            return self._format_timestamp(hours, mins, secs, ms)
+        seconds = int(time)
+        milliseconds = (time - seconds) * 1000
+        ms = int(milliseconds)
+        # the milliseconds are rounded to two decimals before being truncated, which
+        # only makes a difference if that rounds them up to the next integer
+        if milliseconds - ms >= 0.995:
+            ms = int(round(milliseconds, 2))
+        return self._format_timestamp(
+            seconds // 3600, seconds // 60 % 60, seconds % 60, ms
+        )
 
     def format_transcript(self, transcript: FetchedTranscript, **kwargs) -> str:
         """A basic implementation of WEBVTT/SRT formatting.
 
+        A cue ends once the next one starts, if that happens before the
+        end of its snippet. As the timestamps of these cues are the start
+        timestamps of the next ones, each timestamp is only formatted once.
+
         :param transcript:
         :reference:
         https://www.w3.org/TR/webvtt1/#introduction-caption
         https://www.3playmedia.com/blog/create-srt-file/
         """
-        lines = []
-        for i, line in enumerate(transcript):
-            end = line.start + line.duration
-            time_text = "{} --> {}".format(
-                self._seconds_to_timestamp(line.start),
-                self._seconds_to_timestamp(
-                    transcript[i + 1].start
-                    if i < len(transcript) - 1 and transcript[i + 1].start < end
-                    else end
-                ),
+        texts, starts, durations = transcript._columns().columns()
+        seconds_to_timestamp = self._seconds_to_timestamp
+        start_times = [seconds_to_timestamp(start) for start in starts]
+        end_times = [
+            start_times[i]
+            if next_start < start + duration
+            else seconds_to_timestamp(start + duration)
+            for i, start, duration, next_start in zip(
+                count(1), starts, durations, islice(starts, 1, None)
             )
-            lines.append(self._format_transcript_helper(i, time_text, line))
-
-        return self._format_transcript_header(lines)
+        ]
+        if starts:
+            end_times.append(seconds_to_timestamp(starts[-1] + durations[-1]))
+        if not self._uses_transcript_helper():
+            return self._format_transcript_header(
+                self._format_cues(texts, start_times, end_times)
+            )
+        return self._format_transcript_header(
+            [
+                self._format_transcript_helper(
+                    i,
+                    f"{start_time} --> {end_time}",
+                    FetchedTranscriptSnippet(text, start, duration),
+                )
+                for i, text, start, duration, start_time, end_time in zip(
+                    count(), texts, starts, durations, start_times, end_times
+                )
+            ]
+        )
 
 
 class SRTFormatter(_TextBasedFormatter):
     def _format_timestamp(self, hours: int, mins: int, secs: int, ms: int) -> str:
-        return "{:02d}:{:02d}:{:02d},{:03d}".format(hours, mins, secs, ms)
+        return "%02d:%02d:%02d,%03d" % (hours, mins, secs, ms)
 
     def _format_transcript_header(self, lines: Iterable[str]) -> str:
         return "\n\n".join(lines) + "\n"
@@ -163,10 +512,20 @@ class SRTFormatter(_TextBasedFormatter):
     ) -> str:
         return "{}\n{}\n{}".format(i + 1, time_text, snippet.text)
 
+    def _format_cues(
+        self, texts: List[str], start_times: List[str], end_times: List[str]
+    ) -> List[str]:
+        return [
+            f"{i}\n{start_time} --> {end_time}\n{text}"
+            for i, start_time, end_time, text in zip(
+                count(1), start_times, end_times, texts
+            )
+        ]
+
 
 class WebVTTFormatter(_TextBasedFormatter):
     def _format_timestamp(self, hours: int, mins: int, secs: int, ms: int) -> str:
-        return "{:02d}:{:02d}:{:02d}.{:03d}".format(hours, mins, secs, ms)
+        return "%02d:%02d:%02d.%03d" % (hours, mins, secs, ms)
 
     def _format_transcript_header(self, lines: Iterable[str]) -> str:
         return "WEBVTT\n\n" + "\n\n".join(lines) + "\n"
@@ -176,14 +535,219 @@ class WebVTTFormatter(_TextBasedFormatter):
     ) -> str:
         return "{}\n{}".format(time_text, snippet.text)
 
+    def _format_cues(
+        self, texts: List[str], start_times: List[str], end_times: List[str]
+    ) -> List[str]:
+        return [
+            f"{start_time} --> {end_time}\n{text}"
+            for start_time, end_time, text in zip(start_times, end_times, texts)
+        ]
+
+
+class _TranscriptTable:
+    """
+    The snippets of many transcripts as the columns of a single table, which has a row
+    for each snippet. The starts and durations of all transcripts are concatenated into
+    arrays of doubles, while the values of the transcripts themselves, like their video
+    IDs, are stored once and repeated for each of their rows on demand.
+    """
+
+    COLUMNS = ("video_id", "language_code", "is_generated", "start", "duration", "text")
+
+    def __init__(self, transcripts: Iterable[FetchedTranscript]):
+        self.transcripts = list(transcripts)
+        self.lengths: List[int] = []
+        self.texts: List[str] = []
+        self.starts = array("d")
+        self.durations = array("d")
+        for transcript in self.transcripts:
+            texts, starts, durations = transcript._columns().columns()
+            self.lengths.append(len(texts))
+            self.texts += texts
+            self.starts.extend(starts)
+            self.durations.extend(durations)
+
+    def transcript_values(self, column: str) -> List:
+        return [getattr(transcript, column) for transcript in self.transcripts]
+
+    def repeated_transcript_values(self, column: str) -> List:
+        return list(
+            chain.from_iterable(
+                map(repeat, self.transcript_values(column), self.lengths)
+            )
+        )
+
+    def transcript_indices(self) -> array:
+        """
+        Returns an array containing the index of the transcript of each row.
+        """
+        indices = array("q")
+        for index, length in enumerate(self.lengths):
+            indices += array("q", [index]) * length
+        return indices
+
+
+class BinaryFormatter(Formatter):
+    """The base class of formatters producing binary formats. Their
+    formatting methods return bytes instead of a string and their
+    writing methods require a file-like object opened in binary mode.
+
+    The formatters of this module write the snippets of all transcripts
+    into a single table, with the columns listed in
+    `_TranscriptTable.COLUMNS`, so they need all transcripts at once.
+    """
+
+    def format_transcript(self, transcript: FetchedTranscript, **kwargs) -> bytes:
+        return self.format_transcripts([transcript], **kwargs)
+
+    def write_transcript(
+        self, transcript: FetchedTranscript, fp: BinaryIO, **kwargs
+    ) -> None:
+        """Writes a formatted transcript to a file-like object.
+
+        :param transcript:
+        :param fp: a file-like object opened in binary mode
+        """
+        self.write_transcripts([transcript], fp, **kwargs)
+
+
+class _ArrowTableFormatter(BinaryFormatter):
+    def __init__(self):
+        if pyarrow is None:  # pragma: no cover
+            raise ImportError(
+                f"{type(self).__name__} requires pyarrow to be installed. You can "
+                'install it by running `pip install "youtube-transcript-api[arrow]"`'
+            )
+
+    def format_transcripts(
+        self, transcripts: List[FetchedTranscript], **kwargs
+    ) -> bytes:
+        sink = pyarrow.BufferOutputStream()
+        self._write_table(self._to_table(transcripts), sink, **kwargs)
+        return sink.getvalue().to_pybytes()
+
+    def write_transcripts(
+        self, transcripts: Iterable[FetchedTranscript], fp: BinaryIO, **kwargs
+    ) -> None:
+        """Writes the table of all transcripts to a file-like object. The
+        table is written directly, without building the whole output in
+        memory first.
+
+        :param transcripts: any iterable of transcripts, like a generator
+        :param fp: a file-like object opened in binary mode
+        """
+        self._write_table(self._to_table(transcripts), fp, **kwargs)
+
+    def _to_table(self, transcripts: Iterable[FetchedTranscript]) -> "pyarrow.Table":
+        table = _TranscriptTable(transcripts)
+        indices = _arrow_array(pyarrow.int64(), table.transcript_indices())
+        columns = {
+            column: pyarrow.array(table.transcript_values(column), value_type).take(
+                indices
+            )
+            for column, value_type in (
+                ("video_id", pyarrow.string()),
+                ("language_code", pyarrow.string()),
+                ("is_generated", pyarrow.bool_()),
+            )
+        }
+        columns["start"] = _arrow_array(pyarrow.float64(), table.starts)
+        columns["duration"] = _arrow_array(pyarrow.float64(), table.durations)
+        columns["text"] = pyarrow.array(table.texts, pyarrow.string())
+        return pyarrow.table(
+            [columns[column] for column in _TranscriptTable.COLUMNS],
+            names=list(_TranscriptTable.COLUMNS),
+        )
+
+
+def _arrow_array(value_type: "pyarrow.DataType", values: Sequence) -> "pyarrow.Array":
+    # the buffer of the array is shared with pyarrow, instead of converting each value
+    return pyarrow.Array.from_buffers(
+        value_type, len(values), [None, pyarrow.py_buffer(values)]
+    )
+
+
+class ArrowFormatter(_ArrowTableFormatter):
+    """Formats transcripts as a table in the Arrow IPC file format, which
+    can be memory-mapped by pyarrow, pandas, polars or DuckDB. This
+    requires pyarrow to be installed, which you can do by running
+    `pip install "youtube-transcript-api[arrow]"`.
+
+    Keyword arguments are passed to `pyarrow.ipc.new_file`.
+    """
+
+    def _write_table(self, table: "pyarrow.Table", sink, **kwargs) -> None:
+        with pyarrow.ipc.new_file(sink, table.schema, **kwargs) as writer:
+            writer.write_table(table)
+
+
+class ParquetFormatter(_ArrowTableFormatter):
+    """Formats transcripts as a Parquet table. This requires pyarrow to be
+    installed, which you can do by running
+    `pip install "youtube-transcript-api[parquet]"`.
+
+    Keyword arguments are passed to `pyarrow.parquet.write_table`, which
+    allows choosing the compression, for example.
+    """
+
+    def _write_table(self, table: "pyarrow.Table", sink, **kwargs) -> None:
+        pyarrow.parquet.write_table(table, sink, **kwargs)
+
+
+class MsgpackFormatter(BinaryFormatter):
+    """Formats transcripts as a table encoded with MessagePack. The table is
+    a map from the name of each column to an array of its values. This
+    requires msgpack to be installed, which you can do by running
+    `pip install "youtube-transcript-api[msgpack]"`.
+
+    Keyword arguments are passed to `msgpack.packb`.
+    """
+
+    def __init__(self):
+        if msgpack is None:  # pragma: no cover
+            raise ImportError(
+                "MsgpackFormatter requires msgpack to be installed. You can install "
+                'it by running `pip install "youtube-transcript-api[msgpack]"`'
+            )
+
+    def format_transcripts(
+        self, transcripts: List[FetchedTranscript], **kwargs
+    ) -> bytes:
+        table = _TranscriptTable(transcripts)
+        return msgpack.packb(
+            {
+                "video_id": table.repeated_transcript_values("video_id"),
+                "language_code": table.repeated_transcript_values("language_code"),
+                "is_generated": table.repeated_transcript_values("is_generated"),
+                "start": table.starts.tolist(),
+                "duration": table.durations.tolist(),
+                "text": table.texts,
+            },
+            **kwargs,
+        )
+
+    def write_transcripts(
+        self, transcripts: Iterable[FetchedTranscript], fp: BinaryIO, **kwargs
+    ) -> None:
+        """Writes the table of all transcripts to a file-like object.
+
+        :param transcripts: any iterable of transcripts, like a generator
+        :param fp: a file-like object opened in binary mode
+        """
+        fp.write(self.format_transcripts(list(transcripts), **kwargs))
+
 
 class FormatterLoader:
     TYPES = {
         "json": JSONFormatter,
+        "jsonl": JSONLinesFormatter,
         "pretty": PrettyPrintFormatter,
         "text": TextFormatter,
         "webvtt": WebVTTFormatter,
         "srt": SRTFormatter,
+        "arrow": ArrowFormatter,
+        "parquet": ParquetFormatter,
+        "msgpack": MsgpackFormatter,
     }
 
     class UnknownFormatterType(Exception):
@@ -0,0 +1,64 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Dict, Optional, Union
+
+
+class SessionStateStore(ABC):
+    """
+    The base class for all session state stores. A store persists the state of the
+    HTTP session, which has been established with YouTube (like the cookie used to give
+    consent to YouTube's cookie policy), so that new instances of
+    `YouTubeTranscriptApi` can reuse it, instead of establishing it again.
+
+    The state is a JSON-serializable dict, so implementations don't have to care about
+    what it contains.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[Dict]:
+        """
+        Returns the stored session state, or None if none has been stored yet.
+        """
+        pass
+
+    @abstractmethod
+    def save(self, state: Dict) -> None:
+        """
+        Stores the given session state, replacing the state stored previously.
+        """
+        pass
+
+
+class FileSessionStateStore(SessionStateStore):
+    """
+    Stores the session state in a JSON file. The file is replaced atomically, so it can
+    be shared by multiple processes, which will never read a partially written file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        :param path: the path of the JSON file. It is created once the state is saved
+            for the first time.
+        """
+        self._path = Path(path)
+
+    def load(self) -> Optional[Dict]:
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: Dict) -> None:
+        with NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self._path.parent,
+            prefix=f".{self._path.name}.",
+            delete=False,
+        ) as file:
+            json.dump(state, file)
+        os.replace(file.name, self._path)
@@ -0,0 +1,392 @@
+from typing import Dict, List
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    TranscriptsDisabled,
+    NoTranscriptFound,
+    VideoUnavailable,
+    IpBlocked,
+    FailedToCreateConsentCookie,
+    YouTubeRequestFailed,
+    AgeRestricted,
+    RequestBlocked,
+    VideoUnplayable,
+    PoTokenRequired,
+)
+from youtube_transcript_api.proxies import GenericProxyConfig, WebshareProxyConfig
+
+from .test_api import load_asset
+
+httpx = pytest.importorskip("httpx")
+
+from youtube_transcript_api import AsyncYouTubeTranscriptApi, AsyncTranscript  # noqa: E402
+from youtube_transcript_api._async_api import _RetryWhenBlockedTransport  # noqa: E402
+
+
+class MockYouTube:
+    """
+    Serves the static assets for the endpoints requested by the
+    `AsyncYouTubeTranscriptApi`. Registering multiple responses for an endpoint
+    returns them in order, repeating the last one.
+    """
+
+    def __init__(self):
+        self.requests: List[httpx.Request] = []
+        self._responses: Dict[str, List[httpx.Response]] = {}
+        self.register(
+            "/youtubei/v1/player", load_asset("youtube.innertube.json.static")
+        )
+        self.register("/watch", load_asset("youtube.html.static"))
+        self.register("/api/timedtext", load_asset("transcript.xml.static"))
+
+    def register(self, path: str, *bodies: bytes, status_code: int = 200) -> None:
+        self._responses[path] = [
+            httpx.Response(status_code, content=body) for body in bodies
+        ]
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        responses = self._responses[request.url.path]
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    @property
+    def requested_paths(self) -> List[str]:
+        return [request.url.path for request in self.requests]
+
+
+class TestAsyncYouTubeTranscriptApi(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ref_transcript = FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(
+                    text="Hey, this is just a test",
+                    start=0.0,
+                    duration=1.54,
+                ),
+                FetchedTranscriptSnippet(
+                    text="this is not the original transcript",
+                    start=1.54,
+                    duration=4.16,
+                ),
+                FetchedTranscriptSnippet(
+                    text="just something shorter, I made up for testing",
+                    start=5.7,
+                    duration=3.239,
+                ),
+            ],
+            language="English",
+            language_code="en",
+            is_generated=False,
+            video_id="GJLlxj_dtq8",
+        )
+        self.youtube = MockYouTube()
+
+    def create_api(self, **kwargs) -> AsyncYouTubeTranscriptApi:
+        return AsyncYouTubeTranscriptApi(
+            http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(self.youtube.handle)
+            ),
+            **kwargs,
+        )
+
+    async def test_fetch(self):
+        transcript = await self.create_api().fetch("GJLlxj_dtq8")
+
+        self.assertEqual(transcript, self.ref_transcript)
+        self.assertEqual(
+            self.youtube.requested_paths,
+            ["/watch", "/youtubei/v1/player", "/api/timedtext"],
+        )
+        self.assertEqual(self.youtube.requests[0].headers["Accept-Language"], "en-US")
+
+    async def test_fetch_formatted(self):
+        transcript = await self.create_api().fetch(
+            "GJLlxj_dtq8", preserve_formatting=True
+        )
+
+        self.ref_transcript[1].text = "this is <i>not</i> the original transcript"
+        self.assertEqual(transcript, self.ref_transcript)
+
+    async def test_transcript_fetch__lazy(self):
+        transcript_list = await self.create_api().list("GJLlxj_dtq8")
+
+        transcript = await transcript_list.find_transcript(["en"]).fetch(lazy=True)
+
+        self.assertEqual(transcript.payload, load_asset("transcript.xml.static"))
+        self.assertEqual(transcript, self.ref_transcript)
+
+    async def test_transcript_fetch__time_range(self):
+        transcript_list = await self.create_api().list("GJLlxj_dtq8")
+
+        transcript = await transcript_list.find_transcript(["en"]).fetch(end=5.0)
+
+        self.assertEqual(transcript, self.ref_transcript.slice(end=5.0))
+
+    async def test_iter_fetch(self):
+        snippets = [
+            snippet
+            async for snippet in self.create_api().iter_fetch(
+                "GJLlxj_dtq8", preserve_formatting=True
+            )
+        ]
+
+        self.ref_transcript[1].text = "this is <i>not</i> the original transcript"
+        self.assertEqual(snippets, self.ref_transcript.snippets)
+
+    async def test_iter_fetch__json3_format(self):
+        self.youtube.register("/api/timedtext", load_asset("transcript.json3.static"))
+        ytt_api = self.create_api(transcript_format="json3")
+
+        snippets = [snippet async for snippet in ytt_api.iter_fetch("GJLlxj_dtq8")]
+
+        self.assertEqual(snippets, self.ref_transcript.snippets)
+
+    async def test_iter_fetch__exception_if_youtube_request_fails(self):
+        self.youtube.register("/api/timedtext", b"", status_code=500)
+
+        with self.assertRaises(YouTubeRequestFailed):
+            async for _ in self.create_api().iter_fetch("GJLlxj_dtq8"):
+                pass
+
+    async def test_fetch__json3_format(self):
+        self.youtube.register("/api/timedtext", load_asset("transcript.json3.static"))
+
+        transcript = await self.create_api(transcript_format="json3").fetch(
+            "GJLlxj_dtq8"
+        )
+
+        self.assertEqual(transcript, self.ref_transcript)
+        self.assertEqual(self.youtube.requests[-1].url.params["fmt"], "json3")
+
+    async def test_fetch__api_key_is_cached(self):
+        ytt_api = self.create_api()
+
+        await ytt_api.fetch("GJLlxj_dtq8")
+        await ytt_api.fetch("GJLlxj_dtq8")
+
+        self.assertEqual(
+            self.youtube.requested_paths[3:], ["/youtubei/v1/player", "/api/timedtext"]
+        )
+
+    async def test_fetch__api_key_is_refetched_if_rejected(self):
+        ytt_api = self.create_api()
+        await ytt_api.fetch("GJLlxj_dtq8")
+        self.youtube.register(
+            "/youtubei/v1/player",
+            b"API key not valid",
+            load_asset("youtube.innertube.json.static"),
+        )
+        self.youtube._responses["/youtubei/v1/player"][0].status_code = 400
+
+        transcript = await ytt_api.fetch("GJLlxj_dtq8")
+
+        self.assertEqual(transcript, self.ref_transcript)
+        self.assertEqual(
+            self.youtube.requested_paths[3:],
+            ["/youtubei/v1/player", "/watch", "/youtubei/v1/player", "/api/timedtext"],
+        )
+
+    async def test_fetch__api_key_cache_does_not_swallow_other_errors(self):
+        ytt_api = self.create_api()
+        await ytt_api.fetch("GJLlxj_dtq8")
+        self.youtube.register("/youtubei/v1/player", b"", status_code=500)
+
+        with self.assertRaises(YouTubeRequestFailed) as cm:
+            await ytt_api.fetch("GJLlxj_dtq8")
+
+        self.assertEqual(cm.exception.status_code, 500)
+
+    async def test_list(self):
+        transcript_list = await self.create_api().list("GJLlxj_dtq8")
+
+        language_codes = {transcript.language_code for transcript in transcript_list}
+        self.assertEqual(
+            language_codes, {"zh", "de", "en", "hi", "ja", "ko", "es", "cs"}
+        )
+        for transcript in transcript_list:
+            self.assertIsInstance(transcript, AsyncTranscript)
+
+    async def test_translate_transcript(self):
+        transcript_list = await self.create_api().list("GJLlxj_dtq8")
+
+        translated_transcript = transcript_list.find_transcript(["en"]).translate("ar")
+        await translated_transcript.fetch()
+
+        self.assertIsInstance(translated_transcript, AsyncTranscript)
+        self.assertEqual(translated_transcript.language_code, "ar")
+        self.assertEqual(self.youtube.requests[-1].url.params["tlang"], "ar")
+
+    async def test_fetch__fallback_language_is_used(self):
+        self.youtube.register(
+            "/youtubei/v1/player", load_asset("youtube_ww1_nl_en.innertube.json.static")
+        )
+
+        await self.create_api().fetch("F1xioXWb8CY", ["de", "en"])
+
+        self.assertEqual(self.youtube.requests[-1].url.params["lang"], "en")
+
+    async def test_fetch__create_consent_cookie_if_needed(self):
+        self.youtube.register(
+            "/watch",
+            load_asset("youtube_consent_page.html.static"),
+            load_asset("youtube.html.static"),
+        )
+
+        await self.create_api().fetch("F1xioXWb8CY")
+
+        self.assertEqual(len(self.youtube.requests), 4)
+        for request in self.youtube.requests[1:]:
+            self.assertEqual(
+                request.headers["cookie"], "CONSENT=YES+cb.20210328-17-p0.de+FX+119"
+            )
+
+    async def test_fetch__exception_if_create_consent_cookie_failed(self):
+        self.youtube.register("/watch", load_asset("youtube_consent_page.html.static"))
+
+        with self.assertRaises(FailedToCreateConsentCookie):
+            await self.create_api().fetch("F1xioXWb8CY")
+
+    async def test_fetch__exception_if_consent_cookie_age_invalid(self):
+        self.youtube.register(
+            "/watch", load_asset("youtube_consent_page_invalid.html.static")
+        )
+
+        with self.assertRaises(FailedToCreateConsentCookie):
+            await self.create_api().fetch("F1xioXWb8CY")
+
+    async def test_fetch__exceptions_from_innertube_data(self):
+        for asset, exception_type in (
+            ("youtube_video_unavailable.innertube.json.static", VideoUnavailable),
+            ("youtube_age_restricted.innertube.json.static", AgeRestricted),
+            ("youtube_request_blocked.innertube.json.static", RequestBlocked),
+            ("youtube_unplayable.innertube.json.static", VideoUnplayable),
+            ("youtube_transcripts_disabled.innertube.json.static", TranscriptsDisabled),
+            ("youtube_po_token_required.innertube.json.static", PoTokenRequired),
+        ):
+            with self.subTest(asset=asset):
+                self.youtube.register("/youtubei/v1/player", load_asset(asset))
+
+                with self.assertRaises(exception_type):
+                    await self.create_api().fetch("GJLlxj_dtq8")
+
+    async def test_fetch__exception_if_language_unavailable(self):
+        with self.assertRaises(NoTranscriptFound):
+            await self.create_api().fetch("GJLlxj_dtq8", languages=["cz"])
+
+    async def test_fetch__exception_if_youtube_request_fails(self):
+        self.youtube.register("/youtubei/v1/player", b"", status_code=500)
+
+        with self.assertRaises(YouTubeRequestFailed) as cm:
+            await self.create_api().fetch("abc")
+
+        self.assertIn("Request to YouTube failed: ", str(cm.exception))
+
+    async def test_fetch__exception_if_ip_blocked(self):
+        self.youtube.register(
+            "/watch", load_asset("youtube_too_many_requests.html.static")
+        )
+
+        with self.assertRaises(IpBlocked):
+            await self.create_api().fetch("abc")
+
+    async def test_fetch__exception_if_timedtext_request_limit_reached(self):
+        self.youtube.register("/api/timedtext", b"", status_code=429)
+
+        with self.assertRaises(IpBlocked):
+            await self.create_api().fetch("abc")
+
+    async def test_fetch__with_proxy_retry_when_blocked(self):
+        blocked = load_asset("youtube_request_blocked.innertube.json.static")
+        self.youtube.register(
+            "/youtubei/v1/player",
+            blocked,
+            blocked,
+            load_asset("youtube.innertube.json.static"),
+        )
+        proxy_config = WebshareProxyConfig(
+            proxy_username="username", proxy_password="password"
+        )
+
+        transcript = await self.create_api(proxy_config=proxy_config).fetch(
+            "GJLlxj_dtq8"
+        )
+
+        self.assertEqual(transcript, self.ref_transcript)
+        self.assertEqual(len(self.youtube.requests), 1 + 3 + 1)
+        self.assertEqual(self.youtube.requests[-1].headers["Connection"], "close")
+
+    async def test_fetch__with_proxy_reraise_when_blocked(self):
+        self.youtube.register(
+            "/youtubei/v1/player",
+            load_asset("youtube_request_blocked.innertube.json.static"),
+        )
+        proxy_config = WebshareProxyConfig(
+            proxy_username="username", proxy_password="password", retries_when_blocked=3
+        )
+
+        with self.assertRaises(RequestBlocked) as cm:
+            await self.create_api(proxy_config=proxy_config).fetch("Njp5uhTorCo")
+
+        self.assertEqual(len(self.youtube.requests), 1 + 3)
+        self.assertEqual(cm.exception._proxy_config, proxy_config)
+
+    async def test_init__proxy_mounts(self):
+        proxy_config = GenericProxyConfig(https_url="http://localhost:8080")
+
+        self.assertIsNone(AsyncYouTubeTranscriptApi._build_proxy_mounts(None))
+        mounts = AsyncYouTubeTranscriptApi._build_proxy_mounts(proxy_config)
+        self.assertEqual(set(mounts.keys()), {"http://", "https://"})
+        for transport in mounts.values():
+            self.assertIsInstance(transport, httpx.AsyncHTTPTransport)
+
+        mounts = AsyncYouTubeTranscriptApi._build_proxy_mounts(
+            WebshareProxyConfig(proxy_username="username", proxy_password="password")
+        )
+        for transport in mounts.values():
+            self.assertIsInstance(transport, _RetryWhenBlockedTransport)
+
+    async def test_aclose(self):
+        async with AsyncYouTubeTranscriptApi(
+            proxy_config=GenericProxyConfig(https_url="http://localhost:8080")
+        ) as ytt_api:
+            http_client = ytt_api._http_client
+            self.assertFalse(http_client.is_closed)
+        self.assertTrue(http_client.is_closed)
+
+        ytt_api = self.create_api()
+        await ytt_api.aclose()
+        self.assertFalse(ytt_api._http_client.is_closed)
+
+
+class TestRetryWhenBlockedTransport(IsolatedAsyncioTestCase):
+    async def test_handle_async_request(self):
+        status_codes = [429, 429, 200]
+        transport = _RetryWhenBlockedTransport(
+            httpx.MockTransport(lambda request: httpx.Response(status_codes.pop(0))),
+            retries=5,
+        )
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            response = await http_client.get("https://www.youtube.com/watch")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(status_codes, [])
+
+    async def test_handle_async_request__retries_exhausted(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(429)
+
+        transport = _RetryWhenBlockedTransport(httpx.MockTransport(handler), retries=2)
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            response = await http_client.get("https://www.youtube.com/watch")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(requests), 3)
@@ -0,0 +1,397 @@
+import json
+import multiprocessing
+import sqlite3
+from itertools import count
+from time import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import httpretty
+
+from youtube_transcript_api import (
+    YouTubeTranscriptApi,
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    YouTubeRequestFailed,
+)
+from youtube_transcript_api.caching import (
+    SQLiteTranscriptCache,
+    SQLiteTranscriptListStore,
+    TranscriptCache,
+)
+
+from .test_api import load_asset
+
+
+def create_transcript(video_id: str, text: str = "Hey, this is just a test"):
+    return FetchedTranscript(
+        snippets=[
+            FetchedTranscriptSnippet(text=text, start=0.0, duration=1.54),
+            FetchedTranscriptSnippet(text="ünïcödé", start=1.54, duration=4.16),
+        ],
+        video_id=video_id,
+        language="English",
+        language_code="en",
+        is_generated=False,
+    )
+
+
+def _fill_cache(path: str, worker: int) -> None:
+    cache = SQLiteTranscriptCache(path)
+    for i in range(50):
+        cache.set(f"{worker}-{i}", create_transcript(f"{worker}-{i}"))
+        cache.get(f"{(worker + 1) % 4}-{i}")
+
+
+class TestSQLiteTranscriptCache(TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "transcripts.sqlite"
+
+    def _accessed_at(self, key: str) -> float:
+        with sqlite3.connect(self.path) as connection:
+            return connection.execute(
+                "SELECT accessed_at FROM transcripts WHERE key = ?", (key,)
+            ).fetchone()[0]
+
+    def test_get__missing_key(self):
+        self.assertIsNone(SQLiteTranscriptCache(self.path).get("key"))
+
+    def test_set_and_get(self):
+        transcript = create_transcript("GJLlxj_dtq8")
+        SQLiteTranscriptCache(self.path).set("key", transcript)
+
+        self.assertEqual(SQLiteTranscriptCache(self.path).get("key"), transcript)
+
+    def test_set__replaces_entry(self):
+        cache = SQLiteTranscriptCache(self.path)
+        cache.set("key", create_transcript("GJLlxj_dtq8"))
+        cache.set("key", create_transcript("GJLlxj_dtq8", text="updated"))
+
+        self.assertEqual(cache.get("key")[0].text, "updated")
+
+    def test_get__expired(self):
+        cache = SQLiteTranscriptCache(self.path, ttl=10)
+
+        with patch("youtube_transcript_api.caching.time", return_value=1000):
+            cache.set("key", create_transcript("GJLlxj_dtq8"))
+        with patch("youtube_transcript_api.caching.time", return_value=1009):
+            self.assertIsNotNone(cache.get("key"))
+        with patch("youtube_transcript_api.caching.time", return_value=1010):
+            self.assertIsNone(cache.get("key"))
+
+    def test_set__evicts_least_recently_used(self):
+        cache = SQLiteTranscriptCache(self.path, max_entries=2)
+
+        with patch("youtube_transcript_api.caching.time", side_effect=count(1000, 60)):
+            cache.set("a", create_transcript("a"))
+            cache.set("b", create_transcript("b"))
+            cache.get("a")
+            cache.set("c", create_transcript("c"))
+
+            self.assertIsNotNone(cache.get("a"))
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("c"))
+
+    def test_get__records_use_at_most_once_a_minute(self):
+        cache = SQLiteTranscriptCache(self.path)
+
+        with patch("youtube_transcript_api.caching.time", return_value=1000):
+            cache.set("key", create_transcript("GJLlxj_dtq8"))
+        with patch("youtube_transcript_api.caching.time", return_value=1059):
+            cache.get("key")
+        self.assertEqual(self._accessed_at("key"), 1000)
+        with patch("youtube_transcript_api.caching.time", return_value=1060):
+            cache.get("key")
+        self.assertEqual(self._accessed_at("key"), 1060)
+
+    def test_clear(self):
+        cache = SQLiteTranscriptCache(self.path)
+        cache.set("key", create_transcript("GJLlxj_dtq8"))
+        cache.set_alias("alias", "key")
+
+        cache.clear()
+
+        self.assertIsNone(cache.get("key"))
+        self.assertIsNone(cache.get_alias("alias"))
+
+    def test_shared_by_multiple_processes(self):
+        SQLiteTranscriptCache(self.path)
+        processes = [
+            multiprocessing.Process(target=_fill_cache, args=(str(self.path), worker))
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual([process.exitcode for process in processes], [0] * 4)
+        cache = SQLiteTranscriptCache(self.path)
+        for worker in range(4):
+            for i in range(50):
+                self.assertEqual(
+                    cache.get(f"{worker}-{i}"), create_transcript(f"{worker}-{i}")
+                )
+
+
+class TestSQLiteTranscriptListStore(TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "transcripts.sqlite"
+        self.transcript_list = {"video_id": "GJLlxj_dtq8", "transcripts": []}
+
+    def test_set_and_get(self):
+        SQLiteTranscriptListStore(self.path).set(
+            "GJLlxj_dtq8", self.transcript_list, expires_at=time() + 60
+        )
+
+        self.assertEqual(
+            SQLiteTranscriptListStore(self.path).get("GJLlxj_dtq8"),
+            self.transcript_list,
+        )
+        self.assertIsNone(SQLiteTranscriptListStore(self.path).get("other"))
+
+    def test_get__expired(self):
+        store = SQLiteTranscriptListStore(self.path)
+
+        with patch("youtube_transcript_api.caching.time", return_value=900):
+            store.set("GJLlxj_dtq8", self.transcript_list, expires_at=1000)
+        with patch("youtube_transcript_api.caching.time", return_value=999):
+            self.assertIsNotNone(store.get("GJLlxj_dtq8"))
+        with patch("youtube_transcript_api.caching.time", return_value=1000):
+            self.assertIsNone(store.get("GJLlxj_dtq8"))
+
+    def test_invalidate(self):
+        store = SQLiteTranscriptListStore(self.path)
+        store.set("GJLlxj_dtq8", self.transcript_list, expires_at=time() + 60)
+
+        store.invalidate("GJLlxj_dtq8")
+
+        self.assertIsNone(store.get("GJLlxj_dtq8"))
+
+    def test_clear(self):
+        store = SQLiteTranscriptListStore(self.path)
+        store.set("GJLlxj_dtq8", self.transcript_list, expires_at=time() + 60)
+
+        store.clear()
+
+        self.assertIsNone(store.get("GJLlxj_dtq8"))
+
+    def test_shares_database_with_transcript_cache(self):
+        cache = SQLiteTranscriptCache(self.path)
+        store = SQLiteTranscriptListStore(self.path)
+
+        cache.set("GJLlxj_dtq8", create_transcript("GJLlxj_dtq8"))
+        store.set("GJLlxj_dtq8", self.transcript_list, expires_at=time() + 60)
+        store.clear()
+
+        self.assertIsNotNone(cache.get("GJLlxj_dtq8"))
+
+
+class TestYouTubeTranscriptApiCaching(TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "transcripts.sqlite"
+        self.cache = SQLiteTranscriptCache(self.path)
+        self.transcript_list_store = SQLiteTranscriptListStore(
+            Path(temp_dir.name) / "transcripts.sqlite"
+        )
+        httpretty.enable()
+        self.addCleanup(httpretty.disable)
+        self.addCleanup(httpretty.reset)
+        httpretty.register_uri(
+            httpretty.POST,
+            "https://www.youtube.com/youtubei/v1/player",
+            body=load_asset("youtube.innertube.json.static"),
+        )
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/watch",
+            body=load_asset("youtube.html.static"),
+        )
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://www.youtube.com/api/timedtext",
+            body=load_asset("transcript.xml.static"),
+        )
+
+    def test_fetch__cache_hit_does_not_touch_network(self):
+        transcript = YouTubeTranscriptApi(transcript_cache=self.cache).fetch(
+            "GJLlxj_dtq8"
+        )
+        requests_made = len(httpretty.latest_requests())
+
+        cached_transcript = YouTubeTranscriptApi(transcript_cache=self.cache).fetch(
+            "GJLlxj_dtq8"
+        )
+
+        self.assertEqual(cached_transcript, transcript)
+        self.assertEqual(len(httpretty.latest_requests()), requests_made)
+
+    def test_fetch__transcript_is_stored_once(self):
+        ytt_api = YouTubeTranscriptApi(transcript_cache=self.cache)
+        transcript = ytt_api.fetch("GJLlxj_dtq8")
+
+        with sqlite3.connect(self.path) as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM transcripts").fetchone()
+        self.assertEqual(count, 1)
+        self.assertEqual(
+            self.cache.get(
+                self.cache.get_alias(
+                    json.dumps(["fetch", "GJLlxj_dtq8", ["en"], False])
+                )
+            ),
+            transcript,
+        )
+
+    def test_fetch__cache_without_aliases(self):
+        class DictTranscriptCache(TranscriptCache):
+            def __init__(self):
+                self.transcripts = {}
+
+            def get(self, key):
+                return self.transcripts.get(key)
+
+            def set(self, key, transcript):
+                self.transcripts[key] = transcript
+
+        cache = DictTranscriptCache()
+        ytt_api = YouTubeTranscriptApi(transcript_cache=cache)
+        transcript = ytt_api.fetch("GJLlxj_dtq8")
+        requests_made = len(httpretty.latest_requests())
+
+        self.assertEqual(ytt_api.fetch("GJLlxj_dtq8"), transcript)
+        self.assertEqual(len(cache.transcripts), 1)
+        # only the list has to be retrieved again, as the transcript is cached
+        self.assertEqual(len(httpretty.latest_requests()), requests_made + 1)
+
+    def test_fetch__cached_per_languages_and_formatting(self):
+        ytt_api = YouTubeTranscriptApi(transcript_cache=self.cache)
+        ytt_api.fetch("GJLlxj_dtq8")
+        requests_made = len(httpretty.latest_requests())
+
+        transcript = ytt_api.fetch("GJLlxj_dtq8", preserve_formatting=True)
+        ytt_api.fetch("GJLlxj_dtq8", languages=iter(["de", "en"]))
+
+        self.assertEqual(
+            transcript[1].text, "this is <i>not</i> the original transcript"
+        )
+        self.assertEqual(len(httpretty.latest_requests()), requests_made + 4)
+
+    def test_transcript_fetch__cache_hit_does_not_touch_network(self):
+        ytt_api = YouTubeTranscriptApi(transcript_cache=self.cache)
+        transcript = ytt_api.list("GJLlxj_dtq8").find_transcript(["en"])
+        fetched_transcript = transcript.fetch()
+        requests_made = len(httpretty.latest_requests())
+
+        self.assertEqual(transcript.fetch(), fetched_transcript)
+        self.assertEqual(len(httpretty.latest_requests()), requests_made)
+
+    def test_transcript_fetch__lazy_transcripts_are_not_cached(self):
+        ytt_api = YouTubeTranscriptApi(transcript_cache=self.cache)
+        transcript = ytt_api.list("GJLlxj_dtq8").find_transcript(["en"])
+
+        transcript.fetch(lazy=True)
+
+        self.assertIsNone(self.cache.get(transcript._cache_key(False)))
+
+    def test_transcript_fetch__time_range_is_sliced_from_cached_transcript(self):
+        ytt_api = YouTubeTranscriptApi(transcript_cache=self.cache)
+        transcript = ytt_api.list("GJLlxj_dtq8").find_transcript(["en"])
+
+        partial_transcript = transcript.fetch(start=1.0)
+        self.assertIsNone(self.cache.get(transcript._cache_key(False)))
+        fetched_transcript = transcript.fetch()
+        requests_made = len(httpretty.latest_requests())
+
+        self.assertEqual(transcript.fetch(start=1.0), partial_transcript)
+        self.assertEqual(partial_transcript, fetched_transcript.slice(1.0))
+        self.assertEqual(len(httpretty.latest_requests()), requests_made)
+
+    def test_transcript_iter_fetch__cache_hit_does_not_touch_network(self):
+        ytt_api = YouTubeTranscriptApi(transcript_cache=self.cache)
+        transcript = ytt_api.list("GJLlxj_dtq8").find_transcript(["en"])
+        fetched_transcript = transcript.fetch()
+        requests_made = len(httpretty.latest_requests())
+
+        self.assertEqual(list(transcript.iter_fetch()), fetched_transcript.snippets)
+        self.assertEqual(len(httpretty.latest_requests()), requests_made)
+
+    def test_transcript_fetch__translations_are_cached_separately(self):
+        ytt_api = YouTubeTranscriptApi(transcript_cache=self.cache)
+        transcript = ytt_api.list("GJLlxj_dtq8").find_transcript(["en"])
+        transcript.fetch()
+        requests_made = len(httpretty.latest_requests())
+
+        translated_transcript = transcript.translate("de").fetch()
+        self.assertEqual(len(httpretty.latest_requests()), requests_made + 1)
+        self.assertEqual(transcript.translate("de").fetch(), translated_transcript)
+        self.assertEqual(len(httpretty.latest_requests()), requests_made + 1)
+        self.assertEqual(translated_transcript.language_code, "de")
+
+    # the URLs of the transcripts in the innertube asset expire at this timestamp
+    URLS_EXPIRE_AT = 1749680182
+
+    def test_fetch__stored_transcript_list_is_reused(self):
+        with patch(
+            "youtube_transcript_api.caching.time",
+            return_value=self.URLS_EXPIRE_AT - 60 * 60,
+        ):
+            YouTubeTranscriptApi(
+                transcript_list_store=self.transcript_list_store
+            ).fetch("GJLlxj_dtq8")
+            requests_made = len(httpretty.latest_requests())
+
+            transcript = YouTubeTranscriptApi(
+                transcript_list_store=self.transcript_list_store
+            ).fetch("GJLlxj_dtq8", languages=["de"])
+
+        self.assertEqual(transcript.language_code, "de")
+        latest_requests = httpretty.latest_requests()[requests_made:]
+        self.assertEqual(len(latest_requests), 1)
+        self.assertEqual(latest_requests[0].path.split("?")[0], "/api/timedtext")
+
+    def test_fetch__stored_transcript_list_expires_before_its_urls(self):
+        with patch(
+            "youtube_transcript_api.caching.time",
+            return_value=self.URLS_EXPIRE_AT - 60 * 60,
+        ):
+            YouTubeTranscriptApi(
+                transcript_list_store=self.transcript_list_store
+            ).fetch("GJLlxj_dtq8")
+        requests_made = len(httpretty.latest_requests())
+
+        with patch(
+            "youtube_transcript_api.caching.time",
+            return_value=self.URLS_EXPIRE_AT - 5 * 60,
+        ):
+            YouTubeTranscriptApi(
+                transcript_list_store=self.transcript_list_store
+            ).fetch("GJLlxj_dtq8")
+
+        self.assertEqual(len(httpretty.latest_requests()), requests_made + 3)
+
+    def test_fetch__stored_transcript_list_is_invalidated_if_fetching_fails(self):
+        with patch(
+            "youtube_transcript_api.caching.time",
+            return_value=self.URLS_EXPIRE_AT - 60 * 60,
+        ):
+            YouTubeTranscriptApi(transcript_list_store=self.transcript_list_store).list(
+                "GJLlxj_dtq8"
+            )
+            httpretty.register_uri(
+                httpretty.GET, "https://www.youtube.com/api/timedtext", status=403
+            )
+
+            with self.assertRaises(YouTubeRequestFailed):
+                YouTubeTranscriptApi(
+                    transcript_list_store=self.transcript_list_store
+                ).fetch("GJLlxj_dtq8")
+
+            self.assertIsNone(self.transcript_list_store.get("GJLlxj_dtq8"))
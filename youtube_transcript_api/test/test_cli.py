@@ -3,6 +3,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock
 
 import json
+from io import StringIO
 
 from youtube_transcript_api import (
     YouTubeTranscriptApi,
@@ -54,6 +55,11 @@ class TestYouTubeTranscriptCli(TestCase):
             return_value=self.transcript_mock
         )
 
+        # restore the mocked methods, to not affect tests using the actual API
+        for name in ("__init__", "list"):
+            self.addCleanup(
+                setattr, YouTubeTranscriptApi, name, getattr(YouTubeTranscriptApi, name)
+            )
         YouTubeTranscriptApi.__init__ = MagicMock(return_value=None)
         YouTubeTranscriptApi.list = MagicMock(return_value=self.transcript_list_mock)
 
@@ -152,6 +158,14 @@ class TestYouTubeTranscriptCli(TestCase):
         self.assertEqual(parsed_args.format, "json")
         self.assertEqual(parsed_args.languages, ["en"])
 
+    def test_argument_parsing__binary_formats_are_not_supported(self):
+        for formatter_type in ("arrow", "parquet", "msgpack"):
+            with self.subTest(formatter_type=formatter_type):
+                with self.assertRaises(SystemExit):
+                    YouTubeTranscriptCli(
+                        f"v1 --format {formatter_type}".split()
+                    )._parse_args()
+
     def test_argument_parsing__languages(self):
         parsed_args = YouTubeTranscriptCli(
             "v1 v2 --languages de en".split()
@@ -293,6 +307,58 @@ class TestYouTubeTranscriptCli(TestCase):
         # will fail if output is not valid json
         json.loads(output)
 
+    def test_write(self):
+        fp = StringIO()
+        written_when_listed = []
+
+        def list_transcripts(video_id):
+            written_when_listed.append(fp.getvalue())
+            return self.transcript_list_mock
+
+        cli = YouTubeTranscriptCli("v1 v2 v3 --format jsonl".split())
+        output = cli.run()
+        YouTubeTranscriptApi.list = MagicMock(side_effect=list_transcripts)
+
+        cli.write(fp, StringIO())
+
+        self.assertEqual(fp.getvalue(), output + "\n")
+        # the output starts before the last video is retrieved
+        self.assertEqual(len(written_when_listed), 3)
+        self.assertEqual(written_when_listed[0], "")
+        self.assertNotEqual(written_when_listed[2], "")
+
+    def test_write__failing_transcripts(self):
+        YouTubeTranscriptApi.list = MagicMock(
+            side_effect=[VideoUnavailable("v1"), self.transcript_list_mock]
+        )
+        fp = StringIO()
+        error_fp = StringIO()
+
+        YouTubeTranscriptCli("v1 v2 --format json".split()).write(fp, error_fp)
+
+        self.assertEqual(error_fp.getvalue(), f"{VideoUnavailable('v1')}\n\n")
+        self.assertEqual(
+            json.loads(fp.getvalue()), [self.transcript_mock.fetch().to_raw_data()]
+        )
+
+    def test_write__list_transcripts(self):
+        cli = YouTubeTranscriptCli("--list-transcripts v1 v2".split())
+        fp = StringIO()
+
+        cli.write(fp, StringIO())
+
+        self.assertEqual(fp.getvalue(), cli.run() + "\n")
+
+    def test_write__exclude_manually_created_and_generated(self):
+        fp = StringIO()
+
+        YouTubeTranscriptCli(
+            "v1 --exclude-manually-created --exclude-generated".split()
+        ).write(fp, StringIO())
+
+        self.assertEqual(fp.getvalue(), "\n")
+        YouTubeTranscriptApi.list.assert_not_called()
+
     def test_run__webshare_proxy_config(self):
         YouTubeTranscriptCli(
             (
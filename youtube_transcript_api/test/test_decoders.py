@@ -0,0 +1,76 @@
+import json
+from unittest import TestCase
+
+from youtube_transcript_api.decoders import (
+    JSONInnertubeDecoder,
+    OrjsonInnertubeDecoder,
+    PartialInnertubeDecoder,
+    default_innertube_decoder,
+)
+
+from .test_api import load_asset
+
+INNERTUBE_ASSETS = [
+    "youtube.innertube.json.static",
+    "youtube_age_restricted.innertube.json.static",
+    "youtube_altered_user_agent.innertube.json.static",
+    "youtube_po_token_required.innertube.json.static",
+    "youtube_request_blocked.innertube.json.static",
+    "youtube_transcripts_disabled.innertube.json.static",
+    "youtube_transcripts_disabled2.innertube.json.static",
+    "youtube_unplayable.innertube.json.static",
+    "youtube_video_unavailable.innertube.json.static",
+    "youtube_ww1_nl_en.innertube.json.static",
+]
+
+
+class TestInnertubeDecoders(TestCase):
+    def assert_relevant_data_equal(self, data, expected_data):
+        self.assertEqual(
+            data.get("playabilityStatus"), expected_data.get("playabilityStatus")
+        )
+        self.assertEqual(data.get("captions"), expected_data.get("captions"))
+
+    def test_decoders_agree_on_relevant_data(self):
+        for asset in INNERTUBE_ASSETS:
+            raw_data = load_asset(asset)
+            expected_data = json.loads(raw_data)
+
+            for decoder in (
+                JSONInnertubeDecoder(),
+                OrjsonInnertubeDecoder(),
+                PartialInnertubeDecoder(),
+            ):
+                with self.subTest(asset=asset, decoder=type(decoder).__name__):
+                    self.assert_relevant_data_equal(
+                        decoder.decode(raw_data), expected_data
+                    )
+
+    def test_partial_decoder__only_decodes_relevant_subtrees(self):
+        data = PartialInnertubeDecoder().decode(
+            load_asset("youtube.innertube.json.static")
+        )
+
+        self.assertEqual(set(data.keys()), {"playabilityStatus", "captions"})
+
+    def test_partial_decoder__ignores_nested_keys(self):
+        raw_data = (
+            b'{\n  "responseContext": {\n    "captions": {}\n  },\n'
+            b'  "playabilityStatus": {\n    "status": "OK"\n  }\n}'
+        )
+
+        data = PartialInnertubeDecoder().decode(raw_data)
+
+        self.assertEqual(data, {"playabilityStatus": {"status": "OK"}})
+
+    def test_partial_decoder__falls_back_if_not_pretty_printed(self):
+        raw_data = json.dumps(
+            json.loads(load_asset("youtube.innertube.json.static"))
+        ).encode("utf-8")
+
+        data = PartialInnertubeDecoder(fallback=JSONInnertubeDecoder()).decode(raw_data)
+
+        self.assertEqual(data, json.loads(raw_data))
+
+    def test_default_innertube_decoder(self):
+        self.assertIsInstance(default_innertube_decoder(), OrjsonInnertubeDecoder)
@@ -1,14 +1,26 @@
+from dataclasses import replace
+from io import BytesIO, StringIO
 from unittest import TestCase
 
 import json
 
 import pprint
 
+import msgpack
+import pyarrow.ipc
+import pyarrow.parquet
+
 from youtube_transcript_api.formatters import (
+    ArrowFormatter,
+    BinaryFormatter,
     FetchedTranscript,
     FetchedTranscriptSnippet,
     Formatter,
     JSONFormatter,
+    JSONLinesFormatter,
+    JSONTranscriptEncoder,
+    MsgpackFormatter,
+    ParquetFormatter,
     TextFormatter,
     SRTFormatter,
     WebVTTFormatter,
@@ -16,6 +28,17 @@ from youtube_transcript_api.formatters import (
     FormatterLoader,
 )
 
+TEXT_FORMATTER_TYPES = [
+    formatter_type
+    for formatter_type in FormatterLoader.TYPES.values()
+    if not issubclass(formatter_type, BinaryFormatter)
+]
+BINARY_FORMATTER_TYPES = [
+    formatter_type
+    for formatter_type in FormatterLoader.TYPES.values()
+    if issubclass(formatter_type, BinaryFormatter)
+]
+
 
 class TestFormatters(TestCase):
     def setUp(self):
@@ -43,6 +66,8 @@ class TestFormatters(TestCase):
             Formatter().format_transcript(self.transcript)
         with self.assertRaises(NotImplementedError):
             Formatter().format_transcripts([self.transcript])
+        with self.assertRaises(NotImplementedError):
+            Formatter().write_transcripts([self.transcript], StringIO())
 
     def test_srt_formatter_starting(self):
         content = SRTFormatter().format_transcript(self.transcript)
@@ -79,6 +104,35 @@ class TestFormatters(TestCase):
             formatted_single_transcript + "\n\n\n" + formatted_single_transcript,
         )
 
+    def test_srt_formatter_timestamps(self):
+        transcript = FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(text="a", start=3661.5, duration=2.0),
+                FetchedTranscriptSnippet(text="b", start=3662.9995, duration=0.5),
+                FetchedTranscriptSnippet(text="c", start=86399.9949, duration=0.0051),
+            ],
+            language="English",
+            language_code="en",
+            is_generated=True,
+            video_id="12345",
+        )
+
+        content = SRTFormatter().format_transcript(transcript)
+
+        self.assertEqual(
+            content,
+            "1\n01:01:01,500 --> 01:01:02,999\na\n\n"
+            "2\n01:01:02,999 --> 01:01:03,499\nb\n\n"
+            "3\n23:59:59,994 --> 24:00:00,000\nc\n",
+        )
+
+    def test_srt_formatter_rounded_timestamps(self):
+        formatter = SRTFormatter()
+
+        self.assertEqual(formatter._seconds_to_timestamp(5.0009999), "00:00:05,001")
+        self.assertEqual(formatter._seconds_to_timestamp(5.00099), "00:00:05,000")
+        self.assertEqual(formatter._seconds_to_timestamp(-1.5), "-1:59:58,-500")
+
     def test_webvtt_formatter_starting(self):
         content = WebVTTFormatter().format_transcript(self.transcript)
         lines = content.split("\n")
@@ -105,6 +159,47 @@ class TestFormatters(TestCase):
             formatted_single_transcript + "\n\n\n" + formatted_single_transcript,
         )
 
+    def test_webvtt_formatter_empty(self):
+        transcript = FetchedTranscript(
+            snippets=[],
+            language="English",
+            language_code="en",
+            is_generated=True,
+            video_id="12345",
+        )
+
+        self.assertEqual(
+            WebVTTFormatter().format_transcript(transcript), "WEBVTT\n\n\n"
+        )
+
+    def test_text_based_formatter__overridden_helper(self):
+        class UppercaseSRTFormatter(SRTFormatter):
+            def _format_transcript_helper(self, i, time_text, snippet):
+                return super()._format_transcript_helper(
+                    i, time_text, replace(snippet, text=snippet.text.upper())
+                )
+
+        self.assertEqual(
+            UppercaseSRTFormatter().format_transcript(self.transcript),
+            SRTFormatter()
+            .format_transcript(self.transcript)
+            .replace("testing the end line", "TESTING THE END LINE")
+            .replace("Test line 1", "TEST LINE 1")
+            .replace("line between", "LINE BETWEEN"),
+        )
+
+        for formatter_type in (SRTFormatter, WebVTTFormatter):
+
+            class HelperFormatter(formatter_type):
+                def _format_transcript_helper(self, i, time_text, snippet):
+                    return super()._format_transcript_helper(i, time_text, snippet)
+
+            with self.subTest(formatter_type=formatter_type):
+                self.assertEqual(
+                    HelperFormatter().format_transcript(self.transcript),
+                    formatter_type().format_transcript(self.transcript),
+                )
+
     def test_pretty_print_formatter(self):
         content = PrettyPrintFormatter().format_transcript(self.transcript)
 
@@ -125,6 +220,116 @@ class TestFormatters(TestCase):
 
         self.assertEqual(json.loads(content), self.transcripts_raw)
 
+    def test_json_formatter__default_encoder(self):
+        self.assertEqual(
+            JSONFormatter().format_transcript(self.transcript),
+            JSONTranscriptEncoder().encode(self.transcript),
+        )
+        self.assertEqual(
+            JSONFormatter().format_transcripts(self.transcripts),
+            JSONTranscriptEncoder().encode_many(self.transcripts),
+        )
+
+    def test_json_formatter__kwargs_are_passed_to_json(self):
+        formatter = JSONFormatter()
+
+        self.assertEqual(
+            formatter.format_transcript(self.transcript, indent=2),
+            json.dumps(self.transcript_raw, indent=2),
+        )
+        self.assertEqual(
+            formatter.format_transcripts(self.transcripts, sort_keys=True),
+            json.dumps(self.transcripts_raw, sort_keys=True),
+        )
+
+    def test_json_transcript_encoder(self):
+        transcript = FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(text='"ünïcödé" \\ ☕', start=0.1, duration=2),
+                FetchedTranscriptSnippet(text="\n\x00\t", start=1e20, duration=-0.0),
+            ],
+            language="English",
+            language_code="en",
+            is_generated=True,
+            video_id="12345",
+        )
+        formatter = JSONFormatter(encoder=JSONTranscriptEncoder())
+
+        for transcripts in ([], [self.transcript], [transcript, self.transcript]):
+            with self.subTest(transcripts=len(transcripts)):
+                raw_data = [transcript.to_raw_data() for transcript in transcripts]
+                fp = StringIO()
+                formatter.write_transcripts(transcripts, fp)
+
+                self.assertEqual(
+                    formatter.format_transcripts(transcripts), json.dumps(raw_data)
+                )
+                self.assertEqual(fp.getvalue(), json.dumps(raw_data))
+        self.assertEqual(
+            formatter.format_transcript(transcript),
+            json.dumps(transcript.to_raw_data()),
+        )
+
+    def test_json_transcript_encoder__not_finite_floats(self):
+        transcript = FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(text="a", start=float("nan"), duration=1.0),
+                FetchedTranscriptSnippet(text="b", start=1.0, duration=float("inf")),
+            ],
+            language="English",
+            language_code="en",
+            is_generated=True,
+            video_id="12345",
+        )
+
+        self.assertEqual(
+            JSONTranscriptEncoder().encode(transcript),
+            json.dumps(transcript.to_raw_data()),
+        )
+
+    def test_json_lines_formatter(self):
+        content = JSONLinesFormatter().format_transcripts(self.transcripts)
+        lines = content.split("\n")
+
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[-1], "")
+        self.assertEqual(
+            json.loads(lines[0]),
+            {
+                "video_id": "12345",
+                "language": "English",
+                "language_code": "en",
+                "is_generated": True,
+                "snippets": self.transcript_raw,
+            },
+        )
+        self.assertEqual(lines[1], lines[0])
+
+    def test_json_lines_formatter__line_per_snippet(self):
+        content = JSONLinesFormatter(
+            line_per_snippet=True, encoder=JSONTranscriptEncoder()
+        ).format_transcript(self.transcript)
+
+        self.assertEqual(
+            content.splitlines(),
+            [
+                json.dumps({"video_id": "12345", "language_code": "en", **snippet})
+                for snippet in self.transcript_raw
+            ],
+        )
+        self.assertTrue(content.endswith("\n"))
+
+    def test_json_lines_formatter__kwargs_are_passed_to_json(self):
+        content = JSONLinesFormatter(line_per_snippet=True).format_transcript(
+            self.transcript, separators=(",", ":")
+        )
+
+        self.assertEqual(
+            content.splitlines()[0],
+            '{"video_id":"12345","language_code":"en","text":"Test line 1",'
+            '"start":0.0,"duration":1.5}',
+        )
+
     def test_text_formatter(self):
         content = TextFormatter().format_transcript(self.transcript)
         lines = content.split("\n")
@@ -142,12 +347,182 @@ class TestFormatters(TestCase):
             formatted_single_transcript + "\n\n\n" + formatted_single_transcript,
         )
 
+    def test_write_transcript(self):
+        for formatter_type in TEXT_FORMATTER_TYPES:
+            with self.subTest(formatter_type=formatter_type.__name__):
+                fp = StringIO()
+
+                formatter_type().write_transcript(self.transcript, fp)
+
+                self.assertEqual(
+                    fp.getvalue(), formatter_type().format_transcript(self.transcript)
+                )
+
+    def test_write_transcripts(self):
+        cases = [
+            (formatter_type, kwargs, transcripts)
+            for formatter_type in TEXT_FORMATTER_TYPES
+            for kwargs in ({},)
+            for transcripts in ([], [self.transcript], self.transcripts * 3)
+        ]
+        cases += [
+            (JSONFormatter, {"indent": 2}, self.transcripts),
+            (JSONFormatter, {"indent": "\t", "separators": (";", "=")}, []),
+            (JSONFormatter, {"cls": json.JSONEncoder, "indent": 0}, self.transcripts),
+            (PrettyPrintFormatter, {"width": 400}, self.transcripts),
+            (PrettyPrintFormatter, {"width": 20, "depth": 1}, self.transcripts),
+            (PrettyPrintFormatter, {"indent": 4}, self.transcripts),
+            (PrettyPrintFormatter, {"compact": True}, self.transcripts),
+        ]
+        for formatter_type, kwargs, transcripts in cases:
+            with self.subTest(
+                formatter_type=formatter_type.__name__,
+                kwargs=kwargs,
+                transcripts=len(transcripts),
+            ):
+                fp = StringIO()
+
+                formatter_type().write_transcripts(iter(transcripts), fp, **kwargs)
+
+                self.assertEqual(
+                    fp.getvalue(),
+                    formatter_type().format_transcripts(transcripts, **kwargs),
+                )
+
+    def test_write_transcripts__writes_while_iterating(self):
+        for formatter_type in TEXT_FORMATTER_TYPES:
+            with self.subTest(formatter_type=formatter_type.__name__):
+                fp = StringIO()
+                written = []
+
+                def transcripts():
+                    for transcript in self.transcripts:
+                        written.append(len(fp.getvalue()))
+                        yield transcript
+
+                formatter_type().write_transcripts(transcripts(), fp)
+
+                self.assertEqual(written[0], 0)
+                self.assertGreater(written[1], 0)
+
+    def test_binary_formatters(self):
+        german_transcript = FetchedTranscript(
+            snippets=[FetchedTranscriptSnippet(text="Hallo", start=7.0, duration=1.0)],
+            language="German",
+            language_code="de",
+            is_generated=False,
+            video_id="67890",
+        )
+        expected_table = {
+            "video_id": ["12345"] * 3 + ["67890"],
+            "language_code": ["en"] * 3 + ["de"],
+            "is_generated": [True] * 3 + [False],
+            "start": [0.0, 1.5, 2.5, 7.0],
+            "duration": [1.5, 2.0, 3.25, 1.0],
+            "text": ["Test line 1", "line between", "testing the end line", "Hallo"],
+        }
+        readers = {
+            ArrowFormatter: lambda data: (
+                pyarrow.ipc.open_file(data).read_all().to_pydict()
+            ),
+            ParquetFormatter: lambda data: (
+                pyarrow.parquet.read_table(BytesIO(data)).to_pydict()
+            ),
+            MsgpackFormatter: msgpack.unpackb,
+        }
+        self.assertEqual(set(readers), set(BINARY_FORMATTER_TYPES))
+
+        for formatter_type, read in readers.items():
+            with self.subTest(formatter_type=formatter_type.__name__):
+                formatter = formatter_type()
+
+                self.assertEqual(
+                    read(
+                        formatter.format_transcripts(
+                            [self.transcript, german_transcript]
+                        )
+                    ),
+                    expected_table,
+                )
+                self.assertEqual(
+                    read(formatter.format_transcript(german_transcript)),
+                    {column: values[3:] for column, values in expected_table.items()},
+                )
+                self.assertEqual(
+                    read(formatter.format_transcripts([])),
+                    {column: [] for column in expected_table},
+                )
+
+    def test_binary_formatters__write_transcripts(self):
+        for formatter_type in BINARY_FORMATTER_TYPES:
+            for transcripts in ([], [self.transcript], self.transcripts * 3):
+                with self.subTest(
+                    formatter_type=formatter_type.__name__,
+                    transcripts=len(transcripts),
+                ):
+                    fp = BytesIO()
+
+                    formatter_type().write_transcripts(iter(transcripts), fp)
+
+                    self.assertEqual(
+                        fp.getvalue(), formatter_type().format_transcripts(transcripts)
+                    )
+
+        for formatter_type in BINARY_FORMATTER_TYPES:
+            with self.subTest(formatter_type=formatter_type.__name__):
+                fp = BytesIO()
+
+                formatter_type().write_transcript(self.transcript, fp)
+
+                self.assertEqual(
+                    fp.getvalue(), formatter_type().format_transcript(self.transcript)
+                )
+
+    def test_binary_formatters__kwargs(self):
+        table = pyarrow.parquet.read_metadata(
+            BytesIO(
+                ParquetFormatter().format_transcript(
+                    self.transcript, compression="gzip"
+                )
+            )
+        )
+        self.assertEqual(table.row_group(0).column(0).compression, "GZIP")
+
+        single_floats = MsgpackFormatter().format_transcript(
+            self.transcript, use_single_float=True
+        )
+        self.assertEqual(msgpack.unpackb(single_floats)["duration"], [1.5, 2.0, 3.25])
+        self.assertLess(
+            len(single_floats),
+            len(MsgpackFormatter().format_transcript(self.transcript)),
+        )
+
+        options = pyarrow.ipc.IpcWriteOptions(compression="zstd")
+        self.assertEqual(
+            pyarrow.ipc.open_file(
+                ArrowFormatter().format_transcript(self.transcript, options=options)
+            )
+            .read_all()
+            .to_pydict(),
+            pyarrow.ipc.open_file(ArrowFormatter().format_transcript(self.transcript))
+            .read_all()
+            .to_pydict(),
+        )
+
     def test_formatter_loader(self):
         loader = FormatterLoader()
         formatter = loader.load("json")
 
         self.assertTrue(isinstance(formatter, JSONFormatter))
 
+    def test_formatter_loader__json_lines(self):
+        self.assertIsInstance(FormatterLoader().load("jsonl"), JSONLinesFormatter)
+
+    def test_formatter_loader__binary_formats(self):
+        self.assertIsInstance(FormatterLoader().load("arrow"), ArrowFormatter)
+        self.assertIsInstance(FormatterLoader().load("parquet"), ParquetFormatter)
+        self.assertIsInstance(FormatterLoader().load("msgpack"), MsgpackFormatter)
+
     def test_formatter_loader__default_formatter(self):
         loader = FormatterLoader()
         formatter = loader.load()
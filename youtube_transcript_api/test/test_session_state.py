@@ -0,0 +1,33 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from youtube_transcript_api.session_state import FileSessionStateStore
+
+
+class TestFileSessionStateStore(TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+
+    def test_load__nothing_saved(self):
+        self.assertIsNone(FileSessionStateStore(self.temp_dir / "session.json").load())
+
+    def test_save_and_load(self):
+        state = {"cookies": [{"name": "CONSENT", "value": "YES+ünïcödé"}]}
+        FileSessionStateStore(self.temp_dir / "session.json").save(state)
+
+        self.assertEqual(
+            FileSessionStateStore(str(self.temp_dir / "session.json")).load(), state
+        )
+
+    def test_save__replaces_state(self):
+        store = FileSessionStateStore(self.temp_dir / "session.json")
+
+        store.save({"cookies": [{"name": "CONSENT"}]})
+        store.save({"cookies": []})
+
+        self.assertEqual(store.load(), {"cookies": []})
+        self.assertEqual(os.listdir(self.temp_dir), ["session.json"])
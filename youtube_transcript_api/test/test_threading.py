@@ -0,0 +1,229 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Dict
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests import ConnectionError, Session
+from requests.adapters import HTTPAdapter
+
+from youtube_transcript_api import (
+    YouTubeTranscriptApi,
+    FetchedTranscript,
+    TranscriptList,
+    VideoUnavailable,
+)
+
+from .test_api import load_asset
+
+
+class _StubYouTubeServer(ThreadingHTTPServer):
+    """
+    A local HTTP server serving the static assets for the endpoints requested by
+    `YouTubeTranscriptApi`. Requests without a consent cookie are served the consent
+    page instead of the watch page.
+    """
+
+    daemon_threads = True
+    # all threads of the tests connect at once, which overflows the default backlog
+    request_queue_size = 128
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubYouTubeRequestHandler)
+        self.assets = {
+            "/watch": load_asset("youtube.html.static"),
+            "/consent": load_asset("youtube_consent_page.html.static"),
+            "/youtubei/v1/player": load_asset("youtube.innertube.json.static"),
+            "/youtubei/v1/player#unavailable": load_asset(
+                "youtube_video_unavailable.innertube.json.static"
+            ),
+            "/api/timedtext": load_asset("transcript.xml.static"),
+        }
+        self.lock = Lock()
+        self.served: Dict[str, int] = {path: 0 for path in self.assets}
+
+    @property
+    def base_url(self) -> str:
+        return "http://{}:{}".format(*self.server_address)
+
+    def handle_error(self, request, client_address) -> None:
+        # clients close the connection early, once they have found the API key
+        pass
+
+
+class _StubYouTubeRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/watch" and "CONSENT=" not in self.headers.get("Cookie", ""):
+            path = "/consent"
+        self._respond(path)
+
+    def do_POST(self):
+        path = self.path.split("?")[0]
+        data = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if data["videoId"].startswith("unavailable"):
+            path += "#unavailable"
+        self._respond(path)
+
+    def _respond(self, path: str) -> None:
+        body = self.server.assets[path]
+        with self.server.lock:
+            self.server.served[path] += 1
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _RedirectToStubAdapter(HTTPAdapter):
+    def __init__(self, base_url: str):
+        super().__init__()
+        self._base_url = base_url
+
+    def send(self, request, **kwargs):
+        request.url = request.url.replace("https://www.youtube.com", self._base_url)
+        return super().send(request, **kwargs)
+
+
+class TestYouTubeTranscriptApiThreadSafety(TestCase):
+    THREADS = 16
+    FETCHES_PER_THREAD = 10
+
+    def setUp(self):
+        self.server = _StubYouTubeServer()
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.sessions_lock = Lock()
+        self.sessions_created = 0
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def create_session(self) -> Session:
+        with self.sessions_lock:
+            self.sessions_created += 1
+        session = Session()
+        session.mount("https://", _RedirectToStubAdapter(self.server.base_url))
+        return session
+
+    def test_fetch__shared_instance_from_many_threads(self):
+        ytt_api = YouTubeTranscriptApi(
+            http_client_factory=self.create_session, innertube_api_key_ttl=0
+        )
+        reference_transcript = ytt_api.fetch("GJLlxj_dtq8")
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            transcripts = list(
+                executor.map(
+                    lambda _: ytt_api.fetch("GJLlxj_dtq8"),
+                    range(self.THREADS * self.FETCHES_PER_THREAD),
+                )
+            )
+
+        for transcript in transcripts:
+            self.assertEqual(transcript, reference_transcript)
+        self.assertLessEqual(self.sessions_created, self.THREADS + 1)
+        # the consent cookie created by the first thread is shared with all others
+        self.assertEqual(self.server.served["/consent"], 1)
+        self.assertEqual(
+            self.server.served["/watch"], self.THREADS * self.FETCHES_PER_THREAD + 1
+        )
+
+    def test_list__transcripts_can_be_fetched_from_other_threads(self):
+        ytt_api = YouTubeTranscriptApi(http_client_factory=self.create_session)
+        transcripts = list(ytt_api.list("GJLlxj_dtq8"))
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            fetched_transcripts = list(
+                executor.map(lambda transcript: transcript.fetch(), transcripts * 20)
+            )
+
+        self.assertEqual(len(fetched_transcripts), len(transcripts) * 20)
+        self.assertEqual(self.server.served["/api/timedtext"], len(fetched_transcripts))
+
+    def test_fetch_many(self):
+        ytt_api = YouTubeTranscriptApi(http_client_factory=self.create_session)
+        video_ids = [f"video{i}" for i in range(40)] + ["unavailable1", "unavailable2"]
+
+        results = dict(ytt_api.fetch_many(video_ids, max_workers=self.THREADS))
+
+        self.assertEqual(set(results.keys()), set(video_ids))
+        for video_id in video_ids:
+            if video_id.startswith("unavailable"):
+                self.assertIsInstance(results[video_id], VideoUnavailable)
+            else:
+                self.assertIsInstance(results[video_id], FetchedTranscript)
+                self.assertEqual(results[video_id].video_id, video_id)
+        self.assertLessEqual(self.sessions_created, self.THREADS)
+
+    def test_list_many(self):
+        ytt_api = YouTubeTranscriptApi(http_client_factory=self.create_session)
+
+        results = dict(ytt_api.list_many(["video1", "unavailable"], max_workers=2))
+
+        self.assertIsInstance(results["video1"], TranscriptList)
+        self.assertIsInstance(results["unavailable"], VideoUnavailable)
+
+
+class TestFetchMany(TestCase):
+    def setUp(self):
+        self.fetched_video_ids = []
+
+        def fetch(ytt_api, video_id, languages, preserve_formatting):
+            self.fetched_video_ids.append(video_id)
+            time.sleep(0.3 if video_id == "slow" else 0.01)
+            if video_id == "unavailable":
+                raise VideoUnavailable(video_id)
+            if video_id == "offline":
+                raise ConnectionError(video_id)
+            if video_id == "malformed":
+                raise AttributeError(video_id)
+            return video_id
+
+        fetch_patcher = patch.object(YouTubeTranscriptApi, "fetch", fetch)
+        fetch_patcher.start()
+        self.addCleanup(fetch_patcher.stop)
+
+    def test_fetch_many__results_in_completion_order(self):
+        results = list(
+            YouTubeTranscriptApi().fetch_many(["slow", "a", "b", "c"], max_workers=4)
+        )
+
+        self.assertEqual(results[-1], ("slow", "slow"))
+        self.assertEqual(set(results[:-1]), {("a", "a"), ("b", "b"), ("c", "c")})
+
+    def test_fetch_many__consumes_video_ids_lazily(self):
+        video_ids = (f"video{i}" for i in count())
+
+        results = list(
+            islice(YouTubeTranscriptApi().fetch_many(video_ids, max_workers=4), 10)
+        )
+
+        self.assertEqual(len(results), 10)
+        self.assertLessEqual(len(self.fetched_video_ids), 10 + 4)
+
+    def test_fetch_many__could_not_retrieve_transcript(self):
+        results = dict(YouTubeTranscriptApi().fetch_many(["a", "unavailable"]))
+
+        self.assertEqual(results["a"], "a")
+        self.assertIsInstance(results["unavailable"], VideoUnavailable)
+
+    def test_fetch_many__other_exceptions_are_yielded(self):
+        results = dict(
+            YouTubeTranscriptApi().fetch_many(["a", "offline", "malformed", "b"])
+        )
+
+        self.assertEqual(results["a"], "a")
+        self.assertEqual(results["b"], "b")
+        self.assertIsInstance(results["offline"], ConnectionError)
+        # raised for responses which lack fields, like `playabilityStatus`
+        self.assertIsInstance(results["malformed"], AttributeError)
@@ -0,0 +1,668 @@
+import json
+import pickle
+import random
+import re
+import time
+import tracemalloc
+from dataclasses import asdict, replace
+from html import unescape
+from unittest import TestCase
+from unittest.mock import patch
+
+from defusedxml import EntitiesForbidden, ElementTree
+from requests import Session
+
+from youtube_transcript_api import (
+    FetchedTranscript,
+    FetchedTranscriptSnippet,
+    Transcript,
+    TranscriptList,
+)
+from youtube_transcript_api._transcripts import (
+    _HTMLTagStripper,
+    _JSON3TranscriptParser,
+    _LazySnippetColumns,
+    _SnippetColumns,
+    _TranscriptParser,
+    _WatchPageScanner,
+)
+
+from .test_api import load_asset
+
+
+class TestWatchPageScanner(TestCase):
+    def _scan(self, html: str, chunk_size: int) -> _WatchPageScanner:
+        watch_page = _WatchPageScanner()
+        for i in range(0, len(html), chunk_size):
+            watch_page.feed(html[i : i + chunk_size])
+            if watch_page.is_complete:
+                break
+        return watch_page
+
+    def test_feed__api_key_spanning_chunks(self):
+        html = "x" * 100 + '"INNERTUBE_API_KEY": "AIzaSy_test-KEY"' + "y" * 100
+
+        for chunk_size in (1, 7, 50, 120, 1000):
+            watch_page = self._scan(html, chunk_size)
+
+            self.assertEqual(watch_page.api_key, "AIzaSy_test-KEY")
+            self.assertTrue(watch_page.is_complete)
+
+    def test_feed__escaped_html_spanning_chunks(self):
+        html = "<p>&quot;INNERTUBE_API_KEY&quot;:&quot;AIzaSy_test-KEY&quot;</p>"
+
+        for chunk_size in (1, 3, 17):
+            self.assertEqual(self._scan(html, chunk_size).api_key, "AIzaSy_test-KEY")
+
+    def test_feed__consent_form(self):
+        html = (
+            '<form action="https://consent.youtube.com/s" method="POST">'
+            '<input type="hidden" name="v" value="cb.20210328-17-p0.de+FX+119">'
+            "</form>"
+        )
+
+        watch_page = self._scan(html, 5)
+
+        self.assertTrue(watch_page.has_consent_form)
+        self.assertEqual(watch_page.consent_value, "cb.20210328-17-p0.de+FX+119")
+        self.assertIsNone(watch_page.api_key)
+        self.assertFalse(watch_page.is_complete)
+
+    def test_feed__recaptcha(self):
+        watch_page = self._scan('<div class="g-recaptcha"></div>', 4)
+
+        self.assertTrue(watch_page.has_recaptcha)
+        self.assertFalse(watch_page.has_consent_form)
+
+
+class TestTranscriptListSerialization(TestCase):
+    def setUp(self):
+        captions_json = json.loads(load_asset("youtube.innertube.json.static"))[
+            "captions"
+        ]["playerCaptionsTracklistRenderer"]
+        self.http_client = Session()
+        self.transcript_list = TranscriptList.build(
+            self.http_client, "GJLlxj_dtq8", captions_json
+        )
+
+    def assert_transcripts_equal(self, transcript, expected_transcript):
+        self.assertEqual(transcript.video_id, expected_transcript.video_id)
+        self.assertEqual(transcript._url, expected_transcript._url)
+        self.assertEqual(transcript.language, expected_transcript.language)
+        self.assertEqual(transcript.language_code, expected_transcript.language_code)
+        self.assertEqual(transcript.is_generated, expected_transcript.is_generated)
+        self.assertEqual(
+            transcript.translation_languages, expected_transcript.translation_languages
+        )
+
+    def test_transcript_list__round_trip(self):
+        data = json.loads(json.dumps(self.transcript_list.to_dict()))
+
+        transcript_list = TranscriptList.from_dict(self.http_client, data)
+
+        self.assertEqual(str(transcript_list), str(self.transcript_list))
+        self.assertEqual(len(list(transcript_list)), len(list(self.transcript_list)))
+        for transcript, expected_transcript in zip(
+            transcript_list, self.transcript_list
+        ):
+            self.assert_transcripts_equal(transcript, expected_transcript)
+            self.assertIs(transcript._http_client, self.http_client)
+
+    def test_transcript__round_trip(self):
+        expected_transcript = self.transcript_list.find_transcript(["en"])
+        data = json.loads(json.dumps(expected_transcript.to_dict()))
+
+        transcript = Transcript.from_dict(self.http_client, data)
+
+        self.assert_transcripts_equal(transcript, expected_transcript)
+        self.assertEqual(
+            transcript._cache_key(False), expected_transcript._cache_key(False)
+        )
+
+    def test_transcript__round_trip_translated(self):
+        expected_transcript = self.transcript_list.find_transcript(["en"]).translate(
+            "de"
+        )
+        data = json.loads(json.dumps(expected_transcript.to_dict()))
+
+        transcript = Transcript.from_dict(self.http_client, data)
+
+        self.assert_transcripts_equal(transcript, expected_transcript)
+        self.assertEqual(
+            transcript._cache_key(True), expected_transcript._cache_key(True)
+        )
+
+    def test_expires_at(self):
+        self.assertEqual(self.transcript_list._expires_at(), 1749680182)
+        self.assertIsNone(
+            TranscriptList.from_dict(
+                self.http_client,
+                {
+                    "video_id": "GJLlxj_dtq8",
+                    "translation_languages": [],
+                    "transcripts": [],
+                },
+            )._expires_at()
+        )
+
+
+class TestJSON3TranscriptParser(TestCase):
+    # transcript.json3.static has been written by hand to mirror transcript.xml.static,
+    # so this only checks that both parsers agree on the structures used there. It is
+    # no replacement for a pair of responses captured from the same real video.
+    def test_parse__same_snippets_as_xml(self):
+        for preserve_formatting in (False, True):
+            self.assertEqual(
+                _JSON3TranscriptParser(preserve_formatting).parse(
+                    load_asset("transcript.json3.static")
+                ),
+                _TranscriptParser(preserve_formatting).parse(
+                    load_asset("transcript.xml.static")
+                ),
+            )
+
+    def test_parse__pens(self):
+        raw_data = json.dumps(
+            {
+                "pens": [{}, {"bAttr": 1}, {"iAttr": 1, "bAttr": 1}, {"uAttr": 1}],
+                "events": [
+                    {
+                        "tStartMs": 0,
+                        "dDurationMs": 1000,
+                        "segs": [
+                            {"utf8": "bold", "pPenId": 1},
+                            {"utf8": " both", "pPenId": 2},
+                            {"utf8": " underlined", "pPenId": 3},
+                            {"utf8": " unknown", "pPenId": 4},
+                            {"pPenId": 1},
+                        ],
+                    }
+                ],
+            }
+        )
+
+        self.assertEqual(
+            _JSON3TranscriptParser(preserve_formatting=True).parse(raw_data)[0].text,
+            "<b>bold</b><b><i> both</i></b> underlined unknown",
+        )
+        self.assertEqual(
+            _JSON3TranscriptParser().parse(raw_data)[0].text,
+            "bold both underlined unknown",
+        )
+
+    def test_parse__without_events(self):
+        self.assertEqual(_JSON3TranscriptParser().parse(b"{}"), [])
+
+
+class TestTranscriptParserStream(TestCase):
+    def test_feed__yields_snippets_once_completed(self):
+        raw_data = load_asset("transcript.xml.static")
+        stream = _TranscriptParser().stream()
+
+        snippets_per_byte = [
+            stream.feed(raw_data[i : i + 1]) for i in range(len(raw_data))
+        ]
+        snippets = [snippet for snippets in snippets_per_byte for snippet in snippets]
+
+        self.assertEqual(stream.close(), [])
+        self.assertEqual(snippets, _TranscriptParser().parse(raw_data))
+        self.assertEqual(len(snippets_per_byte[raw_data.index(b"</text>") + 6]), 1)
+
+    def test_parse__same_text_as_element_tree(self):
+        raw_data = (
+            "<transcript>"
+            '<text start="1">a<br/>b</text>'
+            '<text start="2"><br/>c</text>'
+            '<text start="3" dur="1"> </text>'
+            "</transcript>"
+        )
+
+        self.assertEqual(
+            [snippet.text for snippet in _TranscriptParser().parse(raw_data)],
+            [
+                element.text
+                for element in ElementTree.fromstring(raw_data)
+                if element.text is not None
+            ],
+        )
+
+    def test_parse__entities_are_forbidden(self):
+        raw_data = (
+            '<!DOCTYPE transcript [<!ENTITY lol "lol">]>'
+            '<transcript><text start="0">&lol;</text></transcript>'
+        )
+
+        with self.assertRaises(EntitiesForbidden):
+            _TranscriptParser().parse(raw_data)
+
+    def test_json3_stream__parses_once_closed(self):
+        raw_data = load_asset("transcript.json3.static")
+        stream = _JSON3TranscriptParser().stream()
+
+        self.assertEqual(stream.feed(raw_data[:100]), [])
+        self.assertEqual(stream.feed(raw_data[100:].decode()), [])
+        self.assertEqual(stream.close(), _JSON3TranscriptParser().parse(raw_data))
+
+
+class TestTranscriptParserTimeRange(TestCase):
+    def test_parse__only_snippets_in_time_range(self):
+        for parser_type, asset in (
+            (_TranscriptParser, "transcript.xml.static"),
+            (_JSON3TranscriptParser, "transcript.json3.static"),
+        ):
+            with self.subTest(parser_type=parser_type.__name__):
+                snippets = parser_type(start=1.54, end=5.7).parse(load_asset(asset))
+
+                self.assertEqual(
+                    snippets,
+                    [
+                        FetchedTranscriptSnippet(
+                            text="this is not the original transcript",
+                            start=1.54,
+                            duration=4.16,
+                        )
+                    ],
+                )
+
+    def test_parse__open_time_ranges(self):
+        raw_data = load_asset("transcript.xml.static")
+        snippets = _TranscriptParser().parse(raw_data)
+
+        self.assertEqual(_TranscriptParser(start=1.6).parse(raw_data), snippets[2:])
+        self.assertEqual(_TranscriptParser(end=1.6).parse(raw_data), snippets[:2])
+
+    def test_parse__stops_after_end(self):
+        elements = "".join(
+            f'<text start="{i}" dur="1">snippet {i}</text>' for i in range(10_000)
+        )
+        # the end of the document is broken, which is only noticed if it is parsed
+        raw_data = f"<transcript>{elements}<text start=".encode()
+
+        snippets = _TranscriptParser(start=10, end=12).parse(raw_data)
+
+        self.assertEqual(
+            [snippet.text for snippet in snippets], ["snippet 10", "snippet 11"]
+        )
+        with self.assertRaises(ElementTree.ParseError):
+            _TranscriptParser(start=10).parse(raw_data)
+
+
+class TestTranscriptParserTextCleaning(TestCase):
+    # the regexes each text used to be cleaned with individually
+    HTML_REGEXES = {
+        False: re.compile(r"<[^>]*>", re.IGNORECASE),
+        True: re.compile(
+            r"<\/?(?!\/?(strong|em|b|i|mark|small|del|ins|sub|sup)\b).*?\b>",
+            re.IGNORECASE,
+        ),
+    }
+
+    def assert_cleaned_like_each_text(self, texts, preserve_formatting):
+        html_regex = self.HTML_REGEXES[preserve_formatting]
+
+        self.assertEqual(
+            _TranscriptParser(preserve_formatting)._clean_texts(texts),
+            [html_regex.sub("", unescape(text)) for text in texts],
+        )
+
+    def test_clean_texts__same_as_cleaning_each_text(self):
+        rng = random.Random(0)
+        alphabet = ["<", ">", "/", "&", ";", "#", "x", "amp", "lt", "b", "i", "em"]
+        alphabet += ["39", "a", " ", "\n", "<i>", "</b>", "&#39;", "&lt;", "&amp"]
+        for _ in range(200):
+            texts = [
+                "".join(rng.choices(alphabet, k=rng.randint(0, 12)))
+                for _ in range(rng.randint(1, 8))
+            ]
+            for preserve_formatting in (False, True):
+                self.assert_cleaned_like_each_text(texts, preserve_formatting)
+
+    def test_clean_texts__tags_and_entities_spanning_texts(self):
+        texts = ["a <b", "c> d", "&am", "p; &lt", "i>", "<font color", '"red">x']
+
+        for preserve_formatting in (False, True):
+            self.assert_cleaned_like_each_text(texts, preserve_formatting)
+
+    def test_clean_texts__without_tags_or_entities(self):
+        texts = ["just text", "", "more text"]
+
+        self.assertEqual(_TranscriptParser()._clean_texts(texts), texts)
+        self.assertEqual(_TranscriptParser()._clean_texts([]), [])
+
+    def test_clean_texts__separator_in_text(self):
+        self.assertEqual(
+            _TranscriptParser()._clean_texts(["a\x00<b>", "&lt;c>"]), ["a\x00", ""]
+        )
+
+
+class TestHTMLTagStripper(TestCase):
+    def create_stripper(self, preserve_formatting: bool) -> _HTMLTagStripper:
+        return _HTMLTagStripper(
+            _TranscriptParser._FORMATTING_TAGS if preserve_formatting else ()
+        )
+
+    def test_strip__same_as_regex(self):
+        rng = random.Random(0)
+        alphabet = ["<", ">", ">>", "/", "//", "\n", "b", "I", "em", "STRONG", "é"]
+        alphabet += ["_", "1", " ", "<b>", "</i>", "<//b>", "<strongest>", "-"]
+        for _ in range(500):
+            text = "".join(rng.choices(alphabet, k=rng.randint(0, 20)))
+            for preserve_formatting in (False, True):
+                stripper = self.create_stripper(preserve_formatting)
+                html_regex = TestTranscriptParserTextCleaning.HTML_REGEXES[
+                    preserve_formatting
+                ]
+
+                self.assertEqual(stripper.strip(text), html_regex.sub("", text))
+                if preserve_formatting:
+                    self.assertEqual(
+                        stripper._strip_tokenized(text), html_regex.sub("", text)
+                    )
+
+    def test_strip__linear_time_for_stray_brackets(self):
+        # each of these takes several seconds up to minutes with the preserve-formatting
+        # regex, which rescans the line for each `<` which isn't closed
+        texts = [
+            "<" * 50_000,
+            "<a " * 50_000,
+            "< b" * 50_000,
+            "</" * 50_000,
+            "<strong " * 50_000,
+            "<x" + "<b>" * 50_000,
+            "a<" * 50_000 + ">",
+        ]
+        stripper = self.create_stripper(preserve_formatting=True)
+        for text in texts:
+            started_at = time.perf_counter()
+
+            stripper.strip(text)
+
+            self.assertLess(time.perf_counter() - started_at, 1)
+
+
+class TestFetchedTranscript(TestCase):
+    def setUp(self):
+        self.snippets = [
+            FetchedTranscriptSnippet(
+                text="Hey, this is just a test", start=0.0, duration=1.5
+            ),
+            FetchedTranscriptSnippet(text="", start=1.5, duration=0.5),
+            FetchedTranscriptSnippet(text="ünïcödé ☕", start=2.0, duration=3.0),
+        ]
+        # fetched transcripts hold their snippets in columns
+        self.transcript = self.create_transcript(
+            _SnippetColumns.from_snippets(self.snippets)
+        )
+
+    def create_transcript(self, snippets) -> FetchedTranscript:
+        return FetchedTranscript(
+            snippets=snippets,
+            video_id="GJLlxj_dtq8",
+            language="English",
+            language_code="en",
+            is_generated=False,
+        )
+
+    def test_sequence(self):
+        self.assertEqual(len(self.transcript), 3)
+        self.assertEqual(list(self.transcript), self.snippets)
+        self.assertEqual(self.transcript[2], self.snippets[2])
+        self.assertEqual(self.transcript[-3], self.snippets[0])
+        self.assertEqual(self.transcript.snippets[1:], self.snippets[1:])
+        self.assertEqual(self.transcript[2].text, "ünïcödé ☕")
+        with self.assertRaises(IndexError):
+            self.transcript[3]
+        with self.assertRaises(IndexError):
+            self.transcript[-4]
+
+    def test_equality(self):
+        other_transcript = self.create_transcript(list(self.transcript))
+
+        self.assertEqual(self.transcript, other_transcript)
+        self.assertEqual(self.transcript.snippets, self.snippets)
+        self.assertEqual(self.snippets, self.transcript.snippets)
+        self.assertEqual(self.transcript[0], self.snippets[0])
+        self.assertEqual(self.snippets[0], self.transcript[0])
+        self.assertNotEqual(self.transcript.snippets, self.snippets[:2])
+        self.assertNotEqual(self.transcript.snippets, "snippets")
+        self.assertNotEqual(self.transcript[0], "snippet")
+        self.assertNotEqual(
+            self.transcript, self.create_transcript(self.snippets[::-1])
+        )
+        self.assertNotEqual(self.transcript, "transcript")
+
+    def test_columns(self):
+        columns = _SnippetColumns.from_snippets(self.snippets)
+
+        self.assertEqual(list(columns), self.snippets)
+        self.assertEqual(columns[-1], self.snippets[2])
+        self.assertEqual(columns[:2], self.snippets[:2])
+        self.assertEqual(columns, _SnippetColumns.from_rows(columns.rows()))
+        self.assertNotEqual(columns, "snippets")
+        with self.assertRaises(IndexError):
+            columns[3]
+
+    def test_changing_snippets_changes_transcript(self):
+        other_transcript = self.create_transcript(self.snippets)
+
+        self.transcript.snippets[0].text = "changed"
+        self.transcript.snippets[1].start = 1.25
+        self.transcript.snippets[-1].duration = 2.5
+
+        self.assertEqual(self.transcript[0].text, "changed")
+        self.assertEqual(self.transcript[1].text, "")
+        self.assertEqual(self.transcript[1].start, 1.25)
+        self.assertEqual(self.transcript[2].duration, 2.5)
+        self.assertNotEqual(self.transcript, other_transcript)
+        other_transcript[0].text = "changed"
+        other_transcript[1].start = 1.25
+        other_transcript[2].duration = 2.5
+        self.assertEqual(self.transcript, other_transcript)
+
+    def test_indexing_and_iterating_keeps_columns(self):
+        self.transcript[0].text = "changed"
+        for snippet in self.transcript:
+            snippet.start = -1.0
+
+        self.assertEqual(list(self.transcript), self.snippets)
+        self.assertEqual(self.transcript[1:], self.snippets[1:])
+        self.assertEqual(self.transcript.snippet_at(2.0), self.snippets[2])
+        self.assertEqual(self.transcript.slice(1.0).snippets, self.snippets[1:])
+        self.assertIsNone(self.transcript._snippet_list)
+
+    def test_assigned_list_is_kept(self):
+        snippets = list(self.snippets)
+        transcript = self.create_transcript(snippets)
+
+        self.assertIs(transcript.snippets, snippets)
+        self.assertIs(transcript[0], snippets[0])
+        self.assertIs(transcript.snippet_at(2.0), snippets[2])
+
+    def test_changing_snippet_list_changes_transcript(self):
+        self.transcript.snippets.append(
+            FetchedTranscriptSnippet(text="appended", start=5.0, duration=1.0)
+        )
+        del self.transcript.snippets[0]
+
+        self.assertEqual(len(self.transcript), 3)
+        self.assertEqual(self.transcript[-1].text, "appended")
+        self.assertEqual(self.transcript.to_raw_data()[0]["start"], 1.5)
+        self.assertEqual(self.transcript.snippet_at(5.5).text, "appended")
+
+    def test_assigning_snippets(self):
+        snippets = [FetchedTranscriptSnippet(text="assigned", start=1, duration=2)]
+        for assigned_snippets in (snippets, tuple(snippets), self.transcript.snippets):
+            with self.subTest(type=type(assigned_snippets).__name__):
+                transcript = self.create_transcript(self.snippets)
+
+                transcript.snippets = assigned_snippets
+
+                self.assertEqual(transcript.snippets, list(assigned_snippets))
+                self.assertEqual(
+                    transcript.to_raw_data(),
+                    [asdict(snippet) for snippet in assigned_snippets],
+                )
+                self.assertEqual(
+                    transcript.slice(0.0).snippets, list(assigned_snippets)
+                )
+                self.assertEqual(transcript.snippet_at(1.0), assigned_snippets[0])
+
+    def test_numbers_are_kept(self):
+        transcript = self.create_transcript(
+            [FetchedTranscriptSnippet(text="int", start=1, duration=2)]
+        )
+
+        self.assertIs(type(transcript[0].start), int)
+        self.assertEqual(
+            transcript.to_raw_data(), [{"text": "int", "start": 1, "duration": 2}]
+        )
+
+    def test_snippets_are_dataclasses(self):
+        self.assertIs(type(self.transcript[0]), FetchedTranscriptSnippet)
+        self.assertEqual(
+            replace(self.transcript[0], text="replaced"),
+            FetchedTranscriptSnippet(text="replaced", start=0.0, duration=1.5),
+        )
+        self.assertEqual(
+            asdict(self.transcript),
+            {
+                "snippets": self.transcript.to_raw_data(),
+                "video_id": "GJLlxj_dtq8",
+                "language": "English",
+                "language_code": "en",
+                "is_generated": False,
+            },
+        )
+        self.assertEqual(
+            replace(self.transcript, video_id="other").snippets, self.snippets
+        )
+
+    def test_repr(self):
+        self.assertEqual(repr(self.transcript.snippets), repr(self.snippets))
+
+    def test_to_raw_data(self):
+        self.assertEqual(
+            self.transcript.to_raw_data()[2],
+            {"text": "ünïcödé ☕", "start": 2.0, "duration": 3.0},
+        )
+
+    def test_from_raw_data(self):
+        transcript = FetchedTranscript.from_raw_data(
+            self.transcript.to_raw_data(),
+            video_id="GJLlxj_dtq8",
+            language="English",
+            language_code="en",
+            is_generated=False,
+        )
+
+        self.assertEqual(transcript, self.transcript)
+        self.assertEqual(
+            len(
+                FetchedTranscript.from_raw_data(
+                    [], "GJLlxj_dtq8", "English", "en", False
+                )
+            ),
+            0,
+        )
+
+    def test_to_raw_data__with_changed_text(self):
+        self.transcript.snippets[1].text = "changed"
+
+        self.assertEqual(
+            [snippet["text"] for snippet in self.transcript.to_raw_data()],
+            ["Hey, this is just a test", "changed", "ünïcödé ☕"],
+        )
+
+    def test_snippets_are_slotted(self):
+        self.assertFalse(hasattr(self.snippets[0], "__dict__"))
+        self.assertFalse(hasattr(self.transcript[0], "__dict__"))
+
+    def test_slice(self):
+        for transcript in (self.transcript, self.create_transcript(self.snippets)):
+            with self.subTest(snippets=type(transcript._sequence()).__name__):
+                self.assertEqual(
+                    transcript.slice(1.5, 2.0).snippets, self.snippets[1:2]
+                )
+                self.assertEqual(transcript.slice(end=1.5).snippets, self.snippets[:1])
+                self.assertEqual(transcript.slice(), transcript)
+                self.assertEqual(transcript.slice(2.0, 1.0).snippets, [])
+                self.assertEqual(transcript.slice(4.0).video_id, "GJLlxj_dtq8")
+                transcript.snippets[2].text = "replaced"
+                self.assertEqual(transcript.slice(1.0).snippets[1].text, "replaced")
+
+    def test_snippet_at(self):
+        for transcript in (self.transcript, self.create_transcript(self.snippets)):
+            with self.subTest(snippets=type(transcript._sequence()).__name__):
+                self.assertEqual(transcript.snippet_at(0.0), self.snippets[0])
+                self.assertEqual(transcript.snippet_at(1.49), self.snippets[0])
+                self.assertEqual(transcript.snippet_at(1.5), self.snippets[1])
+                self.assertEqual(transcript.snippet_at(4.99), self.snippets[2])
+                self.assertIsNone(transcript.snippet_at(-1.0))
+                self.assertIsNone(transcript.snippet_at(5.0))
+
+    def test_slice_and_snippet_at__columns_are_not_rebuilt(self):
+        self.transcript.snippets
+        with patch.object(
+            _SnippetColumns,
+            "from_snippets",
+            wraps=_SnippetColumns.from_snippets,
+        ) as from_snippets:
+            for _ in range(3):
+                self.transcript.snippet_at(2.0)
+                self.transcript.slice(1.5, 2.0)
+
+        # only the snippets of each slice are turned into columns
+        self.assertEqual(
+            [call.args[0] for call in from_snippets.call_args_list],
+            [self.snippets[1:2]] * 3,
+        )
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.transcript)), self.transcript)
+
+    def test_lazy_snippets(self):
+        payload = load_asset("transcript.xml.static")
+        transcript = self.create_transcript(
+            _LazySnippetColumns(payload, _TranscriptParser())
+        )
+
+        self.assertEqual(transcript.payload, payload)
+        self.assertEqual(transcript.snippets, _TranscriptParser().parse(payload))
+        self.assertEqual(transcript.payload, payload)
+        with self.assertRaises(AttributeError):
+            transcript.snippets.missing
+
+    def test_lazy_snippets__pickle(self):
+        transcript = self.create_transcript(
+            _LazySnippetColumns(
+                load_asset("transcript.xml.static"), _TranscriptParser()
+            )
+        )
+
+        unpickled_transcript = pickle.loads(pickle.dumps(transcript))
+
+        self.assertEqual(unpickled_transcript, transcript)
+        self.assertEqual(unpickled_transcript.payload, transcript.payload)
+
+    def test_memory_is_a_fraction_of_a_list_of_snippets(self):
+        def create_snippets():
+            return [
+                FetchedTranscriptSnippet(
+                    text=f"this is snippet number {i}", start=i * 2.0, duration=1.9
+                )
+                for i in range(10_000)
+            ]
+
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        snippets = create_snippets()
+        list_size = tracemalloc.get_traced_memory()[0]
+        del snippets
+        tracemalloc.clear_traces()
+        transcript = self.create_transcript(
+            _SnippetColumns.from_snippets(create_snippets())
+        )
+        columns_size = tracemalloc.get_traced_memory()[0]
+
+        self.assertEqual(len(transcript), 10_000)
+        self.assertLess(columns_size * 3, list_size)